@@ -0,0 +1,37 @@
+"""add indexes for task query paths
+
+Revision ID: a1c4e7f9b2d6
+Revises: f6d9e2a4b5c7
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a1c4e7f9b2d6"
+down_revision: Union[str, Sequence[str], None] = "f6d9e2a4b5c7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_INDEXES = (
+    ("ix_tasks_status_due_date", ["status", "due_date"]),
+    ("ix_tasks_due_date", ["due_date"]),
+    ("ix_tasks_area_id", ["area_id"]),
+    ("ix_tasks_project_id", ["project_id"]),
+    ("ix_tasks_commitment_created_at", ["commitment_id", "created_at"]),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, columns in _INDEXES:
+        op.create_index(name, "tasks", columns)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, _columns in reversed(_INDEXES):
+        op.drop_index(name, table_name="tasks")
@@ -0,0 +1,48 @@
+"""add per-mailbox email locations
+
+Revision ID: b3d6f8a1c5e9
+Revises: a1c4e7f9b2d6
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b3d6f8a1c5e9"
+down_revision: Union[str, Sequence[str], None] = "a1c4e7f9b2d6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "email_locations",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("email_id", sa.Integer(), nullable=False),
+        sa.Column("mailbox", sa.Text(), nullable=False),
+        sa.Column("mailbox_uid", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["email_id"], ["emails.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("email_id", "mailbox", name="uq_email_locations_email_id_mailbox"),
+    )
+    op.create_index("ix_email_locations_mailbox_uid", "email_locations", ["mailbox", "mailbox_uid"])
+    # Until now only the last synced mailbox was recorded; seed it as the known location.
+    op.execute(
+        """
+        INSERT INTO email_locations (email_id, mailbox, mailbox_uid)
+        SELECT id, mailbox, mailbox_uid
+        FROM emails
+        WHERE mailbox IS NOT NULL AND mailbox_uid IS NOT NULL AND expunged_at IS NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_email_locations_mailbox_uid", table_name="email_locations")
+    op.drop_table("email_locations")
@@ -0,0 +1,36 @@
+"""add email mailbox location and expunge marker
+
+Revision ID: e5c8d1f2a3b4
+Revises: a7b9c2d4e6f1
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e5c8d1f2a3b4"
+down_revision: Union[str, Sequence[str], None] = "a7b9c2d4e6f1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("emails", sa.Column("mailbox", sa.Text(), nullable=True))
+    op.add_column("emails", sa.Column("expunged_at", sa.Text(), nullable=True))
+    op.create_index(
+        "ix_emails_source_mailbox_uid",
+        "emails",
+        ["source", "mailbox", "mailbox_uid"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_emails_source_mailbox_uid", table_name="emails")
+    op.execute("ALTER TABLE emails DROP COLUMN expunged_at")
+    op.execute("ALTER TABLE emails DROP COLUMN mailbox")
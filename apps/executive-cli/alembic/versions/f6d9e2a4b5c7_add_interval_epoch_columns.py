@@ -0,0 +1,49 @@
+"""add UTC epoch columns and interval indexes for busy and time blocks
+
+Revision ID: f6d9e2a4b5c7
+Revises: e5c8d1f2a3b4
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from executive_cli.models import INTERVAL_EPOCH_TABLES, interval_epoch_backfill, interval_epoch_triggers
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f6d9e2a4b5c7"
+down_revision: Union[str, Sequence[str], None] = "e5c8d1f2a3b4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table_name in INTERVAL_EPOCH_TABLES:
+        op.add_column(table_name, sa.Column("start_epoch", sa.Integer(), nullable=True))
+        op.add_column(table_name, sa.Column("end_epoch", sa.Integer(), nullable=True))
+        op.execute(interval_epoch_backfill(table_name))
+        # Shared with the models' after_create listeners so both paths create the same triggers.
+        for statement in interval_epoch_triggers(table_name):
+            op.execute(statement)
+
+    op.create_index(
+        "ix_busy_blocks_calendar_interval",
+        "busy_blocks",
+        ["calendar_id", "is_deleted", "start_epoch", "end_epoch"],
+    )
+    op.create_index("ix_time_blocks_interval", "time_blocks", ["start_epoch", "end_epoch"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_time_blocks_interval", table_name="time_blocks")
+    op.drop_index("ix_busy_blocks_calendar_interval", table_name="busy_blocks")
+    for table_name in INTERVAL_EPOCH_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table_name}_epoch_update")
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table_name}_epoch_insert")
+        op.execute(f"ALTER TABLE {table_name} DROP COLUMN end_epoch")
+        op.execute(f"ALTER TABLE {table_name} DROP COLUMN start_epoch")
@@ -0,0 +1,73 @@
+"""Micro-benchmark for the CalDAV iCal parser.
+
+Usage (from apps/executive-cli):
+    uv run python scripts/bench_ical_parser.py [--events 2000] [--repeat 5]
+
+Prints parsed VEVENTs per second for a synthetic calendar mixing UTC, TZID and
+all-day events, so parser changes can be compared on the same input.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+
+from executive_cli.connectors.caldav import _parse_ical_events
+
+
+def build_calendar(event_count: int) -> str:
+    lines = ["BEGIN:VCALENDAR", "VERSION:2.0", "PRODID:-//bench//EN"]
+    for index in range(event_count):
+        day = 1 + index % 28
+        hour = 8 + index % 10
+        lines.append("BEGIN:VEVENT")
+        lines.append(f"UID:bench-{index}@example.com")
+        lines.append("DTSTAMP:20260101T000000Z")
+        if index % 3 == 0:
+            lines.append(f"DTSTART:202603{day:02d}T{hour:02d}0000Z")
+            lines.append(f"DTEND:202603{day:02d}T{hour:02d}3000Z")
+        elif index % 3 == 1:
+            lines.append(f"DTSTART;TZID=Europe/Moscow:202603{day:02d}T{hour:02d}0000")
+            lines.append(f"DTEND;TZID=Europe/Moscow:202603{day:02d}T{hour:02d}4500")
+        else:
+            lines.append(f"DTSTART;VALUE=DATE:202603{day:02d}")
+        lines.append(f"SUMMARY:Meeting {index} with a rather long title that gets\r\n  folded onto the next line")
+        lines.append("DESCRIPTION:Agenda\\nItem one\\, item two")
+        lines.append("LAST-MODIFIED:20260201T101500Z")
+        lines.append("END:VEVENT")
+    lines.append("END:VCALENDAR")
+    return "\r\n".join(lines) + "\r\n"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    calendar_data = build_calendar(args.events)
+    default_timezone = ZoneInfo("Europe/Moscow")
+    window_start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    window_end = datetime(2027, 1, 1, tzinfo=timezone.utc)
+
+    best = float("inf")
+    parsed = 0
+    for _ in range(args.repeat):
+        started = time.perf_counter()
+        parsed = len(
+            _parse_ical_events(
+                calendar_data=calendar_data,
+                default_timezone=default_timezone,
+                window_start=window_start,
+                window_end=window_end,
+            )
+        )
+        best = min(best, time.perf_counter() - started)
+
+    print(f"events={parsed} best_sec={best:.4f} events_per_sec={parsed / best:,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Benchmark for planner focus-block scheduling.
+
+Usage (from apps/executive-cli):
+    uv run python scripts/bench_planner.py [--tasks 500] [--busy 50] [--days 7] [--budget-ms 200]
+
+Schedules ``--tasks`` ranked tasks into one planning window spanning ``--days`` days of
+08:00-20:00 with ``--busy`` busy blocks spread evenly over the daytime windows (the nights
+between them are busy too), the shape of a multi-week, multi-calendar planning run. Both
+scheduling engines run on the same input; ``score_min`` is the score-weighted focus
+minutes the optimal engine maximizes. ``--days 1 --tasks 12`` is a typical single day.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+from executive_cli.models import Task, TaskPriority, TaskStatus
+from executive_cli.planner import (
+    VALID_SCHEDULING_ENGINES,
+    PlannerSettings,
+    RankedTask,
+    ScheduledBlock,
+    _block_sort_key,
+    _OccupancyMap,
+    _minutes_between,
+    _schedule_focus_blocks,
+    _schedule_focus_blocks_optimal,
+)
+from executive_cli.timeutil import parse_time_hhmm
+
+WINDOW_START = datetime(2026, 3, 2, 8, 0, tzinfo=timezone.utc)
+
+
+def build_busy_blocks(days: int, busy_count: int, rng: random.Random) -> list[ScheduledBlock]:
+    blocks: list[ScheduledBlock] = []
+    for day in range(days - 1):
+        night_start = WINDOW_START + timedelta(days=day, hours=12)
+        blocks.append(_busy(night_start, night_start + timedelta(hours=12)))
+    per_day = max(busy_count // days, 1)
+    for index in range(busy_count):
+        day, slot = divmod(index, per_day)
+        start = WINDOW_START + timedelta(days=day % days, minutes=slot * 12 * 60 // per_day)
+        blocks.append(_busy(start, start + timedelta(minutes=rng.choice((15, 30, 45, 60)))))
+    return sorted(blocks, key=_block_sort_key)
+
+
+def build_ranked_tasks(task_count: int, rng: random.Random) -> list[RankedTask]:
+    tasks = [
+        RankedTask(
+            task=Task(
+                id=index + 1,
+                title=f"Task {index}",
+                status=TaskStatus.NOW,
+                priority=TaskPriority.P2,
+                estimate_min=rng.choice((30, 45, 60, 90, 120)),
+            ),
+            score=rng.randint(10, 60),
+        )
+        for index in range(task_count)
+    ]
+    return sorted(tasks, key=lambda ranked: (-ranked.score, ranked.task.id))
+
+
+def _busy(start_dt: datetime, end_dt: datetime) -> ScheduledBlock:
+    return ScheduledBlock(start_dt=start_dt, end_dt=end_dt, type="busy", label="Busy", task_id=None)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=500)
+    parser.add_argument("--busy", type=int, default=50)
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--budget-ms", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    fixed_blocks = build_busy_blocks(args.days, args.busy, rng)
+    ranked_tasks = build_ranked_tasks(args.tasks, rng)
+    scores_by_id = {ranked.task.id: ranked.score for ranked in ranked_tasks}
+    schedulers = {"greedy": _schedule_focus_blocks, "optimal": _schedule_focus_blocks_optimal}
+
+    for engine in VALID_SCHEDULING_ENGINES:
+        settings = PlannerSettings(
+            timezone_name="UTC",
+            timezone=timezone.utc,
+            planning_start=parse_time_hhmm("08:00"),
+            planning_end=parse_time_hhmm("20:00"),
+            lunch_start=parse_time_hhmm("13:00"),
+            lunch_duration_min=0,
+            buffer_min=5,
+            min_focus_block_min=30,
+            scheduling_engine=engine,
+            optimal_time_budget_ms=args.budget_ms,
+        )
+        started = time.perf_counter()
+        occupancy = _OccupancyMap(WINDOW_START, WINDOW_START + timedelta(days=args.days - 1, hours=12))
+        for block in fixed_blocks:
+            occupancy.mark(block)
+        focus_blocks, _, didnt_fit = schedulers[engine](
+            occupancy=occupancy,
+            ranked_tasks=ranked_tasks,
+            settings=settings,
+            variant="aggressive",
+            target_focus_minutes=args.days * 12 * 60,
+        )
+        elapsed = time.perf_counter() - started
+        focus_minutes = [(block, _minutes_between(block.start_dt, block.end_dt)) for block in focus_blocks]
+        print(
+            f"schedule_focus engine={engine} tasks={args.tasks} busy={len(fixed_blocks)} days={args.days} "
+            f"sec={elapsed:.4f} scheduled={len(focus_blocks)} didnt_fit={len(didnt_fit)} "
+            f"focus_min={sum(minutes for _, minutes in focus_minutes)} "
+            f"score_min={sum(scores_by_id[block.task_id] * minutes for block, minutes in focus_minutes)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Benchmark for the calendar and mail sync write paths.
+
+Usage (from apps/executive-cli):
+    uv run python scripts/bench_sync_upsert.py [--events 10000]
+
+Runs ``sync_calendar_primary`` against a throwaway SQLite file three times with the same
+full snapshot size: first insert, unchanged re-sync (all skipped) and a re-sync where
+every etag changed (all updated), then the same first insert for ``sync_mailbox``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from sqlmodel import Session, SQLModel, create_engine
+
+from executive_cli.connectors.caldav import CalendarSyncBatch, RemoteCalendarEvent
+from executive_cli.connectors.imap import MailSyncBatch, RemoteEmailHeader
+from executive_cli.db import PRIMARY_CALENDAR_SLUG
+from executive_cli.models import Calendar
+from executive_cli.sync_service import sync_calendar_primary, sync_mailbox
+
+WINDOW_START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+class _StaticCalendar:
+    def __init__(self, batch: CalendarSyncBatch) -> None:
+        self.batch = batch
+
+    def fetch_events(self, **kwargs) -> CalendarSyncBatch:
+        return self.batch
+
+
+class _StaticMailbox:
+    def __init__(self, batch: MailSyncBatch) -> None:
+        self.batch = batch
+
+    def fetch_headers(self, **kwargs) -> MailSyncBatch:
+        return self.batch
+
+
+def build_snapshot(event_count: int, *, etag: str) -> CalendarSyncBatch:
+    events = [
+        RemoteCalendarEvent(
+            external_id=f"/cal/|bench-{index}",
+            start_dt=WINDOW_START + timedelta(minutes=30 * index),
+            end_dt=WINDOW_START + timedelta(minutes=30 * index + 25),
+            title=f"Meeting {index}",
+            external_etag=f"{etag}-{index}",
+            external_modified_at="2026-01-01T00:00:00+00:00",
+        )
+        for index in range(event_count)
+    ]
+    return CalendarSyncBatch(
+        events=events,
+        cursor="bench",
+        cursor_kind="ctag",
+        full_snapshot=True,
+        coverage_start=WINDOW_START,
+        coverage_end=WINDOW_START + timedelta(days=400),
+    )
+
+
+def build_mail_batch(message_count: int) -> MailSyncBatch:
+    messages = [
+        RemoteEmailHeader(
+            external_id=f"<bench-{index}@example.com>",
+            mailbox_uid=index + 1,
+            subject=f"Subject {index}",
+            sender="alice@example.com",
+            received_at="2026-01-01T00:00:00+00:00",
+            flags=("\\Seen",),
+        )
+        for index in range(message_count)
+    ]
+    return MailSyncBatch(messages=messages, uidvalidity=1, uidnext=message_count + 1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=10000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_engine(f"sqlite:///{Path(tmp_dir) / 'bench.sqlite'}")
+        SQLModel.metadata.create_all(engine)
+        with Session(engine) as session:
+            session.add(Calendar(slug=PRIMARY_CALENDAR_SLUG, name="Primary", timezone="UTC"))
+            session.commit()
+
+        runs = [
+            ("calendar_insert", _StaticCalendar(build_snapshot(args.events, etag="v1"))),
+            ("calendar_unchanged", _StaticCalendar(build_snapshot(args.events, etag="v1"))),
+            ("calendar_update", _StaticCalendar(build_snapshot(args.events, etag="v2"))),
+        ]
+        for label, connector in runs:
+            with Session(engine) as session:
+                started = time.perf_counter()
+                result = sync_calendar_primary(session, connector=connector)
+                elapsed = time.perf_counter() - started
+            print(
+                f"{label} events={args.events} sec={elapsed:.3f} "
+                f"inserted={result.inserted} updated={result.updated} skipped={result.skipped}"
+            )
+
+        with Session(engine) as session:
+            started = time.perf_counter()
+            mail_result = sync_mailbox(session, connector=_StaticMailbox(build_mail_batch(args.events)))
+            elapsed = time.perf_counter() - started
+        print(f"mail_insert messages={args.events} sec={elapsed:.3f} inserted={mail_result.inserted}")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
-from executive_cli.cli import main
+from executive_cli.launcher import main
 
 
 if __name__ == "__main__":
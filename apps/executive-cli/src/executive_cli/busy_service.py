@@ -3,8 +3,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
 
+import sqlalchemy as sa
+from sqlmodel import Session, select
+
 from executive_cli.models import BusyBlock
-from executive_cli.timeutil import db_to_dt
+from executive_cli.timeutil import db_to_dt, dt_to_epoch
 
 
 @dataclass
@@ -47,3 +50,40 @@ def merge_busy_blocks(rows: list[BusyBlock]) -> list[MergedBusyBlock]:
         merged.append(MergedBusyBlock(start_dt=start_dt, end_dt=end_dt, title_parts=[row_title]))
 
     return merged
+
+
+def busy_row_epochs(row: BusyBlock) -> tuple[int, int]:
+    """UTC epoch seconds of a row, parsed from ``start_dt``/``end_dt`` where the trigger left NULL."""
+    start_epoch = row.start_epoch if row.start_epoch is not None else dt_to_epoch(db_to_dt(row.start_dt))
+    end_epoch = row.end_epoch if row.end_epoch is not None else dt_to_epoch(db_to_dt(row.end_dt))
+    return start_epoch, end_epoch
+
+
+def select_overlapping_busy_blocks(
+    session: Session,
+    *,
+    calendar_id: int,
+    range_start: datetime,
+    range_end: datetime,
+    source: str | None = None,
+) -> list[BusyBlock]:
+    """Live busy rows overlapping ``(range_start, range_end)``, ordered by start instant and id.
+
+    The epoch columns come from a trigger using SQLite ``strftime('%s', ...)``, which yields
+    NULL for offsets it cannot parse (e.g. one with seconds). Such rows are read separately
+    and compared on their parsed datetimes, so they are never dropped.
+    """
+    start_epoch = dt_to_epoch(range_start)
+    end_epoch = dt_to_epoch(range_end)
+    live = select(BusyBlock).where(BusyBlock.calendar_id == calendar_id).where(BusyBlock.is_deleted == 0)
+    if source is not None:
+        live = live.where(BusyBlock.source == source)
+
+    rows = list(
+        session.exec(live.where(BusyBlock.end_epoch > start_epoch).where(BusyBlock.start_epoch < end_epoch))
+    )
+    for row in session.exec(live.where(sa.or_(BusyBlock.start_epoch.is_(None), BusyBlock.end_epoch.is_(None)))):
+        row_start, row_end = busy_row_epochs(row)
+        if row_end > start_epoch and row_start < end_epoch:
+            rows.append(row)
+    return sorted(rows, key=lambda row: (busy_row_epochs(row)[0], row.id if row.id is not None else -1))
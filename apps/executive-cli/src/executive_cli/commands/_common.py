@@ -0,0 +1,55 @@
+"""Helpers shared by the command modules."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone as _utc_tz
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+import typer
+from sqlmodel import Session, select
+
+from executive_cli.db import DEFAULT_SETTINGS, PRIMARY_CALENDAR_SLUG
+from executive_cli.models import Calendar, Settings, Task, TaskStatus
+
+
+def parse_date(value: str) -> datetime.date:
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError as exc:
+        raise typer.BadParameter("Invalid --date format. Expected YYYY-MM-DD.") from exc
+
+
+def parse_time(value: str, field_name: str) -> datetime.time:
+    try:
+        return datetime.strptime(value, "%H:%M").time()
+    except ValueError as exc:
+        raise typer.BadParameter(f"Invalid --{field_name} format. Expected HH:MM.") from exc
+
+
+def get_primary_calendar(session: Session) -> Calendar:
+    calendar = session.exec(select(Calendar).where(Calendar.slug == PRIMARY_CALENDAR_SLUG)).first()
+    if calendar is None:
+        raise typer.BadParameter("Primary calendar is not initialized. Run 'execas init' first.")
+    return calendar
+
+
+def get_user_timezone(session: Session) -> tuple[ZoneInfo, str]:
+    setting = session.get(Settings, "timezone")
+    timezone_name = setting.value if setting is not None else DEFAULT_SETTINGS["timezone"]
+    try:
+        return ZoneInfo(timezone_name), timezone_name
+    except ZoneInfoNotFoundError as exc:
+        raise typer.BadParameter(f"Invalid timezone setting: {timezone_name}") from exc
+
+
+def utc_now_iso() -> str:
+    """Current UTC time as ISO-8601 with offset (consistent with models.py default_factory)."""
+    return datetime.now(_utc_tz.utc).isoformat()
+
+
+def format_task(t: Task) -> str:
+    line = f'id={t.id} status={t.status} priority={t.priority} estimate={t.estimate_min} due={t.due_date or "-"} title="{t.title}"'
+    if t.status == TaskStatus.WAITING:
+        ping_display = t.ping_at or "-"
+        line += f' waiting_on="{t.waiting_on or "-"}" ping_at="{ping_display}"'
+    return line
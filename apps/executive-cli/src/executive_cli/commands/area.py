@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import typer
+from sqlmodel import Session, select
+
+from executive_cli.db import get_engine
+from executive_cli.models import Area
+
+app = typer.Typer()
+
+
+@app.command("add")
+def area_add(name: str = typer.Argument(..., help="Area name.")) -> None:
+    """Add an area. Idempotent: returns existing record if name matches."""
+    trimmed = name.strip()
+    if not trimmed:
+        raise typer.BadParameter("Area name must not be empty.")
+
+    with Session(get_engine(ensure_directory=True)) as session:
+        existing = session.exec(select(Area).where(Area.name == trimmed)).first()
+        if existing is not None:
+            typer.echo(f'id={existing.id} name="{existing.name}"')
+            return
+
+        area = Area(name=trimmed)
+        session.add(area)
+        session.commit()
+        session.refresh(area)
+        typer.echo(f'id={area.id} name="{area.name}"')
+
+
+@app.command("list")
+def area_list() -> None:
+    """List all areas sorted by name."""
+    with Session(get_engine(ensure_directory=True)) as session:
+        areas = session.exec(select(Area).order_by(Area.name)).all()
+
+    if not areas:
+        typer.echo("No areas.")
+        return
+
+    for area in areas:
+        typer.echo(f'id={area.id} name="{area.name}"')
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+import typer
+from rich import print
+from sqlmodel import Session
+
+from executive_cli.busy_service import merge_busy_blocks, select_overlapping_busy_blocks
+from executive_cli.commands._common import (
+    get_primary_calendar,
+    get_user_timezone,
+    parse_date,
+    parse_time,
+)
+from executive_cli.db import get_engine
+from executive_cli.models import BusyBlock
+from executive_cli.timeutil import dt_to_db
+
+app = typer.Typer()
+
+
+@app.command("add")
+def busy_add(
+    date_value: str = typer.Option(..., "--date", help="Date in YYYY-MM-DD (settings timezone)."),
+    start: str = typer.Option(..., "--start", help="Start time in HH:MM."),
+    end: str = typer.Option(..., "--end", help="End time in HH:MM."),
+    title: str = typer.Option(..., "--title", help="Busy block title."),
+) -> None:
+    """Add a busy block to the primary calendar without merging raw rows."""
+    local_date = parse_date(date_value)
+    start_time = parse_time(start, "start")
+    end_time = parse_time(end, "end")
+
+    with Session(get_engine(ensure_directory=True)) as session:
+        user_tz, _ = get_user_timezone(session)
+        start_dt = datetime.combine(local_date, start_time, tzinfo=user_tz)
+        end_dt = datetime.combine(local_date, end_time, tzinfo=user_tz)
+        if start_dt >= end_dt:
+            raise typer.BadParameter("Invalid interval: --start must be earlier than --end.")
+
+        calendar = get_primary_calendar(session)
+        block = BusyBlock(
+            calendar_id=calendar.id,
+            start_dt=dt_to_db(start_dt),
+            end_dt=dt_to_db(end_dt),
+            title=title,
+        )
+        session.add(block)
+        session.commit()
+
+    print(
+        f"[green]Added busy block:[/green] {start_dt.strftime('%H:%M')}–{end_dt.strftime('%H:%M')} | {title}"
+    )
+
+
+@app.command("list")
+def busy_list(
+    date_value: str = typer.Option(..., "--date", help="Date in YYYY-MM-DD (settings timezone)."),
+) -> None:
+    """List merged busy blocks for the given local date (merge-on-read)."""
+    local_date = parse_date(date_value)
+
+    with Session(get_engine(ensure_directory=True)) as session:
+        user_tz, timezone_name = get_user_timezone(session)
+        day_start = datetime.combine(local_date, datetime.min.time(), tzinfo=user_tz)
+        day_end = datetime.combine(local_date, datetime.max.time(), tzinfo=user_tz)
+
+        calendar = get_primary_calendar(session)
+        rows = select_overlapping_busy_blocks(
+            session,
+            calendar_id=calendar.id,
+            range_start=day_start,
+            range_end=day_end,
+        )
+
+    merged = merge_busy_blocks(rows)
+    if not merged:
+        print(f"[yellow]No busy blocks for {local_date.isoformat()}[/yellow]")
+        return
+
+    print(f"[bold]Busy blocks for {local_date.isoformat()} ({timezone_name}):[/bold]")
+    for item in merged:
+        print(f"- {item.start_dt.strftime('%H:%M')}–{item.end_dt.strftime('%H:%M')} | {item.title}")
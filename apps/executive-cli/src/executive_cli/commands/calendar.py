@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import typer
+from rich import print
+from sqlmodel import Session
+
+from executive_cli.busy_service import select_overlapping_busy_blocks
+from executive_cli.commands._common import get_primary_calendar, get_user_timezone, parse_date
+from executive_cli.connectors.caldav import CalDavConnector, CalendarConnectorError
+from executive_cli.db import get_engine
+from executive_cli.sync_service import (
+    CALDAV_SOURCE,
+    reset_calendar_sync_cursor,
+    sync_calendar_primary,
+)
+from executive_cli.timeutil import db_to_dt
+
+app = typer.Typer()
+
+
+@app.command("sync")
+def calendar_sync(
+    force_full: bool = typer.Option(
+        False,
+        "--force-full",
+        help="Reset stored calendar cursor before sync (forces a full snapshot refresh).",
+    ),
+) -> None:
+    """Incremental sync from CalDAV into busy blocks with provenance tracking."""
+    with Session(get_engine(ensure_directory=True)) as session:
+        try:
+            if force_full:
+                reset_calendar_sync_cursor(session)
+            connector = CalDavConnector.from_env()
+            result = sync_calendar_primary(session, connector=connector)
+        except CalendarConnectorError:
+            print("[red]Calendar sync failed.[/red] Check CalDAV credentials and endpoint settings.")
+            print(
+                "Fallback: use manual input via "
+                "execas busy add --date YYYY-MM-DD --start HH:MM --end HH:MM --title \"...\""
+            )
+            raise typer.Exit(code=1) from None
+        except ValueError as exc:
+            raise typer.BadParameter(str(exc)) from exc
+
+    if force_full:
+        print("[yellow]Forced full calendar resync applied:[/yellow] cursor reset before fetch")
+    print(
+        "[green]Calendar sync complete.[/green] "
+        f"inserted={result.inserted} updated={result.updated} "
+        f"skipped={result.skipped} soft_deleted={result.soft_deleted} "
+        f"cursor_kind={result.cursor_kind or '-'} cursor={result.cursor or '-'}"
+    )
+
+
+@app.command("next-week")
+def calendar_next_week(
+    source: str = typer.Option(
+        CALDAV_SOURCE,
+        "--source",
+        help="Busy block source filter (default: yandex_caldav).",
+    ),
+    anchor_date: str | None = typer.Option(
+        None,
+        "--anchor-date",
+        help="Anchor local date in YYYY-MM-DD (default: today in settings timezone).",
+    ),
+) -> None:
+    """List imported meetings for the next local week from the selected source."""
+    source_value = source.strip()
+    if not source_value:
+        raise typer.BadParameter("--source must not be empty.")
+
+    with Session(get_engine(ensure_directory=True)) as session:
+        user_tz, timezone_name = get_user_timezone(session)
+        local_today = datetime.now(user_tz).date() if anchor_date is None else parse_date(anchor_date.strip())
+        next_monday = local_today + timedelta(days=(7 - local_today.weekday()))
+        next_sunday = next_monday + timedelta(days=6)
+        range_start = datetime.combine(next_monday, datetime.min.time(), tzinfo=user_tz)
+        range_end = datetime.combine(next_sunday + timedelta(days=1), datetime.min.time(), tzinfo=user_tz)
+
+        calendar = get_primary_calendar(session)
+        rows = select_overlapping_busy_blocks(
+            session,
+            calendar_id=calendar.id,
+            range_start=range_start,
+            range_end=range_end,
+            source=source_value,
+        )
+
+    print(
+        "[bold]Next-week meetings:[/bold] "
+        f"{next_monday.isoformat()}..{next_sunday.isoformat()} "
+        f"source={source_value} timezone={timezone_name}"
+    )
+    if not rows:
+        print("[yellow]No meetings found for next week.[/yellow]")
+        return
+
+    print(f"Count: {len(rows)}")
+    for row in rows:
+        start_local = db_to_dt(row.start_dt).astimezone(user_tz)
+        end_local = db_to_dt(row.end_dt).astimezone(user_tz)
+        title = row.title or "(untitled)"
+        print(f"- {start_local.strftime('%Y-%m-%d %H:%M')}–{end_local.strftime('%H:%M')} | {title}")
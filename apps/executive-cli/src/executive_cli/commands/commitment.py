@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+import typer
+from sqlmodel import Session, select
+
+from executive_cli.commands._common import parse_date
+from executive_cli.db import get_engine
+from executive_cli.models import Commitment
+
+app = typer.Typer()
+
+
+VALID_DIFFICULTIES = {"D1", "D2", "D3", "D4", "D5"}
+
+# Seed data from TECH_SPEC §6 — MVP commitments
+_SEED_COMMITMENTS: list[dict[str, str]] = [
+    {
+        "id": "YC-1",
+        "title": "Raise >=25M RUB investments in a venture project",
+        "metric": "by 31.12.2026 raised >= 25M RUB investments in a venture project where user is key initiator/founder",
+        "due_date": "2026-12-31",
+        "difficulty": "D3",
+    },
+    {
+        "id": "YC-2",
+        "title": "Create graphic art series and commercialize",
+        "metric": "by 31.12.2026 created a series of graphic art objects and commercialized them",
+        "due_date": "2026-12-31",
+        "difficulty": "D5",
+    },
+    {
+        "id": "YC-3",
+        "title": "4+ weeks in English-speaking professional environment",
+        "metric": "by 31.12.2026 spent >= 4 weeks in an English-speaking professional environment with recorded results in English",
+        "due_date": "2026-12-31",
+        "difficulty": "D4",
+    },
+]
+
+
+def _format_commitment(c: Commitment) -> str:
+    return f'id={c.id} due={c.due_date} difficulty={c.difficulty} title="{c.title}"'
+
+
+@app.command("add")
+def commitment_add(
+    cid: str = typer.Option(..., "--id", help="Commitment ID (e.g. YC-1)."),
+    title: str = typer.Option(..., "--title", help="Commitment title."),
+    metric: str = typer.Option(..., "--metric", help="Definition of done / metric."),
+    due: str = typer.Option(..., "--due", help="Due date YYYY-MM-DD."),
+    difficulty: str = typer.Option(..., "--difficulty", help="Difficulty D1..D5."),
+    notes: str | None = typer.Option(None, "--notes", help="Optional notes."),
+) -> None:
+    """Add a commitment. Idempotent if all fields match; error on conflict."""
+    trimmed_id = cid.strip()
+    if not trimmed_id:
+        raise typer.BadParameter("Commitment --id must not be empty.")
+
+    difficulty_upper = difficulty.strip().upper()
+    if difficulty_upper not in VALID_DIFFICULTIES:
+        raise typer.BadParameter(f"Invalid --difficulty: {difficulty}. Must be one of: D1, D2, D3, D4, D5.")
+
+    due_date = parse_date(due)
+
+    with Session(get_engine(ensure_directory=True)) as session:
+        existing = session.get(Commitment, trimmed_id)
+        if existing is not None:
+            # Check full identity for idempotent behavior
+            fields_match = (
+                existing.title == title.strip()
+                and existing.metric == metric.strip()
+                and existing.due_date == due_date
+                and existing.difficulty == difficulty_upper
+                and (existing.notes or None) == (notes.strip() if notes else None)
+            )
+            if fields_match:
+                typer.echo(_format_commitment(existing))
+                return
+            raise typer.BadParameter(
+                f'Commitment "{trimmed_id}" already exists with different fields. '
+                "Delete or update manually before re-adding."
+            )
+
+        commitment = Commitment(
+            id=trimmed_id,
+            title=title.strip(),
+            metric=metric.strip(),
+            due_date=due_date,
+            difficulty=difficulty_upper,
+            notes=notes.strip() if notes else None,
+        )
+        session.add(commitment)
+        session.commit()
+        session.refresh(commitment)
+        typer.echo(_format_commitment(commitment))
+
+
+@app.command("list")
+def commitment_list() -> None:
+    """List all commitments sorted by due_date then id."""
+    with Session(get_engine(ensure_directory=True)) as session:
+        commitments = session.exec(
+            select(Commitment).order_by(Commitment.due_date, Commitment.id)
+        ).all()
+
+    if not commitments:
+        typer.echo("No commitments.")
+        return
+
+    for c in commitments:
+        typer.echo(_format_commitment(c))
+
+
+@app.command("import")
+def commitment_import() -> None:
+    """Seed YC-1..YC-3 from spec. Idempotent: skip existing, warn on conflicts."""
+    inserted = 0
+    skipped = 0
+    conflicts = 0
+
+    with Session(get_engine(ensure_directory=True)) as session:
+        for seed in _SEED_COMMITMENTS:
+            existing = session.get(Commitment, seed["id"])
+            if existing is not None:
+                due_date = datetime.strptime(seed["due_date"], "%Y-%m-%d").date()
+                fields_match = (
+                    existing.title == seed["title"]
+                    and existing.metric == seed["metric"]
+                    and existing.due_date == due_date
+                    and existing.difficulty == seed["difficulty"]
+                    and existing.notes == seed.get("notes")
+                )
+                if fields_match:
+                    skipped += 1
+                else:
+                    conflicts += 1
+                    typer.echo(f'[yellow]CONFLICT:[/yellow] {seed["id"]} exists with different fields — skipping.', err=True)
+                continue
+
+            commitment = Commitment(
+                id=seed["id"],
+                title=seed["title"],
+                metric=seed["metric"],
+                due_date=datetime.strptime(seed["due_date"], "%Y-%m-%d").date(),
+                difficulty=seed["difficulty"],
+                notes=seed.get("notes"),
+            )
+            session.add(commitment)
+            inserted += 1
+
+        session.commit()
+
+    typer.echo(f"imported={inserted} skipped={skipped} conflicts={conflicts}")
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import typer
+from sqlmodel import Session
+
+from executive_cli.config import list_settings, upsert_setting
+from executive_cli.db import get_engine
+
+app = typer.Typer()
+
+
+@app.command("show")
+def config_show() -> None:
+    """Print all settings as key=value, sorted by key."""
+    with Session(get_engine(ensure_directory=True)) as session:
+        settings = list_settings(session)
+
+    for setting in settings:
+        typer.echo(f"{setting.key}={setting.value}")
+
+
+@app.command("set")
+def config_set(key: str, value: str) -> None:
+    """Validate and upsert a setting."""
+    with Session(get_engine(ensure_directory=True)) as session:
+        try:
+            setting = upsert_setting(session, key=key, value=value)
+        except ValueError as exc:
+            raise typer.BadParameter(str(exc)) from exc
+
+    typer.echo(f"{setting.key}={setting.value}")
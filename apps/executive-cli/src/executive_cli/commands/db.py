@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import typer
+
+from executive_cli.db import get_db_path, get_engine, read_sqlite_pragmas
+
+app = typer.Typer()
+
+
+@app.command("info")
+def db_info() -> None:
+    """Print the database path and the effective SQLite tuning pragmas as key=value."""
+    with get_engine(ensure_directory=True).connect() as connection:
+        sqlite_version = connection.exec_driver_sql("SELECT sqlite_version()").scalar_one()
+        pragmas = read_sqlite_pragmas(connection)
+
+    typer.echo(f"db_path={get_db_path()}")
+    typer.echo(f"sqlite_version={sqlite_version}")
+    for name, value in pragmas.items():
+        typer.echo(f"{name}={value}")
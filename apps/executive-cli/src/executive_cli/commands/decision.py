@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import sqlalchemy as sa
+import typer
+from sqlmodel import Session, select
+
+from executive_cli.commands._common import parse_date, utc_now_iso
+from executive_cli.db import get_engine
+from executive_cli.models import Decision
+
+app = typer.Typer()
+
+
+def _format_decision(d: Decision) -> str:
+    return f'id={d.id} date={d.decided_date or "-"} title="{d.title}"'
+
+
+@app.command("add")
+def decision_add(
+    title_arg: str | None = typer.Argument(None, metavar="TITLE", help="Decision title (positional)."),
+    title_flag: str | None = typer.Option(None, "--title", help="Decision title (flag)."),
+    body: str | None = typer.Option(None, "--body", help="Decision body/rationale."),
+    date_value: str | None = typer.Option(None, "--date", help="Decision date YYYY-MM-DD."),
+) -> None:
+    """Add a decision. Title via positional arg or --title flag (not both)."""
+    if title_arg is not None and title_flag is not None:
+        raise typer.BadParameter("Provide title as positional argument OR --title, not both.")
+    title = title_arg or title_flag
+    if title is None:
+        raise typer.BadParameter("Decision title is required (positional or --title).")
+    trimmed = title.strip()
+    if not trimmed:
+        raise typer.BadParameter("Decision title must not be empty.")
+
+    decided_date = parse_date(date_value) if date_value else None
+    now = utc_now_iso()
+
+    with Session(get_engine(ensure_directory=True)) as session:
+        decision = Decision(
+            title=trimmed,
+            body=body.strip() if body else None,
+            decided_date=decided_date,
+            created_at=now,
+            updated_at=now,
+        )
+        session.add(decision)
+        session.commit()
+        session.refresh(decision)
+        typer.echo(_format_decision(decision))
+
+
+@app.command("search")
+def decision_search(
+    query: str = typer.Argument(..., help="FTS5 search query."),
+) -> None:
+    """Search decisions using full-text search."""
+    trimmed = query.strip()
+    if not trimmed:
+        raise typer.BadParameter("Search query must not be empty.")
+
+    with Session(get_engine(ensure_directory=True)) as session:
+        results = session.exec(
+            select(Decision)
+            .where(
+                Decision.id.in_(  # type: ignore[union-attr]
+                    select(sa.column("rowid"))
+                    .select_from(sa.text("decisions_fts"))
+                    .where(sa.text("decisions_fts MATCH :q"))
+                )
+            )
+            .params(q=trimmed)
+        ).all()
+
+    if not results:
+        typer.echo("No matches.")
+        return
+
+    for d in results:
+        typer.echo(_format_decision(d))
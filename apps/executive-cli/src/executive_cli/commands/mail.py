@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+import typer
+from rich import print
+from sqlmodel import Session
+
+from executive_cli.commands._common import get_user_timezone
+from executive_cli.connectors.imap import ImapConnector, MailConnectorError
+from executive_cli.db import get_engine
+from executive_cli.sync_service import (
+    IMAP_IDLE_TIMEOUT_SEC,
+    IMAP_SCOPE_INBOX,
+    sync_mailbox,
+    sync_mailboxes,
+    watch_mailbox,
+)
+
+app = typer.Typer()
+
+
+@app.command("sync")
+def mail_sync(
+    mailboxes: list[str] = typer.Option(
+        [IMAP_SCOPE_INBOX],
+        "--mailbox",
+        help="IMAP mailbox scope (e.g. INBOX). Repeat to sync several mailboxes concurrently.",
+    ),
+    this_year: bool = typer.Option(
+        False,
+        "--this-year",
+        help="Limit IMAP search to messages received since Jan 1 of the current local year.",
+    ),
+) -> None:
+    """Incremental sync from IMAP into emails metadata with provenance tracking."""
+    scopes = list(dict.fromkeys(mailbox.strip() for mailbox in mailboxes))
+    if not scopes or not all(scopes):
+        raise typer.BadParameter("--mailbox must not be empty.")
+
+    with Session(get_engine(ensure_directory=True)) as session:
+        try:
+            connector = ImapConnector.from_env()
+            received_since = None
+            if this_year:
+                user_tz, _ = get_user_timezone(session)
+                local_today = datetime.now(user_tz).date()
+                received_since = local_today.replace(month=1, day=1)
+            if len(scopes) == 1:
+                results = {
+                    scopes[0]: sync_mailbox(
+                        session,
+                        connector=connector,
+                        mailbox=scopes[0],
+                        received_since=received_since,
+                    )
+                }
+            else:
+                results = sync_mailboxes(
+                    session,
+                    connector=connector,
+                    mailboxes=scopes,
+                    received_since=received_since,
+                )
+        except MailConnectorError:
+            print("[red]Mail sync failed.[/red] Check IMAP credentials and endpoint settings.")
+            print(
+                "Fallback: create follow-up manually via "
+                'execas task capture "Email follow-up" --estimate 30 --priority P2 --status NEXT'
+            )
+            raise typer.Exit(code=1) from None
+
+    for scope, result in results.items():
+        mailbox_label = f"mailbox={scope} " if len(results) > 1 else ""
+        print(
+            "[green]Mail sync complete.[/green] "
+            f"{mailbox_label}inserted={result.inserted} updated={result.updated} expunged={result.expunged} "
+            f"cursor_kind={result.cursor_kind} cursor={result.cursor}"
+        )
+
+
+@app.command("watch")
+def mail_watch(
+    mailbox: str = typer.Option(IMAP_SCOPE_INBOX, "--mailbox", help="IMAP mailbox scope (e.g. INBOX)."),
+    idle_timeout_sec: int = typer.Option(
+        IMAP_IDLE_TIMEOUT_SEC,
+        "--idle-timeout-sec",
+        min=30,
+        max=29 * 60,
+        help="Re-issue IMAP IDLE after this many seconds without mailbox updates.",
+    ),
+    retries: int = typer.Option(5, "--retries", min=0, help="Consecutive reconnect attempts before giving up."),
+) -> None:
+    """Long-running mail sync: one IMAP session, IDLE push, incremental upsert on every change."""
+    scope = mailbox.strip()
+    if not scope:
+        raise typer.BadParameter("--mailbox must not be empty.")
+
+    def _print_result(result) -> None:
+        print(
+            "[green]Mail sync complete.[/green] "
+            f"inserted={result.inserted} updated={result.updated} expunged={result.expunged} "
+            f"cursor_kind={result.cursor_kind} cursor={result.cursor}"
+        )
+
+    with Session(get_engine(ensure_directory=True)) as session:
+        try:
+            connector = ImapConnector.from_env()
+            print(f"Watching mailbox={scope} (Ctrl+C to stop)")
+            watch_mailbox(
+                session,
+                connector=connector,
+                mailbox=scope,
+                idle_timeout_sec=float(idle_timeout_sec),
+                retries=retries,
+                on_result=_print_result,
+            )
+        except MailConnectorError:
+            print("[red]Mail watch stopped.[/red] Check IMAP credentials and endpoint settings.")
+            print(f"Fallback: run 'execas mail sync --mailbox {scope}' manually.")
+            raise typer.Exit(code=1) from None
+        except KeyboardInterrupt:
+            print("Mail watch stopped.")
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import sqlalchemy as sa
+import typer
+from sqlmodel import Session, select
+
+from executive_cli.commands._common import utc_now_iso
+from executive_cli.db import get_engine
+from executive_cli.models import Person
+
+app = typer.Typer()
+
+
+def _format_person(p: Person) -> str:
+    return f'id={p.id} name="{p.name}" role="{p.role or "-"}" context="{p.context or "-"}"'
+
+
+@app.command("add")
+def people_add(
+    name_arg: str | None = typer.Argument(None, metavar="NAME", help="Person name (positional)."),
+    name_flag: str | None = typer.Option(None, "--name", help="Person name (flag)."),
+    role: str | None = typer.Option(None, "--role", help="Role or title."),
+    context: str | None = typer.Option(None, "--context", help="Additional context."),
+) -> None:
+    """Add a person. Name via positional arg or --name flag (not both)."""
+    if name_arg is not None and name_flag is not None:
+        raise typer.BadParameter("Provide name as positional argument OR --name, not both.")
+    name = name_arg or name_flag
+    if name is None:
+        raise typer.BadParameter("Person name is required (positional or --name).")
+    trimmed = name.strip()
+    if not trimmed:
+        raise typer.BadParameter("Person name must not be empty.")
+
+    now = utc_now_iso()
+
+    with Session(get_engine(ensure_directory=True)) as session:
+        person = Person(
+            name=trimmed,
+            role=role.strip() if role else None,
+            context=context.strip() if context else None,
+            created_at=now,
+            updated_at=now,
+        )
+        session.add(person)
+        session.commit()
+        session.refresh(person)
+        typer.echo(_format_person(person))
+
+
+@app.command("search")
+def people_search(
+    query: str = typer.Argument(..., help="FTS5 search query."),
+) -> None:
+    """Search people using full-text search."""
+    trimmed = query.strip()
+    if not trimmed:
+        raise typer.BadParameter("Search query must not be empty.")
+
+    with Session(get_engine(ensure_directory=True)) as session:
+        results = session.exec(
+            select(Person)
+            .where(
+                Person.id.in_(  # type: ignore[union-attr]
+                    select(sa.column("rowid"))
+                    .select_from(sa.text("people_fts"))
+                    .where(sa.text("people_fts MATCH :q"))
+                )
+            )
+            .params(q=trimmed)
+        ).all()
+
+    if not results:
+        typer.echo("No matches.")
+        return
+
+    for p in results:
+        typer.echo(_format_person(p))
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import typer
+from rich import print
+from sqlmodel import Session
+
+from executive_cli.commands._common import parse_date
+from executive_cli.db import get_engine
+from executive_cli.planner import (
+    VALID_VARIANTS,
+    DayPlanResult,
+    build_and_persist_day_plan,
+    build_and_persist_week_plan,
+)
+
+app = typer.Typer()
+
+
+@app.command("day")
+def plan_day(
+    date_value: str = typer.Option(..., "--date", help="Date in YYYY-MM-DD."),
+    variant: str = typer.Option(..., "--variant", help="Plan variant: minimal, realistic, aggressive."),
+) -> None:
+    """Build, print, and persist a deterministic day plan."""
+    local_date = parse_date(date_value)
+    normalized_variant = variant.strip().lower()
+    if normalized_variant not in VALID_VARIANTS:
+        raise typer.BadParameter("Invalid --variant. Expected one of: minimal, realistic, aggressive.")
+
+    with Session(get_engine(ensure_directory=True)) as session:
+        try:
+            result = build_and_persist_day_plan(
+                session,
+                plan_date=local_date,
+                variant=normalized_variant,
+            )
+        except ValueError as exc:
+            raise typer.BadParameter(str(exc)) from exc
+
+    _print_day_plan(result)
+
+
+@app.command("week")
+def plan_week(
+    start_value: str = typer.Option(..., "--start", help="First date in YYYY-MM-DD."),
+    variant: str = typer.Option(..., "--variant", help="Plan variant: minimal, realistic, aggressive."),
+    days: int = typer.Option(7, "--days", min=1, help="Number of consecutive days to plan."),
+) -> None:
+    """Build, print, and persist day plans for consecutive days, carrying unscheduled tasks forward."""
+    start_date = parse_date(start_value)
+    normalized_variant = variant.strip().lower()
+    if normalized_variant not in VALID_VARIANTS:
+        raise typer.BadParameter("Invalid --variant. Expected one of: minimal, realistic, aggressive.")
+
+    with Session(get_engine(ensure_directory=True)) as session:
+        try:
+            results = build_and_persist_week_plan(
+                session,
+                start_date=start_date,
+                variant=normalized_variant,
+                days=days,
+            )
+        except ValueError as exc:
+            raise typer.BadParameter(str(exc)) from exc
+
+    for index, result in enumerate(results):
+        if index:
+            print()
+        _print_day_plan(result)
+
+
+def _print_day_plan(result: DayPlanResult) -> None:
+    print(f"Plan for {result.plan_date.isoformat()} ({result.timezone_name}) variant={result.variant}")
+    for block in result.blocks:
+        start = block.start_dt.astimezone(result.timezone).strftime("%H:%M")
+        end = block.end_dt.astimezone(result.timezone).strftime("%H:%M")
+        print(f"- {start}-{end} {block.type} {block.label}")
+
+    if result.lunch_skipped:
+        print("Note: lunch skipped (no feasible slot).")
+
+    print("Selected tasks:")
+    if result.selected_tasks:
+        for task in result.selected_tasks:
+            item = f"- {task.title} ({task.priority.value}, {task.estimate_min}m"
+            if task.due_date is not None:
+                item += f", due {task.due_date.isoformat()}"
+            item += ")"
+            print(item)
+    else:
+        print("- none")
+
+    print("Didn't fit:")
+    if result.didnt_fit_tasks:
+        for task in result.didnt_fit_tasks:
+            print(f"- {task.title}: {task.reason}")
+    else:
+        print("- none")
+
+    if result.suggestions_text is not None:
+        print(f"Suggestions: {result.suggestions_text}")
+
+    if result.no_now_hint_text is not None:
+        print(f"Hint: {result.no_now_hint_text}")
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import typer
+from sqlmodel import Session, select
+
+from executive_cli.db import get_engine
+from executive_cli.models import Area, Project
+
+app = typer.Typer()
+
+
+@app.command("add")
+def project_add(
+    name: str = typer.Argument(..., help="Project name."),
+    area_name: str | None = typer.Option(None, "--area", help="Area name to link."),
+) -> None:
+    """Add a project. Idempotent if same name+area; error on area conflict."""
+    trimmed = name.strip()
+    if not trimmed:
+        raise typer.BadParameter("Project name must not be empty.")
+
+    with Session(get_engine(ensure_directory=True)) as session:
+        resolved_area_id: int | None = None
+        resolved_area_name: str = "-"
+
+        if area_name is not None:
+            area = session.exec(select(Area).where(Area.name == area_name.strip())).first()
+            if area is None:
+                raise typer.BadParameter(f'Area "{area_name.strip()}" not found. Create it first with: execas area add "{area_name.strip()}"')
+            resolved_area_id = area.id
+            resolved_area_name = area.name
+
+        existing = session.exec(select(Project).where(Project.name == trimmed)).first()
+        if existing is not None:
+            if existing.area_id == resolved_area_id:
+                existing_area_name = "-"
+                if existing.area_id is not None:
+                    ea = session.get(Area, existing.area_id)
+                    existing_area_name = ea.name if ea else "-"
+                typer.echo(f'id={existing.id} name="{existing.name}" area="{existing_area_name}"')
+                return
+            raise typer.BadParameter(
+                f'Project "{trimmed}" already exists with a different area (area_id={existing.area_id}). '
+                "Cannot overwrite. Delete or rename first."
+            )
+
+        project = Project(name=trimmed, area_id=resolved_area_id)
+        session.add(project)
+        session.commit()
+        session.refresh(project)
+        typer.echo(f'id={project.id} name="{project.name}" area="{resolved_area_name}"')
+
+
+@app.command("list")
+def project_list() -> None:
+    """List all projects sorted by name, with area info."""
+    with Session(get_engine(ensure_directory=True)) as session:
+        projects = session.exec(select(Project).order_by(Project.name)).all()
+
+        if not projects:
+            typer.echo("No projects.")
+            return
+
+        for proj in projects:
+            area_name = "-"
+            if proj.area_id is not None:
+                area = session.get(Area, proj.area_id)
+                if area:
+                    area_name = area.name
+            typer.echo(f'id={proj.id} name="{proj.name}" area="{area_name}"')
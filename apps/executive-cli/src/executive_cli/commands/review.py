@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone as _utc_tz
+
+import typer
+from sqlmodel import Session
+
+from executive_cli.commands._common import parse_date
+from executive_cli.db import get_engine
+from executive_cli.review import build_and_persist_weekly_review, validate_week
+from executive_cli.scrum_metrics import (
+    append_metrics_history,
+    collect_code_quality_snapshot,
+    compute_scrum_metrics,
+)
+
+app = typer.Typer()
+
+
+@app.command("week")
+def review_week(
+    week: str = typer.Option(..., "--week", help="Week in YYYY-Www format (e.g. 2026-W07)."),
+    limit: int = typer.Option(10, "--limit", help="Max items in action list."),
+    proposals_count: int = typer.Option(5, "--proposals", help="Max NEXT→NOW proposals."),
+) -> None:
+    """Generate and persist a deterministic weekly review."""
+    try:
+        validated_week = validate_week(week.strip())
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+
+    now = datetime.now(_utc_tz.utc)
+
+    with Session(get_engine(ensure_directory=True)) as session:
+        body_md = build_and_persist_weekly_review(
+            session,
+            week=validated_week,
+            now=now,
+            limit=limit,
+            proposals=proposals_count,
+        )
+
+    typer.echo(body_md)
+
+
+@app.command("scrum-metrics")
+def review_scrum_metrics(
+    start: str | None = typer.Option(
+        None,
+        "--start",
+        help="Window start date YYYY-MM-DD (default: 13 days before end).",
+    ),
+    end: str | None = typer.Option(
+        None,
+        "--end",
+        help="Window end date YYYY-MM-DD (default: today in UTC).",
+    ),
+    run_quality: bool = typer.Option(
+        True,
+        "--run-quality/--no-run-quality",
+        help="Run quality snapshot (pytest + coverage gate).",
+    ),
+    save: bool = typer.Option(
+        True,
+        "--save/--no-save",
+        help="Append snapshot to local history file in .data.",
+    ),
+) -> None:
+    """Compute Scrum throughput/lead-time/carry-over metrics and optional code quality snapshot."""
+    end_date = parse_date(end) if end else datetime.now(_utc_tz.utc).date()
+    start_date = parse_date(start) if start else (end_date - timedelta(days=13))
+    if start_date > end_date:
+        raise typer.BadParameter("--start must be earlier than or equal to --end.")
+
+    with Session(get_engine(ensure_directory=True)) as session:
+        metrics = compute_scrum_metrics(session, start_date=start_date, end_date=end_date)
+
+    quality = collect_code_quality_snapshot() if run_quality else None
+
+    typer.echo(f"Scrum metrics window: {start_date.isoformat()}..{end_date.isoformat()}")
+    typer.echo(f"throughput_done_count={metrics.throughput_done_count}")
+    typer.echo(f"throughput_done_estimate_min={metrics.throughput_done_estimate_min}")
+    typer.echo(f"backlog_at_start_count={metrics.backlog_at_start_count}")
+    typer.echo(f"carry_over_count={metrics.carry_over_count}")
+    typer.echo(f"carry_over_rate={metrics.carry_over_rate:.2%}")
+    if metrics.lead_time_avg_hours is None:
+        typer.echo("lead_time_avg_hours=-")
+    else:
+        typer.echo(f"lead_time_avg_hours={metrics.lead_time_avg_hours:.2f}")
+    if metrics.lead_time_p85_hours is None:
+        typer.echo("lead_time_p85_hours=-")
+    else:
+        typer.echo(f"lead_time_p85_hours={metrics.lead_time_p85_hours:.2f}")
+
+    if quality is None:
+        typer.echo("quality_snapshot=skipped")
+    else:
+        typer.echo(f"quality_tests_passed={str(quality.tests_passed).lower()}")
+        typer.echo(f"quality_coverage_gate_passed={str(quality.coverage_gate_passed).lower()}")
+        if quality.coverage_percent is None:
+            typer.echo("quality_coverage_percent=-")
+        else:
+            typer.echo(f"quality_coverage_percent={quality.coverage_percent:.2f}")
+
+    if save:
+        record: dict[str, object] = {
+            "generated_at": datetime.now(_utc_tz.utc).isoformat(),
+            "metrics": metrics.to_record(),
+            "quality": quality.to_record() if quality else None,
+        }
+        path = append_metrics_history(record)
+        typer.echo(f'history_saved="{path}"')
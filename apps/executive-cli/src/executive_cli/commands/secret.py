@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import getpass
+import os
+
+import typer
+from rich import print
+
+from executive_cli.secret_store import (
+    DEFAULT_CALDAV_KEYCHAIN_SERVICE,
+    DEFAULT_IMAP_KEYCHAIN_SERVICE,
+    SecretStoreError,
+    keychain_password_exists,
+    resolve_keychain_service,
+    store_keychain_password,
+)
+
+app = typer.Typer()
+
+
+def _resolve_secret_account(username: str | None, env_var: str, label: str) -> str:
+    account = (username or os.getenv(env_var, "")).strip()
+    if not account:
+        raise typer.BadParameter(
+            f"Missing {label} username. Pass --username or set {env_var} in environment."
+        )
+    return account
+
+
+def _resolve_secret_service(override: str | None, env_var: str, default: str) -> str:
+    return (override.strip() if override else resolve_keychain_service(env_var, default)).strip()
+
+
+@app.command("set-caldav")
+def secret_set_caldav(
+    username: str | None = typer.Option(
+        None,
+        "--username",
+        help="CalDAV username (defaults to EXECAS_CALDAV_USERNAME).",
+    ),
+    service: str | None = typer.Option(
+        None,
+        "--service",
+        help=f"Keychain service override (default: {DEFAULT_CALDAV_KEYCHAIN_SERVICE}).",
+    ),
+) -> None:
+    """Store CalDAV app-password in macOS Keychain."""
+    account = _resolve_secret_account(username, "EXECAS_CALDAV_USERNAME", "CalDAV")
+    service_name = _resolve_secret_service(
+        service,
+        "EXECAS_CALDAV_KEYCHAIN_SERVICE",
+        DEFAULT_CALDAV_KEYCHAIN_SERVICE,
+    )
+    password = getpass.getpass("CalDAV app-password: ")
+    if not password:
+        raise typer.BadParameter("CalDAV password must not be empty.")
+    try:
+        store_keychain_password(service=service_name, account=account, password=password)
+    except SecretStoreError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+    print(
+        "[green]CalDAV password stored in Keychain.[/green] "
+        f"service={service_name} account={account}"
+    )
+
+
+@app.command("set-imap")
+def secret_set_imap(
+    username: str | None = typer.Option(
+        None,
+        "--username",
+        help="IMAP username (defaults to EXECAS_IMAP_USERNAME).",
+    ),
+    service: str | None = typer.Option(
+        None,
+        "--service",
+        help=f"Keychain service override (default: {DEFAULT_IMAP_KEYCHAIN_SERVICE}).",
+    ),
+) -> None:
+    """Store IMAP app-password in macOS Keychain."""
+    account = _resolve_secret_account(username, "EXECAS_IMAP_USERNAME", "IMAP")
+    service_name = _resolve_secret_service(
+        service,
+        "EXECAS_IMAP_KEYCHAIN_SERVICE",
+        DEFAULT_IMAP_KEYCHAIN_SERVICE,
+    )
+    password = getpass.getpass("IMAP app-password: ")
+    if not password:
+        raise typer.BadParameter("IMAP password must not be empty.")
+    try:
+        store_keychain_password(service=service_name, account=account, password=password)
+    except SecretStoreError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+    print(
+        "[green]IMAP password stored in Keychain.[/green] "
+        f"service={service_name} account={account}"
+    )
+
+
+@app.command("status")
+def secret_status(
+    caldav_username: str | None = typer.Option(
+        None,
+        "--caldav-username",
+        help="CalDAV username (defaults to EXECAS_CALDAV_USERNAME).",
+    ),
+    imap_username: str | None = typer.Option(
+        None,
+        "--imap-username",
+        help="IMAP username (defaults to EXECAS_IMAP_USERNAME).",
+    ),
+) -> None:
+    """Check whether keychain passwords are available for configured accounts."""
+    caldav_account = _resolve_secret_account(caldav_username, "EXECAS_CALDAV_USERNAME", "CalDAV")
+    imap_account = _resolve_secret_account(imap_username, "EXECAS_IMAP_USERNAME", "IMAP")
+    caldav_service = resolve_keychain_service(
+        "EXECAS_CALDAV_KEYCHAIN_SERVICE",
+        DEFAULT_CALDAV_KEYCHAIN_SERVICE,
+    )
+    imap_service = resolve_keychain_service(
+        "EXECAS_IMAP_KEYCHAIN_SERVICE",
+        DEFAULT_IMAP_KEYCHAIN_SERVICE,
+    )
+
+    caldav_present = keychain_password_exists(service=caldav_service, account=caldav_account)
+    imap_present = keychain_password_exists(service=imap_service, account=imap_account)
+    print(
+        "caldav_keychain "
+        f"service={caldav_service} account={caldav_account} present={str(caldav_present).lower()}"
+    )
+    print(
+        "imap_keychain "
+        f"service={imap_service} account={imap_account} present={str(imap_present).lower()}"
+    )
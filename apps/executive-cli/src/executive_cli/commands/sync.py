@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import typer
+from rich import print
+from sqlmodel import Session
+
+from executive_cli.connectors.caldav import CalDavConnector
+from executive_cli.connectors.imap import ImapConnector
+from executive_cli.db import get_engine
+from executive_cli.sync_runner import run_hourly_sync
+from executive_cli.sync_service import IMAP_SCOPE_INBOX, sync_calendar_primary, sync_mailbox
+
+app = typer.Typer()
+
+
+@app.command("hourly")
+def sync_hourly(
+    retries: int = typer.Option(2, "--retries", min=0, help="Retry count per source after first attempt."),
+    backoff_sec: int = typer.Option(
+        5,
+        "--backoff-sec",
+        min=0,
+        help="Exponential backoff base in seconds (base * 2^attempt).",
+    ),
+    parallel: bool = typer.Option(
+        True,
+        "--parallel/--sequential",
+        help="Run calendar and mail sync concurrently (default) or sequentially.",
+    ),
+) -> None:
+    """Run calendar and mail sync with deterministic retries/backoff."""
+    outcome = run_hourly_sync(
+        run_calendar=lambda: _run_calendar_hourly_once(),
+        run_mail=lambda: _run_mail_hourly_once(),
+        retries=retries,
+        backoff_sec=backoff_sec,
+        parallel=parallel,
+    )
+
+    for source_outcome in (outcome.calendar, outcome.mail):
+        if source_outcome.success:
+            print(
+                f"[green]{source_outcome.source} sync ok.[/green] "
+                f"attempts={source_outcome.attempts} elapsed_sec={source_outcome.elapsed_sec:.2f}"
+            )
+            continue
+
+        reason = source_outcome.reason or "unknown"
+        print(
+            f"[yellow]{source_outcome.source} degraded.[/yellow] "
+            f"attempts={source_outcome.attempts} elapsed_sec={source_outcome.elapsed_sec:.2f} reason={reason}"
+        )
+        if source_outcome.source == "calendar":
+            print(
+                "Fallback: use manual input via "
+                "execas busy add --date YYYY-MM-DD --start HH:MM --end HH:MM --title \"...\""
+            )
+        else:
+            print(
+                "Fallback: create follow-up manually via "
+                'execas task capture "Email follow-up" --estimate 30 --priority P2 --status NEXT'
+            )
+
+    if outcome.exit_code == 0:
+        print(
+            "[green]Hourly sync complete.[/green] "
+            f"status=ok mode={'parallel' if parallel else 'sequential'} elapsed_sec={outcome.elapsed_sec:.2f}"
+        )
+        return
+    if outcome.exit_code == 2:
+        print(
+            "[yellow]Hourly sync complete.[/yellow] "
+            f"status=degraded mode={'parallel' if parallel else 'sequential'} elapsed_sec={outcome.elapsed_sec:.2f}"
+        )
+        raise typer.Exit(code=2)
+
+    print(
+        "[red]Hourly sync failed.[/red] "
+        f"status=degraded mode={'parallel' if parallel else 'sequential'} elapsed_sec={outcome.elapsed_sec:.2f}"
+    )
+    raise typer.Exit(code=1)
+
+
+def _run_calendar_hourly_once() -> None:
+    with Session(get_engine(ensure_directory=True)) as session:
+        sync_calendar_primary(session, connector=CalDavConnector.from_env())
+
+
+def _run_mail_hourly_once() -> None:
+    with Session(get_engine(ensure_directory=True)) as session:
+        sync_mailbox(
+            session,
+            connector=ImapConnector.from_env(),
+            mailbox=IMAP_SCOPE_INBOX,
+        )
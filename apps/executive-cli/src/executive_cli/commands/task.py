@@ -0,0 +1,361 @@
+from __future__ import annotations
+
+import sqlalchemy as sa
+import typer
+from sqlmodel import Session, select
+
+from executive_cli.commands._common import format_task, get_user_timezone, parse_date, utc_now_iso
+from executive_cli.db import get_engine
+from executive_cli.models import (
+    Area,
+    Commitment,
+    Email,
+    Project,
+    Task,
+    TaskEmailLink,
+    TaskPriority,
+    TaskStatus,
+)
+from executive_cli.task_service import TaskServiceError, create_task_record
+from executive_cli.timeutil import dt_to_db, parse_local_dt
+
+app = typer.Typer()
+
+
+_STATUS_PRIORITY_ORDER = {s: i for i, s in enumerate(
+    [TaskStatus.NOW, TaskStatus.NEXT, TaskStatus.WAITING, TaskStatus.SOMEDAY, TaskStatus.DONE, TaskStatus.CANCELED]
+)}
+_PRIORITY_ORDER = {p: i for i, p in enumerate([TaskPriority.P1, TaskPriority.P2, TaskPriority.P3])}
+
+
+
+
+def _resolve_area_id(session: Session, area_name: str | None) -> int | None:
+    if area_name is None:
+        return None
+    area = session.exec(select(Area).where(Area.name == area_name.strip())).first()
+    if area is None:
+        raise typer.BadParameter(f'Area "{area_name.strip()}" not found.')
+    return area.id
+
+
+def _resolve_project_id(session: Session, project_name: str | None) -> int | None:
+    if project_name is None:
+        return None
+    proj = session.exec(select(Project).where(Project.name == project_name.strip())).first()
+    if proj is None:
+        raise typer.BadParameter(f'Project "{project_name.strip()}" not found.')
+    return proj.id
+
+
+def _resolve_commitment_id(session: Session, commitment_id: str | None) -> str | None:
+    if commitment_id is None:
+        return None
+    c = session.get(Commitment, commitment_id.strip())
+    if c is None:
+        raise typer.BadParameter(f'Commitment "{commitment_id.strip()}" not found.')
+    return c.id
+
+
+@app.command("capture")
+def task_capture(
+    title: str | None = typer.Argument(None, help="Task title."),
+    estimate: int | None = typer.Option(None, "--estimate", help="Estimate in minutes (>0)."),
+    priority: str | None = typer.Option(None, "--priority", help="Priority: P1, P2, or P3."),
+    status: str = typer.Option("NEXT", "--status", help="Initial status (NOW, NEXT, SOMEDAY)."),
+    from_email: int | None = typer.Option(None, "--from-email", help="Create a task from email ID."),
+    area_name: str | None = typer.Option(None, "--area", help="Area name."),
+    project_name: str | None = typer.Option(None, "--project", help="Project name."),
+    commitment_id: str | None = typer.Option(None, "--commitment", help="Commitment ID."),
+    due: str | None = typer.Option(None, "--due", help="Due date YYYY-MM-DD."),
+) -> None:
+    """Capture a new task or create one from email metadata with automatic origin link."""
+    if from_email is not None and from_email <= 0:
+        raise typer.BadParameter("--from-email must be a positive integer.")
+
+    if from_email is None and title is None:
+        raise typer.BadParameter("Task title is required unless --from-email is provided.")
+
+    if estimate is None:
+        if from_email is None:
+            raise typer.BadParameter("--estimate is required unless --from-email is provided.")
+        estimate = 30
+    if estimate <= 0:
+        raise typer.BadParameter("--estimate must be > 0.")
+
+    if priority is None:
+        if from_email is None:
+            raise typer.BadParameter("--priority is required unless --from-email is provided.")
+        priority = TaskPriority.P2.value
+    priority_upper = priority.strip().upper()
+    try:
+        parsed_priority = TaskPriority(priority_upper)
+    except ValueError:
+        raise typer.BadParameter(f"Invalid --priority: {priority}. Must be P1, P2, or P3.")
+
+    status_upper = status.strip().upper()
+    allowed_capture_statuses = {TaskStatus.NOW, TaskStatus.NEXT, TaskStatus.SOMEDAY}
+    try:
+        parsed_status = TaskStatus(status_upper)
+    except ValueError:
+        raise typer.BadParameter(f"Invalid --status: {status}. Must be NOW, NEXT, or SOMEDAY.")
+    if parsed_status not in allowed_capture_statuses:
+        raise typer.BadParameter(f"Cannot capture with status {status_upper}. Use NOW, NEXT, or SOMEDAY.")
+
+    due_date = parse_date(due) if due else None
+
+    now = utc_now_iso()
+
+    with Session(get_engine(ensure_directory=True)) as session:
+        area_id = _resolve_area_id(session, area_name)
+        project_id = _resolve_project_id(session, project_name)
+        cmt_id = _resolve_commitment_id(session, commitment_id)
+
+        resolved_title: str
+        if title is not None and title.strip():
+            resolved_title = title.strip()
+        elif from_email is not None:
+            email_row = session.get(Email, from_email)
+            if email_row is None:
+                raise typer.BadParameter(f"Email {from_email} not found.")
+            resolved_title = (email_row.subject or "").strip() or "Email follow-up"
+        else:
+            raise typer.BadParameter("Task title must not be empty.")
+
+        try:
+            task = create_task_record(
+                session,
+                title=resolved_title,
+                status=parsed_status,
+                priority=parsed_priority,
+                estimate_min=estimate,
+                due_date=due_date,
+                area_id=area_id,
+                project_id=project_id,
+                commitment_id=cmt_id,
+                now_iso=now,
+                from_email_id=from_email,
+            )
+        except TaskServiceError as exc:
+            session.rollback()
+            raise typer.BadParameter(str(exc)) from exc
+
+        try:
+            session.commit()
+        except sa.exc.IntegrityError as exc:
+            session.rollback()
+            raise typer.BadParameter(
+                f"Task {task.id} is already linked to email {from_email}."
+            ) from exc
+        session.refresh(task)
+        typer.echo(format_task(task))
+
+
+@app.command("link-email")
+def task_link_email(
+    task_id: int = typer.Argument(..., help="Task ID."),
+    email_id: int = typer.Argument(..., help="Email ID."),
+    link_type: str = typer.Option(
+        "reference",
+        "--type",
+        help="Link type: origin | reference | follow_up.",
+    ),
+) -> None:
+    """Link an existing task to an email record."""
+    normalized_type = link_type.strip().lower()
+    allowed_types = {"origin", "reference", "follow_up"}
+    if normalized_type not in allowed_types:
+        raise typer.BadParameter("Invalid --type. Must be one of: origin, reference, follow_up.")
+
+    with Session(get_engine(ensure_directory=True)) as session:
+        task = session.get(Task, task_id)
+        if task is None:
+            raise typer.BadParameter(f"Task {task_id} not found.")
+        email = session.get(Email, email_id)
+        if email is None:
+            raise typer.BadParameter(f"Email {email_id} not found.")
+
+        session.add(
+            TaskEmailLink(
+                task_id=task_id,
+                email_id=email_id,
+                link_type=normalized_type,
+                created_at=utc_now_iso(),
+            )
+        )
+        try:
+            session.commit()
+        except sa.exc.IntegrityError as exc:
+            session.rollback()
+            raise typer.BadParameter(f"Task {task_id} is already linked to email {email_id}.") from exc
+
+    typer.echo(f'task_id={task_id} email_id={email_id} type="{normalized_type}"')
+
+
+@app.command("list")
+def task_list(
+    status: str | None = typer.Option(None, "--status", help="Filter by status."),
+    area_name: str | None = typer.Option(None, "--area", help="Filter by area name."),
+    project_name: str | None = typer.Option(None, "--project", help="Filter by project name."),
+    commitment_id: str | None = typer.Option(None, "--commitment", help="Filter by commitment ID."),
+    due: str | None = typer.Option(None, "--due", help="Filter by due date YYYY-MM-DD."),
+) -> None:
+    """List tasks with optional filters, sorted by status/priority/due/id."""
+    with Session(get_engine(ensure_directory=True)) as session:
+        query = select(Task)
+
+        if status is not None:
+            status_upper = status.strip().upper()
+            try:
+                parsed_status = TaskStatus(status_upper)
+            except ValueError:
+                raise typer.BadParameter(f"Invalid --status: {status}.")
+            query = query.where(Task.status == parsed_status)
+
+        if area_name is not None:
+            area_id = _resolve_area_id(session, area_name)
+            query = query.where(Task.area_id == area_id)
+
+        if project_name is not None:
+            project_id = _resolve_project_id(session, project_name)
+            query = query.where(Task.project_id == project_id)
+
+        if commitment_id is not None:
+            cmt_id = _resolve_commitment_id(session, commitment_id)
+            query = query.where(Task.commitment_id == cmt_id)
+
+        if due is not None:
+            due_date = parse_date(due)
+            query = query.where(Task.due_date == due_date)
+
+        tasks = session.exec(query).all()
+
+    if not tasks:
+        typer.echo("No tasks.")
+        return
+
+    # Sort in Python: status order, priority order, due_date (nulls last), id
+    def sort_key(t: Task):
+        due_sort = (0, t.due_date.isoformat()) if t.due_date else (1, "")
+        return (
+            _STATUS_PRIORITY_ORDER.get(TaskStatus(t.status), 99),
+            _PRIORITY_ORDER.get(TaskPriority(t.priority), 99),
+            due_sort,
+            t.id or 0,
+        )
+
+    tasks_sorted = sorted(tasks, key=sort_key)
+    for t in tasks_sorted:
+        typer.echo(format_task(t))
+
+
+@app.command("show")
+def task_show(
+    task_id: int = typer.Argument(..., help="Task ID."),
+) -> None:
+    """Show one task and its linked email metadata."""
+    with Session(get_engine(ensure_directory=True)) as session:
+        task = session.get(Task, task_id)
+        if task is None:
+            raise typer.BadParameter(f"Task {task_id} not found.")
+
+        links = session.exec(
+            select(TaskEmailLink, Email)
+            .join(Email, TaskEmailLink.email_id == Email.id)
+            .where(TaskEmailLink.task_id == task_id)
+            .order_by(TaskEmailLink.created_at, TaskEmailLink.id)
+        ).all()
+
+    typer.echo(format_task(task))
+    if not links:
+        typer.echo("Linked emails: none")
+        return
+
+    typer.echo("Linked emails:")
+    for link, email in links:
+        sender = email.sender or "-"
+        received_at = email.received_at or "-"
+        subject = email.subject or "-"
+        typer.echo(
+            f'- email_id={email.id} type={link.link_type} sender="{sender}" '
+            f'received_at="{received_at}" subject="{subject}"'
+        )
+
+
+@app.command("move")
+def task_move(
+    task_id: int = typer.Argument(..., help="Task ID."),
+    status: str = typer.Option(..., "--status", help="New status."),
+) -> None:
+    """Change task status. Moving to WAITING requires execas task waiting instead."""
+    status_upper = status.strip().upper()
+    try:
+        parsed_status = TaskStatus(status_upper)
+    except ValueError:
+        raise typer.BadParameter(f"Invalid --status: {status}. Must be one of: {', '.join(s.value for s in TaskStatus)}.")
+
+    with Session(get_engine(ensure_directory=True)) as session:
+        task = session.get(Task, task_id)
+        if task is None:
+            raise typer.BadParameter(f"Task {task_id} not found.")
+
+        if parsed_status == TaskStatus.WAITING:
+            if not task.waiting_on or not task.ping_at:
+                raise typer.BadParameter(
+                    "Cannot move to WAITING without waiting_on and ping_at. "
+                    'Use: execas task waiting <id> --on "..." --ping "YYYY-MM-DD HH:MM"'
+                )
+
+        task.status = parsed_status
+        task.updated_at = utc_now_iso()
+        session.commit()
+        session.refresh(task)
+        typer.echo(format_task(task))
+
+
+@app.command("waiting")
+def task_waiting(
+    task_id: int = typer.Argument(..., help="Task ID."),
+    on: str = typer.Option(..., "--on", help="Who or what we are waiting on."),
+    ping: str = typer.Option(..., "--ping", help="Ping datetime YYYY-MM-DD HH:MM (settings timezone)."),
+) -> None:
+    """Set task to WAITING with waiting_on and ping_at."""
+    on_trimmed = on.strip()
+    if not on_trimmed:
+        raise typer.BadParameter("--on must not be empty.")
+
+    with Session(get_engine(ensure_directory=True)) as session:
+        user_tz, _ = get_user_timezone(session)
+        try:
+            ping_dt = parse_local_dt(ping.strip(), user_tz)
+        except ValueError as exc:
+            raise typer.BadParameter("Invalid --ping format. Expected 'YYYY-MM-DD HH:MM'.") from exc
+
+        task = session.get(Task, task_id)
+        if task is None:
+            raise typer.BadParameter(f"Task {task_id} not found.")
+
+        task.status = TaskStatus.WAITING
+        task.waiting_on = on_trimmed
+        task.ping_at = dt_to_db(ping_dt)
+        task.updated_at = utc_now_iso()
+        session.commit()
+        session.refresh(task)
+        typer.echo(format_task(task))
+
+
+@app.command("done")
+def task_done(
+    task_id: int = typer.Argument(..., help="Task ID."),
+) -> None:
+    """Mark a task as DONE (shortcut for move --status DONE)."""
+    with Session(get_engine(ensure_directory=True)) as session:
+        task = session.get(Task, task_id)
+        if task is None:
+            raise typer.BadParameter(f"Task {task_id} not found.")
+
+        task.status = TaskStatus.DONE
+        task.updated_at = utc_now_iso()
+        session.commit()
+        session.refresh(task)
+        typer.echo(format_task(task))
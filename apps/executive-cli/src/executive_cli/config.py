@@ -15,6 +15,8 @@ ALLOWED_SETTING_KEYS: set[str] = {
     "lunch_duration_min",
     "min_focus_block_min",
     "buffer_min",
+    "planner_engine",
+    "planner_time_budget_ms",
     "ingest_auto_threshold",
     "ingest_llm_provider",
     "ingest_llm_model",
@@ -24,12 +26,13 @@ ALLOWED_SETTING_KEYS: set[str] = {
 _HHMM_PATTERN = re.compile(r"^(?:[01]\d|2[0-3]):[0-5]\d$")
 _TIME_KEYS: set[str] = {"planning_start", "planning_end", "lunch_start"}
 _NON_NEGATIVE_INT_KEYS: set[str] = {"lunch_duration_min", "buffer_min"}
-_POSITIVE_INT_KEYS: set[str] = {"min_focus_block_min"}
+_POSITIVE_INT_KEYS: set[str] = {"min_focus_block_min", "planner_time_budget_ms"}
 _FLOAT_RANGE_KEYS: dict[str, tuple[float, float]] = {
     "ingest_auto_threshold": (0.0, 1.0),
     "ingest_llm_temperature": (0.0, 2.0),
 }
 _LLM_PROVIDER_VALUES: set[str] = {"anthropic", "openai", "local"}
+_PLANNER_ENGINE_VALUES: set[str] = {"greedy", "optimal"}
 
 
 def validate_setting(key: str, value: str) -> None:
@@ -61,6 +64,12 @@ def validate_setting(key: str, value: str) -> None:
             raise ValueError(f"Invalid value for {key}: must be an integer >= 1.")
         return
 
+    if key == "planner_engine":
+        if value.strip().lower() not in _PLANNER_ENGINE_VALUES:
+            allowed = ", ".join(sorted(_PLANNER_ENGINE_VALUES))
+            raise ValueError(f"Invalid value for {key}: must be one of {allowed}.")
+        return
+
     if key == "ingest_llm_provider":
         normalized = value.strip().lower()
         if normalized not in _LLM_PROVIDER_VALUES:
@@ -1,32 +1,67 @@
 from __future__ import annotations
 
 import base64
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+import json
 import logging
 import os
-from dataclasses import dataclass
-from datetime import datetime, time, timedelta, timezone
-from typing import Protocol
+import re
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterator, Protocol, TypeVar
 from urllib.error import HTTPError, URLError
-from urllib.parse import urljoin, urlparse
-from urllib.request import Request, urlopen
+from urllib.parse import unquote, urljoin, urlparse
+from urllib.request import Request
 import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape as xml_escape
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from dateutil.rrule import rrulestr
+from executive_cli.connectors.ical import (
+    EventFields,
+    FieldValue,
+    all_fields,
+    decode_text,
+    first_field,
+    iter_vevent_lines,
+    parse_fields,
+    parse_ical_dt,
+    parse_ical_dt_list,
+)
+from executive_cli.connectors.href_index import CalendarHrefIndex
+from executive_cli.connectors.recurrence_cache import RecurrenceExpansionCache, hash_recurrence_lines
+from executive_cli.http_pool import urlopen
+from executive_cli.paths import get_db_path
 from executive_cli.secret_store import (
     DEFAULT_CALDAV_KEYCHAIN_SERVICE,
     load_password_from_keychain,
 )
 
 logger = logging.getLogger(__name__)
+_T = TypeVar("_T")
+_N = TypeVar("_N", int, float)
 _SYNC_LOOKBACK_DAYS_DEFAULT = 30
 _SYNC_LOOKAHEAD_DAYS_DEFAULT = 365
+_MULTIGET_BATCH_SIZE = 100
+_SYNC_COLLECTION_MAX_ROUNDS = 20
+_MAX_WORKERS_DEFAULT = 4
+_STREAM_CHUNK_SIZE = 64 * 1024
+_EXPANSION_CACHE_FILENAME = "caldav_expansion_cache.json"
+_HREF_INDEX_FILENAME = "caldav_href_index.json"
+_TIMEOUT_SEC_DEFAULT = 20.0
+SYNC_TOKEN_CURSOR_KIND = "sync_token"
 
 
 class CalendarConnectorError(RuntimeError):
     """Raised when calendar sync connector cannot read remote events."""
 
 
+class _SyncTokenInvalidError(CalendarConnectorError):
+    """Raised when the server rejects a stored sync-token (RFC 6578 valid-sync-token)."""
+
+
 @dataclass(frozen=True)
 class RemoteCalendarEvent:
     external_id: str
@@ -46,6 +81,12 @@ class CalendarSyncBatch:
     deleted_external_ids: tuple[str, ...] = ()
     coverage_start: datetime | None = None
     coverage_end: datetime | None = None
+    # Incremental batches only: series (collection prefix + UID) whose in-window instances were
+    # re-sent in full. Other live rows of these series inside the coverage window are stale.
+    replaced_series_ids: tuple[str, ...] = ()
+    # Full snapshots only: when set, the snapshot covers just the rows whose external_id starts
+    # with one of these collection prefixes (unchanged collections were skipped).
+    snapshot_id_prefixes: tuple[str, ...] = ()
 
 
 class CalendarConnector(Protocol):
@@ -64,7 +105,10 @@ class CalDavConnector:
     base_url: str
     username: str
     password: str
-    timeout_sec: float = 20.0
+    timeout_sec: float = _TIMEOUT_SEC_DEFAULT
+    max_workers: int = _MAX_WORKERS_DEFAULT
+    expansion_cache: RecurrenceExpansionCache | None = field(default=None, compare=False, repr=False)
+    href_index: CalendarHrefIndex = field(default_factory=CalendarHrefIndex, compare=False, repr=False)
 
     _NS_DAV = "DAV:"
     _NS_CALDAV = "urn:ietf:params:xml:ns:caldav"
@@ -74,6 +118,10 @@ class CalDavConnector:
         parsed = urlparse(self.base_url)
         if parsed.scheme.lower() != "https":
             raise CalendarConnectorError("CalDAV URL must use https://")
+        if self.max_workers <= 0:
+            raise CalendarConnectorError("CalDAV max workers must be >= 1.")
+        if self.timeout_sec <= 0:
+            raise CalendarConnectorError("CalDAV timeout must be > 0.")
 
     @classmethod
     def from_env(cls) -> CalDavConnector:
@@ -97,7 +145,15 @@ class CalDavConnector:
                 "'execas secret set-caldav'."
             )
 
-        return cls(base_url=base_url, username=username, password=password)
+        return cls(
+            base_url=base_url,
+            username=username,
+            password=password,
+            timeout_sec=_read_positive_env("EXECAS_CALDAV_TIMEOUT_SEC", _TIMEOUT_SEC_DEFAULT),
+            max_workers=_read_positive_env("EXECAS_CALDAV_MAX_WORKERS", _MAX_WORKERS_DEFAULT),
+            expansion_cache=_build_expansion_cache(),
+            href_index=CalendarHrefIndex(get_db_path().parent / _HREF_INDEX_FILENAME),
+        )
 
     def fetch_events(
         self,
@@ -108,18 +164,59 @@ class CalDavConnector:
         timezone_name: str,
     ) -> CalendarSyncBatch:
         del calendar_slug
+        try:
+            batch = self._fetch_events(cursor=cursor, cursor_kind=cursor_kind, timezone_name=timezone_name)
+            self.href_index.save()
+            return batch
+        finally:
+            if self.expansion_cache is not None:
+                self.expansion_cache.save()
+
+    def _fetch_events(
+        self,
+        *,
+        cursor: str | None,
+        cursor_kind: str | None,
+        timezone_name: str,
+    ) -> CalendarSyncBatch:
         window_start, window_end = _build_sync_window()
         collection_urls = self._resolve_collection_urls()
-        ctag_parts: list[str] = []
-        for collection_url in collection_urls:
-            collection_props = self._fetch_collection_props(collection_url=collection_url)
-            ctag_value = collection_props.get("ctag") or "-"
-            ctag_parts.append(f"{collection_url}::{ctag_value}")
+        props_by_url = dict(
+            zip(
+                collection_urls,
+                self._map_collections(
+                    lambda collection_url: self._fetch_collection_props(collection_url=collection_url),
+                    collection_urls,
+                ),
+            )
+        )
+
+        sync_tokens = {url: props.get("sync_token") for url, props in props_by_url.items()}
+        if collection_urls and all(sync_tokens.values()):
+            return self._fetch_events_by_sync_token(
+                collection_urls=collection_urls,
+                current_tokens={url: token for url, token in sync_tokens.items() if token},
+                cursor=cursor,
+                cursor_kind=cursor_kind,
+                timezone_name=timezone_name,
+                window_start=window_start,
+                window_end=window_end,
+            )
 
-        multi_cursor = "|".join(sorted(ctag_parts)) if ctag_parts else None
+        current_ctags = {
+            collection_url: props_by_url[collection_url].get("ctag") or "-"
+            for collection_url in collection_urls
+        }
+        multi_cursor = _format_ctag_cursor(current_ctags) if current_ctags else None
         multi_cursor_kind = "multi_ctag" if len(collection_urls) > 1 else "ctag"
 
-        if multi_cursor and cursor and cursor_kind == multi_cursor_kind and cursor == multi_cursor:
+        # Refetch only collections whose ctag moved; a changed collection set forces a full refresh
+        # so rows of collections that are no longer discovered get soft-deleted.
+        previous_ctags = _parse_ctag_cursor(cursor) if cursor_kind == multi_cursor_kind else {}
+        known_collections = bool(previous_ctags) and set(previous_ctags) == set(collection_urls)
+        changed_urls = [url for url in collection_urls if previous_ctags.get(url) != current_ctags[url]]
+
+        if multi_cursor and known_collections and not changed_urls:
             return CalendarSyncBatch(
                 events=[],
                 cursor=multi_cursor,
@@ -127,27 +224,324 @@ class CalDavConnector:
                 full_snapshot=False,
             )
 
-        events_by_external_id: dict[str, RemoteCalendarEvent] = {}
-        for collection_url in collection_urls:
-            collection_events = self._fetch_full_snapshot(
+        partial = known_collections and len(changed_urls) < len(collection_urls)
+        snapshot_urls = changed_urls if partial else collection_urls
+
+        return CalendarSyncBatch(
+            events=self._fetch_snapshot_events(
+                collection_urls=snapshot_urls,
+                timezone_name=timezone_name,
+                window_start=window_start,
+                window_end=window_end,
+            ),
+            cursor=multi_cursor,
+            cursor_kind=multi_cursor_kind if multi_cursor else cursor_kind,
+            full_snapshot=True,
+            coverage_start=window_start,
+            coverage_end=window_end,
+            snapshot_id_prefixes=(
+                tuple(_collection_identity(url) for url in snapshot_urls) if partial else ()
+            ),
+        )
+
+    def _fetch_snapshot_events(
+        self,
+        *,
+        collection_urls: list[str],
+        timezone_name: str,
+        window_start: datetime,
+        window_end: datetime,
+    ) -> list[RemoteCalendarEvent]:
+        snapshots = self._map_collections(
+            lambda collection_url: self._fetch_full_snapshot(
                 collection_url=collection_url,
                 timezone_name=timezone_name,
                 window_start=window_start,
                 window_end=window_end,
                 external_id_prefix=_collection_identity(collection_url),
-            )
+            ),
+            collection_urls,
+        )
+        # Merge in collection order so duplicate ids resolve the same way as a sequential fetch.
+        events_by_external_id: dict[str, RemoteCalendarEvent] = {}
+        for collection_events in snapshots:
             for event in collection_events:
                 events_by_external_id[event.external_id] = event
+        return sorted(events_by_external_id.values(), key=lambda event: event.external_id)
+
+    def _map_collections(self, fn: Callable[[str], _T], collection_urls: list[str]) -> list[_T]:
+        """Run one collection-level request per URL on a bounded pool; results keep input order."""
+        workers = min(self.max_workers, len(collection_urls))
+        if workers <= 1:
+            return [fn(collection_url) for collection_url in collection_urls]
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="execas-caldav") as pool:
+            return list(pool.map(fn, collection_urls))
 
+    def _fetch_events_by_sync_token(
+        self,
+        *,
+        collection_urls: list[str],
+        current_tokens: dict[str, str],
+        cursor: str | None,
+        cursor_kind: str | None,
+        timezone_name: str,
+        window_start: datetime,
+        window_end: datetime,
+    ) -> CalendarSyncBatch:
+        previous_tokens = _parse_sync_token_cursor(cursor) if cursor_kind == SYNC_TOKEN_CURSOR_KIND else {}
+        if set(previous_tokens) == set(collection_urls):
+            try:
+                return self._fetch_sync_collection_delta(
+                    collection_urls=collection_urls,
+                    current_tokens=current_tokens,
+                    previous_tokens=previous_tokens,
+                    timezone_name=timezone_name,
+                    window_start=window_start,
+                    window_end=window_end,
+                )
+            except _SyncTokenInvalidError:
+                logger.warning("caldav_sync_token_invalid fallback=full_snapshot")
+
+        # Tokens are read before the snapshot, so changes racing the fetch are re-reported next run.
         return CalendarSyncBatch(
-            events=sorted(events_by_external_id.values(), key=lambda event: event.external_id),
-            cursor=multi_cursor,
-            cursor_kind=multi_cursor_kind if multi_cursor else cursor_kind,
+            events=self._fetch_snapshot_events(
+                collection_urls=collection_urls,
+                timezone_name=timezone_name,
+                window_start=window_start,
+                window_end=window_end,
+            ),
+            cursor=_format_sync_token_cursor(current_tokens),
+            cursor_kind=SYNC_TOKEN_CURSOR_KIND,
             full_snapshot=True,
             coverage_start=window_start,
             coverage_end=window_end,
         )
 
+    def _fetch_sync_collection_delta(
+        self,
+        *,
+        collection_urls: list[str],
+        current_tokens: dict[str, str],
+        previous_tokens: dict[str, str],
+        timezone_name: str,
+        window_start: datetime,
+        window_end: datetime,
+    ) -> CalendarSyncBatch:
+        # The PROPFIND already returned every token; an unchanged one means nothing to REPORT.
+        changed_urls = [url for url in collection_urls if current_tokens.get(url) != previous_tokens[url]]
+        deltas = self._map_collections(
+            lambda collection_url: self._fetch_collection_delta(
+                collection_url=collection_url,
+                sync_token=previous_tokens[collection_url],
+                timezone_name=timezone_name,
+                window_start=window_start,
+                window_end=window_end,
+            ),
+            changed_urls,
+        )
+
+        next_tokens = {url: previous_tokens[url] for url in collection_urls}
+        for collection_url, delta in zip(changed_urls, deltas):
+            next_tokens[collection_url] = delta.sync_token
+
+        if any(delta.unresolved_removals for delta in deltas):
+            # A batch is either incremental or a snapshot, so every changed collection is
+            # re-read; collections whose token did not move are left untouched.
+            logger.warning(
+                "caldav_sync_href_unresolved fallback=collection_snapshot collections=%d", len(changed_urls)
+            )
+            partial = len(changed_urls) < len(collection_urls)
+            return CalendarSyncBatch(
+                events=self._fetch_snapshot_events(
+                    collection_urls=changed_urls,
+                    timezone_name=timezone_name,
+                    window_start=window_start,
+                    window_end=window_end,
+                ),
+                cursor=_format_sync_token_cursor(next_tokens),
+                cursor_kind=SYNC_TOKEN_CURSOR_KIND,
+                full_snapshot=True,
+                coverage_start=window_start,
+                coverage_end=window_end,
+                snapshot_id_prefixes=(
+                    tuple(_collection_identity(url) for url in changed_urls) if partial else ()
+                ),
+            )
+
+        events_by_external_id: dict[str, RemoteCalendarEvent] = {}
+        deleted_series_ids: set[str] = set()
+        replaced_series_ids: set[str] = set()
+        for delta in deltas:
+            for event in delta.events:
+                events_by_external_id[event.external_id] = event
+            replaced_series_ids.update(delta.replaced_series_ids)
+            deleted_series_ids.update(delta.deleted_series_ids)
+
+        return CalendarSyncBatch(
+            events=sorted(events_by_external_id.values(), key=lambda event: event.external_id),
+            cursor=_format_sync_token_cursor(next_tokens),
+            cursor_kind=SYNC_TOKEN_CURSOR_KIND,
+            full_snapshot=False,
+            deleted_external_ids=tuple(sorted(deleted_series_ids - replaced_series_ids)),
+            coverage_start=window_start,
+            coverage_end=window_end,
+            replaced_series_ids=tuple(sorted(replaced_series_ids)),
+        )
+
+    def _fetch_collection_delta(
+        self,
+        *,
+        collection_url: str,
+        sync_token: str,
+        timezone_name: str,
+        window_start: datetime,
+        window_end: datetime,
+    ) -> _CollectionDelta:
+        changes = self._fetch_sync_collection_changes(collection_url=collection_url, sync_token=sync_token)
+        prefix = _collection_identity(collection_url)
+        removed_paths = [_normalize_href_path(collection_url, href) for href in changes.removed_hrefs]
+        if not self._knows_hrefs(prefix, removed_paths):
+            return _CollectionDelta(sync_token=changes.sync_token, unresolved_removals=True)
+
+        events: list[RemoteCalendarEvent] = []
+        replaced_series_ids: set[str] = set()
+        uids_by_href: dict[str, set[str]] = {}
+        for offset in range(0, len(changes.changed_hrefs), _MULTIGET_BATCH_SIZE):
+            objects = self._fetch_multiget(
+                collection_url=collection_url,
+                hrefs=changes.changed_hrefs[offset : offset + _MULTIGET_BATCH_SIZE],
+                timezone_name=timezone_name,
+                window_start=window_start,
+                window_end=window_end,
+                external_id_prefix=prefix,
+            )
+            events.extend(objects.events)
+            uids_by_href.update(objects.uids_by_href)
+            removed_paths.extend(_normalize_href_path(collection_url, href) for href in objects.missing_hrefs)
+        if not self._knows_hrefs(prefix, removed_paths):
+            return _CollectionDelta(sync_token=changes.sync_token, unresolved_removals=True)
+
+        # Removed resources carry no calendar data, so their UIDs come from the href index.
+        deleted_uids: set[str] = set()
+        for href_path in removed_paths:
+            deleted_uids.update(self.href_index.resolve(collection=prefix, href_path=href_path) or ())
+            self.href_index.forget(collection=prefix, href_path=href_path)
+        for href_path, uids in uids_by_href.items():
+            # A resource rewritten under a different UID drops the series it used to hold.
+            deleted_uids.update(set(self.href_index.resolve(collection=prefix, href_path=href_path) or ()) - uids)
+            replaced_series_ids.update(f"{prefix}{uid}" for uid in uids)
+            self.href_index.record(collection=prefix, href_path=href_path, uids=uids)
+
+        return _CollectionDelta(
+            sync_token=changes.sync_token,
+            events=events,
+            replaced_series_ids=replaced_series_ids,
+            deleted_series_ids={f"{prefix}{uid}" for uid in deleted_uids},
+        )
+
+    def _knows_hrefs(self, prefix: str, href_paths: list[str]) -> bool:
+        return all(
+            self.href_index.resolve(collection=prefix, href_path=href_path) is not None for href_path in href_paths
+        )
+
+    def _fetch_sync_collection_changes(self, *, collection_url: str, sync_token: str) -> _SyncCollectionChanges:
+        """Run RFC 6578 sync-collection REPORTs until the server stops truncating (HTTP 507)."""
+        collection_path = _normalize_href_path(collection_url, collection_url)
+        changed: dict[str, str] = {}
+        removed: dict[str, str] = {}
+        token = sync_token
+
+        for _ in range(_SYNC_COLLECTION_MAX_ROUNDS):
+            body = f"""<?xml version="1.0" encoding="utf-8"?>
+<d:sync-collection xmlns:d="DAV:">
+  <d:sync-token>{xml_escape(token)}</d:sync-token>
+  <d:sync-level>1</d:sync-level>
+  <d:prop>
+    <d:getetag />
+  </d:prop>
+</d:sync-collection>
+"""
+            payload = self._request_xml_url(collection_url, method="REPORT", depth="0", body=body)
+            root = self._parse_xml(payload)
+
+            truncated = False
+            for response in root.findall(f".//{{{self._NS_DAV}}}response"):
+                href = (response.findtext(f"{{{self._NS_DAV}}}href") or "").strip()
+                if not href:
+                    continue
+                path = _normalize_href_path(collection_url, href)
+                status = (response.findtext(f"{{{self._NS_DAV}}}status") or "").strip()
+                if path == collection_path:
+                    truncated = truncated or "507" in status
+                    continue
+                if "404" in status:
+                    changed.pop(path, None)
+                    removed[path] = href
+                    continue
+                removed.pop(path, None)
+                changed[path] = href
+
+            next_token = (root.findtext(f"{{{self._NS_DAV}}}sync-token") or "").strip()
+            if not next_token:
+                raise CalendarConnectorError("CalDAV sync-collection response is invalid.")
+            token = next_token
+            if not truncated:
+                break
+
+        return _SyncCollectionChanges(
+            sync_token=token,
+            changed_hrefs=sorted(changed.values()),
+            removed_hrefs=sorted(removed.values()),
+        )
+
+    def _fetch_multiget(
+        self,
+        *,
+        collection_url: str,
+        hrefs: list[str],
+        timezone_name: str,
+        window_start: datetime,
+        window_end: datetime,
+        external_id_prefix: str,
+    ) -> _MultigetResult:
+        href_elements = "\n".join(f"  <d:href>{xml_escape(href)}</d:href>" for href in hrefs)
+        body = f"""<?xml version="1.0" encoding="utf-8"?>
+<c:calendar-multiget xmlns:d="DAV:" xmlns:c="urn:ietf:params:xml:ns:caldav">
+  <d:prop>
+    <d:getetag />
+    <c:calendar-data />
+  </d:prop>
+{href_elements}
+</c:calendar-multiget>
+"""
+        payload = self._request_xml_url(collection_url, method="REPORT", depth="1", body=body)
+        root = self._parse_xml(payload)
+        default_timezone = _resolve_default_timezone(timezone_name)
+
+        pending = {_normalize_href_path(collection_url, href): href for href in hrefs}
+        events: list[RemoteCalendarEvent] = []
+        uids_by_href: dict[str, set[str]] = {}
+        for response in root.findall(f".//{{{self._NS_DAV}}}response"):
+            etag, calendar_data = self._extract_event_payload(response)
+            if calendar_data is None:
+                continue
+            href = (response.findtext(f"{{{self._NS_DAV}}}href") or "").strip()
+            href_path = _normalize_href_path(collection_url, href)
+            pending.pop(href_path, None)
+            uids_by_href[href_path] = _extract_ical_uids(calendar_data)
+            events.extend(
+                self._build_remote_events(
+                    calendar_data=calendar_data,
+                    etag=etag,
+                    default_timezone=default_timezone,
+                    window_start=window_start,
+                    window_end=window_end,
+                    external_id_prefix=external_id_prefix,
+                )
+            )
+
+        return _MultigetResult(events=events, uids_by_href=uids_by_href, missing_hrefs=sorted(pending.values()))
+
     def _resolve_collection_urls(self) -> list[str]:
         parsed = urlparse(self.base_url)
         if parsed.path and parsed.path != "/":
@@ -166,10 +560,6 @@ class CalDavConnector:
             return [fallback]
         return collection_urls
 
-    def _resolve_collection_url(self) -> str:
-        urls = self._resolve_collection_urls()
-        return urls[0]
-
     def _discover_calendar_home_url(self, root_url: str) -> str | None:
         root_body = """<?xml version="1.0" encoding="utf-8"?>
 <d:propfind xmlns:d="DAV:" xmlns:c="urn:ietf:params:xml:ns:caldav">
@@ -346,57 +736,93 @@ class CalDavConnector:
         external_id_prefix: str = "",
         collection_url: str | None = None,
     ) -> list[RemoteCalendarEvent]:
-        body = """<?xml version="1.0" encoding="utf-8"?>
-<d:propfind xmlns:d="DAV:" xmlns:c="urn:ietf:params:xml:ns:caldav">
-  <d:prop>
-    <d:getetag />
-    <c:calendar-data />
-  </d:prop>
-</d:propfind>
-"""
+        body = _build_calendar_query_body(window_start=window_start, window_end=window_end)
         target_url = collection_url or self.base_url
-        if target_url == self.base_url:
-            payload = self._request_xml(method="PROPFIND", depth="1", body=body)
-        else:
-            payload = self._request_xml_url(
-                target_url,
-                method="PROPFIND",
-                depth="1",
-                body=body,
-            )
-        root = self._parse_xml(payload)
-
-        try:
-            default_timezone = ZoneInfo(timezone_name)
-        except ZoneInfoNotFoundError:
-            default_timezone = timezone.utc
+        default_timezone = _resolve_default_timezone(timezone_name)
         window_start_value = window_start or datetime.min.replace(tzinfo=timezone.utc)
         window_end_value = window_end or datetime.max.replace(tzinfo=timezone.utc)
 
+        # Stream the multistatus so only one <d:response> (and its iCal text) is held at a time.
         events_by_external_id: dict[str, RemoteCalendarEvent] = {}
-        for response in root.findall(f".//{{{self._NS_DAV}}}response"):
-            etag, calendar_data = self._extract_event_payload(response)
-            if calendar_data is None:
-                continue
+        uids_by_href: dict[str, set[str]] = {}
+        with self._open_xml_url(target_url, method="REPORT", depth="1", body=body) as stream:
+            for response in self._iter_multistatus_responses(stream):
+                etag, calendar_data = self._extract_event_payload(response)
+                if calendar_data is None:
+                    continue
+                href = (response.findtext(f"{{{self._NS_DAV}}}href") or "").strip()
+                if href:
+                    uids_by_href[_normalize_href_path(target_url, href)] = _extract_ical_uids(calendar_data)
+
+                for event in self._build_remote_events(
+                    calendar_data=calendar_data,
+                    etag=etag,
+                    default_timezone=default_timezone,
+                    window_start=window_start_value,
+                    window_end=window_end_value,
+                    external_id_prefix=external_id_prefix,
+                ):
+                    events_by_external_id[event.external_id] = event
 
+        self.href_index.replace_collection(collection=external_id_prefix, uids_by_href=uids_by_href)
+        return sorted(events_by_external_id.values(), key=lambda event: event.external_id)
+
+    def _iter_multistatus_responses(self, stream: BinaryIO) -> Iterator[ET.Element]:
+        """Yield each ``<d:response>`` of a multistatus body as soon as it is complete.
+
+        Yielded elements are cleared once the caller moves on, so the tree never grows
+        beyond a single response.
+        """
+        response_tag = f"{{{self._NS_DAV}}}response"
+        parser = ET.XMLPullParser(events=("start", "end"))
+        root: ET.Element | None = None
+        depth = 0
+        try:
+            while chunk := stream.read(_STREAM_CHUNK_SIZE):
+                parser.feed(chunk)
+                for event, element in parser.read_events():
+                    if event == "start":
+                        if root is None:
+                            root = element
+                        depth += 1
+                        continue
+                    depth -= 1
+                    # Only direct children of <d:multistatus> are responses to yield.
+                    if element.tag == response_tag and depth == 1:
+                        yield element
+                        root.remove(element)
+            parser.close()
+        except ET.ParseError:
+            raise CalendarConnectorError("CalDAV response is invalid.") from None
+
+    def _build_remote_events(
+        self,
+        *,
+        calendar_data: str,
+        etag: str | None,
+        default_timezone: ZoneInfo | timezone,
+        window_start: datetime,
+        window_end: datetime,
+        external_id_prefix: str,
+    ) -> list[RemoteCalendarEvent]:
+        return [
+            RemoteCalendarEvent(
+                external_id=item.external_id,
+                start_dt=item.start_dt,
+                end_dt=item.end_dt,
+                title=item.title,
+                external_etag=etag,
+                external_modified_at=item.external_modified_at,
+            )
             for item in _parse_ical_events(
                 calendar_data=calendar_data,
                 default_timezone=default_timezone,
-                window_start=window_start_value,
-                window_end=window_end_value,
+                window_start=window_start,
+                window_end=window_end,
                 external_id_prefix=external_id_prefix,
-            ):
-                event = RemoteCalendarEvent(
-                    external_id=item.external_id,
-                    start_dt=item.start_dt,
-                    end_dt=item.end_dt,
-                    title=item.title,
-                    external_etag=etag,
-                    external_modified_at=item.external_modified_at,
-                )
-                events_by_external_id[event.external_id] = event
-
-        return sorted(events_by_external_id.values(), key=lambda event: event.external_id)
+                expansion_cache=self.expansion_cache,
+            )
+        ]
 
     def _extract_event_payload(self, response: ET.Element) -> tuple[str | None, str | None]:
         etag: str | None = None
@@ -420,8 +846,21 @@ class CalDavConnector:
         return self._request_xml_url(self.base_url, method=method, depth=depth, body=body)
 
     def _request_xml_url(self, url: str, *, method: str, depth: str, body: str) -> bytes:
+        request = self._build_xml_request(url, method=method, depth=depth, body=body)
+        with _map_transport_errors():
+            with urlopen(request, timeout=self.timeout_sec) as response:
+                return response.read()
+
+    @contextmanager
+    def _open_xml_url(self, url: str, *, method: str, depth: str, body: str) -> Iterator[BinaryIO]:
+        request = self._build_xml_request(url, method=method, depth=depth, body=body)
+        with _map_transport_errors():
+            with urlopen(request, timeout=self.timeout_sec, stream=True) as response:
+                yield response
+
+    def _build_xml_request(self, url: str, *, method: str, depth: str, body: str) -> Request:
         auth = base64.b64encode(f"{self.username}:{self.password}".encode("utf-8")).decode("ascii")
-        request = Request(
+        return Request(
             url,
             data=body.encode("utf-8"),
             method=method,
@@ -432,18 +871,22 @@ class CalDavConnector:
             },
         )
 
-        try:
-            with urlopen(request, timeout=self.timeout_sec) as response:
-                return response.read()
-        except HTTPError as exc:
-            if exc.code in (401, 403):
-                logger.warning("caldav_auth_failed status=%s", exc.code)
-                raise CalendarConnectorError("CalDAV authentication failed.") from None
-            raise CalendarConnectorError(f"CalDAV request failed with HTTP {exc.code}.") from None
-        except URLError:
-            raise CalendarConnectorError("CalDAV endpoint is unreachable.") from None
-        except TimeoutError:
-            raise CalendarConnectorError("CalDAV request timed out.") from None
+
+@contextmanager
+def _map_transport_errors() -> Iterator[None]:
+    try:
+        yield
+    except HTTPError as exc:
+        if exc.code in (403, 409) and _is_invalid_sync_token_error(exc):
+            raise _SyncTokenInvalidError("CalDAV sync-token is no longer valid.") from None
+        if exc.code in (401, 403):
+            logger.warning("caldav_auth_failed status=%s", exc.code)
+            raise CalendarConnectorError("CalDAV authentication failed.") from None
+        raise CalendarConnectorError(f"CalDAV request failed with HTTP {exc.code}.") from None
+    except URLError:
+        raise CalendarConnectorError("CalDAV endpoint is unreachable.") from None
+    except TimeoutError:
+        raise CalendarConnectorError("CalDAV request timed out.") from None
 
 
 @dataclass(frozen=True)
@@ -455,7 +898,80 @@ class _ParsedEvent:
     external_modified_at: str | None
 
 
-_FieldValue = tuple[dict[str, str], str]
+@dataclass(frozen=True)
+class _SyncCollectionChanges:
+    sync_token: str
+    changed_hrefs: list[str]
+    removed_hrefs: list[str]
+
+
+@dataclass(frozen=True)
+class _CollectionDelta:
+    sync_token: str
+    events: list[RemoteCalendarEvent] = field(default_factory=list)
+    replaced_series_ids: set[str] = field(default_factory=set)
+    deleted_series_ids: set[str] = field(default_factory=set)
+    # Set when a removed href is missing from the href index; the collection needs a snapshot.
+    unresolved_removals: bool = False
+
+
+@dataclass(frozen=True)
+class _MultigetResult:
+    events: list[RemoteCalendarEvent]
+    uids_by_href: dict[str, set[str]]
+    missing_hrefs: list[str]
+
+
+def _resolve_default_timezone(timezone_name: str) -> ZoneInfo | timezone:
+    try:
+        return ZoneInfo(timezone_name)
+    except ZoneInfoNotFoundError:
+        return timezone.utc
+
+
+def _is_invalid_sync_token_error(exc: HTTPError) -> bool:
+    try:
+        body = exc.read() or b""
+    except Exception:
+        return False
+    return b"valid-sync-token" in body
+
+
+def _format_ctag_cursor(ctags: dict[str, str]) -> str:
+    return "|".join(sorted(f"{url}::{ctag}" for url, ctag in ctags.items()))
+
+
+def _parse_ctag_cursor(cursor: str | None) -> dict[str, str]:
+    """Split a ``<url>::<ctag>|<url>::<ctag>`` cursor into a per-collection ctag map."""
+    if not cursor:
+        return {}
+    ctags: dict[str, str] = {}
+    for entry in re.split(r"\|(?=https?://)", cursor):
+        url, separator, ctag = entry.rpartition("::")
+        if separator and url:
+            ctags[url] = ctag
+    return ctags
+
+
+def _parse_sync_token_cursor(cursor: str | None) -> dict[str, str]:
+    if not cursor:
+        return {}
+    try:
+        parsed = json.loads(cursor)
+    except json.JSONDecodeError:
+        return {}
+    if not isinstance(parsed, dict):
+        return {}
+    return {str(url): str(token) for url, token in parsed.items() if url and token}
+
+
+def _format_sync_token_cursor(tokens: dict[str, str]) -> str:
+    # Sync tokens are opaque URIs, so they are stored as a JSON object keyed by collection URL.
+    return json.dumps(dict(sorted(tokens.items())), separators=(",", ":"))
+
+
+def _normalize_href_path(base_url: str, href: str) -> str:
+    return unquote(urlparse(urljoin(base_url, href)).path).rstrip("/")
 
 
 def _build_sync_window() -> tuple[datetime, datetime]:
@@ -474,6 +990,64 @@ def _build_sync_window() -> tuple[datetime, datetime]:
     )
 
 
+def _build_calendar_query_body(
+    *,
+    window_start: datetime | None,
+    window_end: datetime | None,
+) -> str:
+    """Build a calendar-query REPORT body limited to VEVENTs overlapping the sync window."""
+    time_range = ""
+    if window_start is not None or window_end is not None:
+        attrs = []
+        if window_start is not None:
+            attrs.append(f'start="{_format_caldav_utc(window_start)}"')
+        if window_end is not None:
+            attrs.append(f'end="{_format_caldav_utc(window_end)}"')
+        time_range = f"\n        <c:time-range {' '.join(attrs)} />"
+    return f"""<?xml version="1.0" encoding="utf-8"?>
+<c:calendar-query xmlns:d="DAV:" xmlns:c="urn:ietf:params:xml:ns:caldav">
+  <d:prop>
+    <d:getetag />
+    <c:calendar-data />
+  </d:prop>
+  <c:filter>
+    <c:comp-filter name="VCALENDAR">
+      <c:comp-filter name="VEVENT">{time_range}
+      </c:comp-filter>
+    </c:comp-filter>
+  </c:filter>
+</c:calendar-query>
+"""
+
+
+def _format_caldav_utc(value: datetime) -> str:
+    return value.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _build_expansion_cache() -> RecurrenceExpansionCache | None:
+    value = (os.getenv("EXECAS_CALDAV_EXPANSION_CACHE") or "").strip()
+    if value.lower() in {"off", "0", "false"}:
+        return None
+    if value:
+        return RecurrenceExpansionCache(Path(value).expanduser())
+    return RecurrenceExpansionCache(get_db_path().parent / _EXPANSION_CACHE_FILENAME)
+
+
+def _read_positive_env(env_var: str, default: _N) -> _N:
+    value = (os.getenv(env_var) or "").strip()
+    if not value:
+        return default
+    try:
+        parsed = type(default)(value)
+    except ValueError:
+        logger.warning("caldav_tuning_invalid env=%s value=%s", env_var, value)
+        return default
+    if parsed <= 0:
+        logger.warning("caldav_tuning_invalid env=%s value=%s", env_var, value)
+        return default
+    return parsed
+
+
 def _read_sync_window_days(env_var: str, default: int) -> int:
     value = (os.getenv(env_var) or "").strip()
     if not value:
@@ -496,79 +1070,33 @@ def _parse_ical_events(
     window_start: datetime | None = None,
     window_end: datetime | None = None,
     external_id_prefix: str = "",
+    expansion_cache: RecurrenceExpansionCache | None = None,
 ) -> list[_ParsedEvent]:
     window_start_value = window_start or datetime.min.replace(tzinfo=timezone.utc)
     window_end_value = window_end or datetime.max.replace(tzinfo=timezone.utc)
-    lines = _unfold_ical_lines(calendar_data)
     events: list[_ParsedEvent] = []
-    in_event = False
-    current_lines: list[str] = []
-
-    for line in lines:
-        upper = line.strip().upper()
-        if upper == "BEGIN:VEVENT":
-            in_event = True
-            current_lines = []
-            continue
-        if upper == "END:VEVENT":
-            events.extend(
-                _parse_event_instances(
-                    current_lines,
-                    default_timezone=default_timezone,
-                    window_start=window_start_value,
-                    window_end=window_end_value,
-                    external_id_prefix=external_id_prefix,
-                )
+    for lines in iter_vevent_lines(calendar_data):
+        events.extend(
+            _parse_event_instances(
+                lines,
+                default_timezone=default_timezone,
+                window_start=window_start_value,
+                window_end=window_end_value,
+                external_id_prefix=external_id_prefix,
+                expansion_cache=expansion_cache,
             )
-            in_event = False
-            current_lines = []
-            continue
-        if in_event:
-            current_lines.append(line)
-
+        )
     return events
 
 
-def _unfold_ical_lines(calendar_data: str) -> list[str]:
-    raw_lines = calendar_data.replace("\r\n", "\n").replace("\r", "\n").split("\n")
-    unfolded: list[str] = []
-    for line in raw_lines:
-        if not line:
-            continue
-        if line[0] in {" ", "\t"} and unfolded:
-            unfolded[-1] += line[1:]
-        else:
-            unfolded.append(line)
-    return unfolded
-
-
-def _parse_event_fields(lines: list[str]) -> dict[str, list[_FieldValue]]:
-    values: dict[str, list[_FieldValue]] = {}
-    for line in lines:
-        if ":" not in line:
-            continue
-        raw_name, raw_value = line.split(":", maxsplit=1)
-        parts = raw_name.split(";")
-        name = parts[0].upper()
-        params: dict[str, str] = {}
-        for item in parts[1:]:
-            if "=" not in item:
-                continue
-            key, value = item.split("=", maxsplit=1)
-            params[key.upper()] = value.strip('"')
-        values.setdefault(name, []).append((params, raw_value))
-    return values
-
-
-def _first_field(values: dict[str, list[_FieldValue]], name: str) -> _FieldValue | None:
-    options = values.get(name.upper())
-    if not options:
-        return None
-    return options[0]
-
-
-def _all_fields(values: dict[str, list[_FieldValue]], name: str) -> list[_FieldValue]:
-    return values.get(name.upper(), [])
+def _extract_ical_uids(calendar_data: str) -> set[str]:
+    uids: set[str] = set()
+    for lines in iter_vevent_lines(calendar_data):
+        for _params, raw_uid in all_fields(parse_fields(lines), "UID"):
+            uid = raw_uid.strip()
+            if uid:
+                uids.add(uid)
+    return uids
 
 
 def _parse_event_instances(
@@ -578,36 +1106,37 @@ def _parse_event_instances(
     window_start: datetime,
     window_end: datetime,
     external_id_prefix: str = "",
+    expansion_cache: RecurrenceExpansionCache | None = None,
 ) -> list[_ParsedEvent]:
-    values = _parse_event_fields(lines)
+    values = parse_fields(lines)
 
-    uid_field = _first_field(values, "UID")
+    uid_field = first_field(values, "UID")
     uid = (uid_field[1] if uid_field else "").strip()
     if not uid:
         return []
 
-    dtstart_field = _first_field(values, "DTSTART")
-    dtstart = _parse_ical_dt(dtstart_field, default_timezone=default_timezone)
+    dtstart_field = first_field(values, "DTSTART")
+    dtstart = parse_ical_dt(dtstart_field, default_timezone=default_timezone)
     if dtstart is None:
         return []
-    dtend = _parse_ical_dt(_first_field(values, "DTEND"), default_timezone=default_timezone)
+    dtend = parse_ical_dt(first_field(values, "DTEND"), default_timezone=default_timezone)
     if dtend is None:
         dtend = _fallback_end_dt(dtstart_field, dtstart)
     if dtstart >= dtend:
         return []
 
-    title_field = _first_field(values, "SUMMARY")
+    title_field = first_field(values, "SUMMARY")
     title_raw = title_field[1].strip() if title_field else ""
-    title = _decode_ical_text(title_raw) if title_raw else None
+    title = decode_text(title_raw) if title_raw else None
 
-    modified = _parse_ical_dt(_first_field(values, "LAST-MODIFIED"), default_timezone=default_timezone)
+    modified = parse_ical_dt(first_field(values, "LAST-MODIFIED"), default_timezone=default_timezone)
     if modified is None:
-        modified = _parse_ical_dt(_first_field(values, "DTSTAMP"), default_timezone=default_timezone)
+        modified = parse_ical_dt(first_field(values, "DTSTAMP"), default_timezone=default_timezone)
     modified_iso = modified.astimezone(timezone.utc).isoformat() if modified is not None else None
 
-    recurrence_id_field = _first_field(values, "RECURRENCE-ID")
+    recurrence_id_field = first_field(values, "RECURRENCE-ID")
     if recurrence_id_field is not None:
-        recurrence_id = _parse_ical_dt(recurrence_id_field, default_timezone=default_timezone)
+        recurrence_id = parse_ical_dt(recurrence_id_field, default_timezone=default_timezone)
         recurrence_component = (
             _format_recurrence_component(recurrence_id)
             if recurrence_id is not None
@@ -622,8 +1151,8 @@ def _parse_event_instances(
         )
         return [instance] if _is_overlapping_window(instance.start_dt, instance.end_dt, window_start, window_end) else []
 
-    rrule_field = _first_field(values, "RRULE")
-    rdate_fields = _all_fields(values, "RDATE")
+    rrule_field = first_field(values, "RRULE")
+    rdate_fields = all_fields(values, "RDATE")
     if rrule_field is None and not rdate_fields:
         instance = _ParsedEvent(
             external_id=f"{external_id_prefix}{uid}",
@@ -635,68 +1164,88 @@ def _parse_event_instances(
         return [instance] if _is_overlapping_window(instance.start_dt, instance.end_dt, window_start, window_end) else []
 
     duration = dtend - dtstart
+
+    def _expand(range_start: datetime, range_end: datetime) -> list[datetime]:
+        return _expand_occurrence_starts(
+            values,
+            uid=uid,
+            dtstart=dtstart,
+            default_timezone=default_timezone,
+            range_start=range_start,
+            range_end=range_end,
+        )
+
+    range_start = window_start - duration
+    if expansion_cache is not None:
+        occurrence_starts = expansion_cache.expand(
+            collection=external_id_prefix,
+            uid=uid,
+            timezone_name=str(default_timezone),
+            content_hash=hash_recurrence_lines(lines),
+            range_start=range_start,
+            range_end=window_end,
+            tz=dtstart.tzinfo,
+            expand_fn=_expand,
+        )
+    else:
+        occurrence_starts = _expand(range_start, window_end)
+
+    instances_by_external_id: dict[str, _ParsedEvent] = {}
+    for occurrence_start in occurrence_starts:
+        occurrence_end = occurrence_start + duration
+        if not _is_overlapping_window(occurrence_start, occurrence_end, window_start, window_end):
+            continue
+        external_id = f"{external_id_prefix}{uid};{_format_recurrence_component(occurrence_start)}"
+        instances_by_external_id[external_id] = _ParsedEvent(
+            external_id=external_id,
+            start_dt=occurrence_start,
+            end_dt=occurrence_end,
+            title=title,
+            external_modified_at=modified_iso,
+        )
+
+    return sorted(instances_by_external_id.values(), key=lambda item: item.start_dt)
+
+
+def _expand_occurrence_starts(
+    values: EventFields,
+    *,
+    uid: str,
+    dtstart: datetime,
+    default_timezone: ZoneInfo | timezone,
+    range_start: datetime,
+    range_end: datetime,
+) -> list[datetime]:
+    """Return RRULE/RDATE occurrence starts in ``[range_start, range_end]`` minus EXDATEs."""
     excluded_occurrences_utc = {
         ex.astimezone(timezone.utc).replace(microsecond=0)
-        for field in _all_fields(values, "EXDATE")
-        for ex in _parse_ical_dt_list(field, default_timezone=default_timezone)
+        for exdate_field in all_fields(values, "EXDATE")
+        for ex in parse_ical_dt_list(exdate_field, default_timezone=default_timezone)
     }
+    occurrence_starts: list[datetime] = []
 
-    instances_by_external_id: dict[str, _ParsedEvent] = {}
-
+    rrule_field = first_field(values, "RRULE")
     if rrule_field is not None:
         rule_text = rrule_field[1].strip()
         if rule_text:
             try:
                 rule = rrulestr(rule_text, dtstart=dtstart)
-                occurrence_starts = rule.between(window_start - duration, window_end, inc=True)
-                for occurrence_start in occurrence_starts:
-                    if _is_excluded_occurrence(occurrence_start, excluded_occurrences_utc):
-                        continue
-                    occurrence_end = occurrence_start + duration
-                    if not _is_overlapping_window(occurrence_start, occurrence_end, window_start, window_end):
-                        continue
-                    external_id = f"{external_id_prefix}{uid};{_format_recurrence_component(occurrence_start)}"
-                    instances_by_external_id[external_id] = _ParsedEvent(
-                        external_id=external_id,
-                        start_dt=occurrence_start,
-                        end_dt=occurrence_end,
-                        title=title,
-                        external_modified_at=modified_iso,
-                    )
+                occurrence_starts.extend(rule.between(range_start, range_end, inc=True))
             except Exception:
                 logger.warning("caldav_rrule_parse_failed uid=%s", uid)
 
-    for field in rdate_fields:
-        for occurrence_start in _parse_ical_dt_list(field, default_timezone=default_timezone):
-            if _is_excluded_occurrence(occurrence_start, excluded_occurrences_utc):
-                continue
-            occurrence_end = occurrence_start + duration
-            if not _is_overlapping_window(occurrence_start, occurrence_end, window_start, window_end):
-                continue
-            external_id = f"{external_id_prefix}{uid};{_format_recurrence_component(occurrence_start)}"
-            instances_by_external_id[external_id] = _ParsedEvent(
-                external_id=external_id,
-                start_dt=occurrence_start,
-                end_dt=occurrence_end,
-                title=title,
-                external_modified_at=modified_iso,
-            )
-
-    return sorted(instances_by_external_id.values(), key=lambda item: item.start_dt)
-
+    for rdate_field in all_fields(values, "RDATE"):
+        occurrence_starts.extend(
+            occurrence_start
+            for occurrence_start in parse_ical_dt_list(rdate_field, default_timezone=default_timezone)
+            if range_start <= occurrence_start <= range_end
+        )
 
-def _parse_ical_dt_list(
-    field: _FieldValue,
-    *,
-    default_timezone: ZoneInfo | timezone,
-) -> list[datetime]:
-    params, raw_value = field
-    values: list[datetime] = []
-    for chunk in raw_value.split(","):
-        dt = _parse_ical_dt((params, chunk), default_timezone=default_timezone)
-        if dt is not None:
-            values.append(dt)
-    return values
+    return sorted(
+        occurrence_start
+        for occurrence_start in occurrence_starts
+        if not _is_excluded_occurrence(occurrence_start, excluded_occurrences_utc)
+    )
 
 
 def _is_overlapping_window(start_dt: datetime, end_dt: datetime, window_start: datetime, window_end: datetime) -> bool:
@@ -716,47 +1265,8 @@ def _collection_identity(collection_url: str) -> str:
     return f"{path}|"
 
 
-def _parse_ical_dt(
-    field: tuple[dict[str, str], str] | None,
-    *,
-    default_timezone: ZoneInfo | timezone,
-) -> datetime | None:
-    if field is None:
-        return None
-    params, raw_value = field
-    value = raw_value.strip()
-    if not value:
-        return None
-
-    if "T" not in value:
-        local_date = datetime.strptime(value, "%Y%m%d").date()
-        return datetime.combine(local_date, time.min, tzinfo=default_timezone)
-
-    if value.endswith("Z"):
-        dt = _parse_ical_time_fragment(value[:-1])
-        return dt.replace(tzinfo=timezone.utc)
-
-    dt = _parse_ical_time_fragment(value)
-    tzid = params.get("TZID")
-    if tzid:
-        try:
-            return dt.replace(tzinfo=ZoneInfo(tzid))
-        except ZoneInfoNotFoundError:
-            return dt.replace(tzinfo=default_timezone)
-    return dt.replace(tzinfo=default_timezone)
-
-
-def _parse_ical_time_fragment(value: str) -> datetime:
-    for fmt in ("%Y%m%dT%H%M%S", "%Y%m%dT%H%M"):
-        try:
-            return datetime.strptime(value, fmt)
-        except ValueError:
-            continue
-    raise ValueError(f"Unsupported iCal datetime value: {value}")
-
-
 def _fallback_end_dt(
-    dtstart_field: tuple[dict[str, str], str] | None,
+    dtstart_field: FieldValue | None,
     start_dt: datetime,
 ) -> datetime:
     if dtstart_field is None:
@@ -765,10 +1275,3 @@ def _fallback_end_dt(
     if "T" not in raw_value:
         return start_dt + timedelta(days=1)
     return start_dt + timedelta(hours=1)
-
-
-def _decode_ical_text(raw: str) -> str:
-    value = raw.replace("\\n", "\n").replace("\\N", "\n")
-    value = value.replace("\\,", ",").replace("\\;", ";")
-    value = value.replace("\\\\", "\\")
-    return value
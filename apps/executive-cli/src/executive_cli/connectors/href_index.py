@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+_INDEX_VERSION = 1
+
+
+class CalendarHrefIndex:
+    """UIDs held by each CalDAV resource href, persisted between sync runs.
+
+    A sync-collection REPORT reports a removed resource by href only, with no calendar data,
+    so the UIDs it held must come from an earlier fetch. Entries are keyed by collection
+    prefix and normalized href path. A collection's entries are replaced by each snapshot and
+    updated by each multiget. The index may run ahead of the database when a sync fails after
+    the fetch; an href it no longer knows is reported as unresolved, never guessed. Thread-safe,
+    since collections are fetched concurrently.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._collections: dict[str, dict[str, tuple[str, ...]]] | None = None
+        self._dirty = False
+
+    def resolve(self, *, collection: str, href_path: str) -> tuple[str, ...] | None:
+        with self._lock:
+            return self._load().get(collection, {}).get(href_path)
+
+    def record(self, *, collection: str, href_path: str, uids: set[str]) -> None:
+        value = tuple(sorted(uids))
+        with self._lock:
+            hrefs = self._load().setdefault(collection, {})
+            if hrefs.get(href_path) != value:
+                hrefs[href_path] = value
+                self._dirty = True
+
+    def forget(self, *, collection: str, href_path: str) -> None:
+        with self._lock:
+            if self._load().get(collection, {}).pop(href_path, None) is not None:
+                self._dirty = True
+
+    def replace_collection(self, *, collection: str, uids_by_href: dict[str, set[str]]) -> None:
+        value = {href_path: tuple(sorted(uids)) for href_path, uids in uids_by_href.items()}
+        with self._lock:
+            collections = self._load()
+            if collections.get(collection) != value:
+                collections[collection] = value
+                self._dirty = True
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._dirty or self.path is None or self._collections is None:
+                return
+            payload = {
+                "version": _INDEX_VERSION,
+                "collections": {
+                    collection: {href_path: list(uids) for href_path, uids in hrefs.items()}
+                    for collection, hrefs in self._collections.items()
+                },
+            }
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+                tmp_path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+                os.replace(tmp_path, self.path)
+            except OSError as exc:
+                logger.warning("caldav_href_index_save_failed error=%s", exc.__class__.__name__)
+                return
+            self._dirty = False
+
+    def _load(self) -> dict[str, dict[str, tuple[str, ...]]]:
+        if self._collections is not None:
+            return self._collections
+        self._collections = {}
+        if self.path is None or not self.path.exists():
+            return self._collections
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+            if payload.get("version") != _INDEX_VERSION:
+                return self._collections
+            for collection, hrefs in payload["collections"].items():
+                self._collections[collection] = {
+                    href_path: tuple(str(uid) for uid in uids) for href_path, uids in hrefs.items()
+                }
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            logger.warning("caldav_href_index_unreadable path=%s", self.path)
+            self._collections = {}
+        return self._collections
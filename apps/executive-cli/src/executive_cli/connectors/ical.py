@@ -0,0 +1,153 @@
+"""Minimal iCalendar (RFC 5545) tokenizer for the VEVENT fields the CalDAV sync reads.
+
+Hot paths avoid ``strptime`` and repeated splitting: lines are unfolded and grouped per
+VEVENT in one pass, date-times are parsed by fixed-offset slicing after a precompiled
+regex match, and TZID lookups are memoized.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, time, timezone, tzinfo
+from functools import lru_cache
+import re
+from typing import Iterator
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+FieldValue = tuple[dict[str, str], str]
+EventFields = dict[str, list[FieldValue]]
+
+_NO_PARAMS: dict[str, str] = {}
+_LINE_BREAK_RE = re.compile(r"\r\n|\r|\n")
+_DATE_RE = re.compile(r"\d{8}")
+_DATE_TIME_RE = re.compile(r"\d{8}T\d{4}(?:\d{2})?")
+_TEXT_ESCAPE_RE = re.compile(r"\\([\\;,nN])")
+_TEXT_ESCAPES = {"\\": "\\", ";": ";", ",": ",", "n": "\n", "N": "\n"}
+
+
+def iter_vevent_lines(calendar_data: str) -> Iterator[list[str]]:
+    """Yield the unfolded content lines of each VEVENT, without its BEGIN/END markers."""
+    current: list[str] | None = None
+    for line in _iter_unfolded_lines(calendar_data):
+        if line[0] in "BbEe":
+            marker = line.strip().upper()
+            if marker == "BEGIN:VEVENT":
+                current = []
+                continue
+            if marker == "END:VEVENT":
+                if current is not None:
+                    yield current
+                current = None
+                continue
+        if current is not None:
+            current.append(line)
+
+
+def _iter_unfolded_lines(calendar_data: str) -> Iterator[str]:
+    pending: str | None = None
+    for raw_line in _LINE_BREAK_RE.split(calendar_data):
+        if not raw_line:
+            continue
+        if raw_line[0] in " \t" and pending is not None:
+            pending += raw_line[1:]
+            continue
+        if pending is not None:
+            yield pending
+        pending = raw_line
+    if pending is not None:
+        yield pending
+
+
+def parse_fields(lines: list[str]) -> EventFields:
+    values: EventFields = {}
+    for line in lines:
+        raw_name, separator, raw_value = line.partition(":")
+        if not separator:
+            continue
+        if ";" not in raw_name:
+            values.setdefault(raw_name.upper(), []).append((_NO_PARAMS, raw_value))
+            continue
+        parts = raw_name.split(";")
+        params: dict[str, str] = {}
+        for item in parts[1:]:
+            key, has_value, value = item.partition("=")
+            if has_value:
+                params[key.upper()] = value.strip('"')
+        values.setdefault(parts[0].upper(), []).append((params, raw_value))
+    return values
+
+
+def first_field(values: EventFields, name: str) -> FieldValue | None:
+    options = values.get(name)
+    if not options:
+        return None
+    return options[0]
+
+
+def all_fields(values: EventFields, name: str) -> list[FieldValue]:
+    return values.get(name, [])
+
+
+def parse_ical_dt(field: FieldValue | None, *, default_timezone: tzinfo) -> datetime | None:
+    if field is None:
+        return None
+    params, raw_value = field
+    value = raw_value.strip()
+    if not value:
+        return None
+
+    if "T" not in value:
+        if not _DATE_RE.fullmatch(value):
+            raise ValueError(f"Unsupported iCal date value: {value}")
+        return datetime.combine(_parse_date(value), time.min, tzinfo=default_timezone)
+
+    if value.endswith("Z"):
+        return parse_time_fragment(value[:-1]).replace(tzinfo=timezone.utc)
+
+    dt = parse_time_fragment(value)
+    tzid = params.get("TZID")
+    if tzid:
+        return dt.replace(tzinfo=resolve_tzid(tzid) or default_timezone)
+    return dt.replace(tzinfo=default_timezone)
+
+
+def parse_ical_dt_list(field: FieldValue, *, default_timezone: tzinfo) -> list[datetime]:
+    params, raw_value = field
+    values: list[datetime] = []
+    for chunk in raw_value.split(","):
+        dt = parse_ical_dt((params, chunk), default_timezone=default_timezone)
+        if dt is not None:
+            values.append(dt)
+    return values
+
+
+def parse_time_fragment(value: str) -> datetime:
+    """Parse ``YYYYMMDDTHHMM[SS]`` into a naive datetime."""
+    if not _DATE_TIME_RE.fullmatch(value):
+        raise ValueError(f"Unsupported iCal datetime value: {value}")
+    return datetime(
+        int(value[0:4]),
+        int(value[4:6]),
+        int(value[6:8]),
+        int(value[9:11]),
+        int(value[11:13]),
+        int(value[13:15]) if len(value) == 15 else 0,
+    )
+
+
+@lru_cache(maxsize=256)
+def resolve_tzid(tzid: str) -> ZoneInfo | None:
+    """Return the zone for ``tzid``, or ``None`` when it is not a known IANA name."""
+    try:
+        return ZoneInfo(tzid)
+    except (ZoneInfoNotFoundError, ValueError):
+        return None
+
+
+def decode_text(raw: str) -> str:
+    if "\\" not in raw:
+        return raw
+    return _TEXT_ESCAPE_RE.sub(lambda match: _TEXT_ESCAPES[match.group(1)], raw)
+
+
+def _parse_date(value: str) -> date:
+    return date(int(value[0:4]), int(value[4:6]), int(value[6:8]))
@@ -4,6 +4,9 @@ import imaplib
 import logging
 import os
 import re
+import threading
+import time
+from contextlib import ExitStack, contextmanager
 from dataclasses import dataclass
 from datetime import date
 from datetime import timezone
@@ -11,7 +14,7 @@ from email.header import decode_header, make_header
 from email.parser import BytesParser
 from email.policy import default
 from email.utils import parseaddr, parsedate_to_datetime
-from typing import Protocol
+from typing import Iterator, Protocol
 
 from executive_cli.secret_store import (
     DEFAULT_IMAP_KEYCHAIN_SERVICE,
@@ -19,6 +22,13 @@ from executive_cli.secret_store import (
 )
 
 logger = logging.getLogger(__name__)
+_FETCH_BATCH_SIZE_DEFAULT = 500
+_MAX_SESSIONS_DEFAULT = 3
+_MAILBOX_UPDATE_RESPONSES = frozenset({"EXISTS", "EXPUNGE", "FETCH", "RECENT", "VANISHED"})
+_HEADER_FETCH_ITEMS = "(UID FLAGS BODY.PEEK[HEADER.FIELDS (MESSAGE-ID SUBJECT FROM DATE)])"
+_FLAGS_FETCH_ITEMS = "(UID FLAGS)"
+# Start of an untagged FETCH response as imaplib hands it over: "<seq> (".
+_FETCH_RESPONSE_START = re.compile(r"\d+\s+\(")
 
 
 class MailConnectorError(RuntimeError):
@@ -40,6 +50,12 @@ class MailSyncBatch:
     messages: list[RemoteEmailHeader]
     uidvalidity: int
     uidnext: int
+    # CONDSTORE: mailbox HIGHESTMODSEQ after this batch (None when unsupported).
+    highestmodseq: int | None = None
+    # QRESYNC: UIDs below the cursor expunged since ``cursor_modseq``.
+    vanished_uids: tuple[int, ...] = ()
+    # CONDSTORE: ``(uid, flags)`` of UIDs below the cursor whose flags changed since ``cursor_modseq``.
+    flag_updates: tuple[tuple[int, tuple[str, ...]], ...] = ()
 
 
 class MailConnector(Protocol):
@@ -50,6 +66,7 @@ class MailConnector(Protocol):
         cursor_uidvalidity: int | None,
         cursor_uidnext: int | None,
         received_since: date | None = None,
+        cursor_modseq: int | None = None,
     ) -> MailSyncBatch: ...
 
 
@@ -60,12 +77,18 @@ class ImapConnector:
     password: str
     port: int = 993
     timeout_sec: float = 20.0
+    fetch_batch_size: int = _FETCH_BATCH_SIZE_DEFAULT
+    max_sessions: int = _MAX_SESSIONS_DEFAULT
 
     def __post_init__(self) -> None:
         if not self.host or not self.username or not self.password:
             raise MailConnectorError("IMAP connector is not configured.")
         if self.port <= 0:
             raise MailConnectorError("IMAP port is invalid.")
+        if self.fetch_batch_size <= 0:
+            raise MailConnectorError("IMAP fetch batch size is invalid.")
+        if self.max_sessions <= 0:
+            raise MailConnectorError("IMAP max sessions is invalid.")
 
     @classmethod
     def from_env(cls) -> ImapConnector:
@@ -82,6 +105,8 @@ class ImapConnector:
                 or ""
             )
         port_raw = os.getenv("EXECAS_IMAP_PORT", "993").strip()
+        batch_size_raw = os.getenv("EXECAS_IMAP_FETCH_BATCH_SIZE", str(_FETCH_BATCH_SIZE_DEFAULT)).strip()
+        max_sessions_raw = os.getenv("EXECAS_IMAP_MAX_SESSIONS", str(_MAX_SESSIONS_DEFAULT)).strip()
 
         if not host or not username or not password:
             raise MailConnectorError(
@@ -96,7 +121,24 @@ class ImapConnector:
         if port <= 0:
             raise MailConnectorError("IMAP port is invalid.")
 
-        return cls(host=host, username=username, password=password, port=port)
+        try:
+            fetch_batch_size = int(batch_size_raw)
+        except ValueError as exc:
+            raise MailConnectorError("IMAP fetch batch size is invalid.") from exc
+
+        try:
+            max_sessions = int(max_sessions_raw)
+        except ValueError as exc:
+            raise MailConnectorError("IMAP max sessions is invalid.") from exc
+
+        return cls(
+            host=host,
+            username=username,
+            password=password,
+            port=port,
+            fetch_batch_size=fetch_batch_size,
+            max_sessions=max_sessions,
+        )
 
     def fetch_headers(
         self,
@@ -105,48 +147,133 @@ class ImapConnector:
         cursor_uidvalidity: int | None,
         cursor_uidnext: int | None,
         received_since: date | None = None,
+        cursor_modseq: int | None = None,
     ) -> MailSyncBatch:
+        with self.open_session(mailbox) as session:
+            return session.fetch_headers(
+                mailbox=mailbox,
+                cursor_uidvalidity=cursor_uidvalidity,
+                cursor_uidnext=cursor_uidnext,
+                received_since=received_since,
+                cursor_modseq=cursor_modseq,
+            )
+
+    @contextmanager
+    def open_session(self, mailbox: str) -> Iterator[ImapSession]:
+        """Log in once and keep ``mailbox`` selected until the block exits."""
         try:
             client = imaplib.IMAP4_SSL(self.host, self.port, timeout=self.timeout_sec)
         except (OSError, TimeoutError):
             raise MailConnectorError("IMAP endpoint is unreachable.") from None
 
         try:
-            try:
-                client.login(self.username, self.password)
-            except imaplib.IMAP4.error:
-                logger.warning("imap_auth_failed mailbox=%s", mailbox)
-                raise MailConnectorError("IMAP authentication failed.") from None
-
-            status, _ = client.select(mailbox, readonly=True)
-            if status != "OK":
-                raise MailConnectorError("IMAP mailbox is unavailable.")
-
-            uidvalidity, uidnext = self._read_uid_state(client, mailbox)
-            full_resync = cursor_uidvalidity is None or cursor_uidvalidity != uidvalidity
-            since_uid = None if full_resync else cursor_uidnext
-            uids = self._search_uids(client, since_uid=since_uid, received_since=received_since)
-            messages = [self._fetch_header(client, uid) for uid in uids]
-
-            return MailSyncBatch(
-                messages=messages,
-                uidvalidity=uidvalidity,
-                uidnext=uidnext,
-            )
-        except MailConnectorError:
-            raise
-        except imaplib.IMAP4.error:
-            raise MailConnectorError("IMAP request failed.") from None
-        except (OSError, TimeoutError):
-            raise MailConnectorError("IMAP endpoint is unreachable.") from None
+            with _map_imap_errors():
+                try:
+                    client.login(self.username, self.password)
+                except imaplib.IMAP4.error:
+                    logger.warning("imap_auth_failed mailbox=%s", mailbox)
+                    raise MailConnectorError("IMAP authentication failed.") from None
+                session = ImapSession(connector=self, client=client, qresync=self._enable_qresync(client))
+                session.select(mailbox)
+            yield session
         finally:
             try:
                 client.logout()
             except Exception:
                 pass
 
-    def _read_uid_state(self, client: imaplib.IMAP4_SSL, mailbox: str) -> tuple[int, int]:
-        status, payload = client.status(mailbox, "(UIDVALIDITY UIDNEXT)")
+    def _enable_qresync(self, client: imaplib.IMAP4_SSL) -> bool:
+        # QRESYNC must be enabled before SELECT for VANISHED responses to be sent.
+        if "QRESYNC" not in _capabilities(client):
+            return False
+        try:
+            status, _ = client.enable("QRESYNC")
+        except imaplib.IMAP4.error:
+            return False
+        return status == "OK"
+
+    def _fetch_selected(
+        self,
+        client: imaplib.IMAP4_SSL,
+        *,
+        mailbox: str,
+        cursor_uidvalidity: int | None,
+        cursor_uidnext: int | None,
+        received_since: date | None,
+        cursor_modseq: int | None = None,
+        qresync: bool = False,
+    ) -> MailSyncBatch:
+        condstore = bool({"CONDSTORE", "QRESYNC"} & _capabilities(client))
+        uidvalidity, uidnext, highestmodseq = self._read_uid_state(client, mailbox, with_modseq=condstore)
+        full_resync = cursor_uidvalidity is None or cursor_uidvalidity != uidvalidity
+        since_uid = None if full_resync else cursor_uidnext
+        uids = self._search_uids(client, since_uid=since_uid, received_since=received_since)
+        messages = list(self._iter_headers(client, uids))
+
+        flag_updates: tuple[tuple[int, tuple[str, ...]], ...] = ()
+        vanished_uids: tuple[int, ...] = ()
+        if (
+            since_uid is not None
+            and since_uid > 1
+            and cursor_modseq is not None
+            and highestmodseq is not None
+            and highestmodseq > cursor_modseq
+        ):
+            flag_updates, vanished_uids = self._fetch_changed_since(
+                client,
+                last_uid=since_uid - 1,
+                modseq=cursor_modseq,
+                qresync=qresync,
+            )
+
+        return MailSyncBatch(
+            messages=messages,
+            uidvalidity=uidvalidity,
+            uidnext=uidnext,
+            highestmodseq=highestmodseq,
+            vanished_uids=vanished_uids,
+            flag_updates=flag_updates,
+        )
+
+    def _fetch_changed_since(
+        self,
+        client: imaplib.IMAP4_SSL,
+        *,
+        last_uid: int,
+        modseq: int,
+        qresync: bool,
+    ) -> tuple[tuple[tuple[int, tuple[str, ...]], ...], tuple[int, ...]]:
+        """Fetch flags of already-synced messages changed after ``modseq`` (RFC 7162).
+
+        Headers never change, so only ``(UID FLAGS)`` is fetched here; headers are fetched
+        for UIDs above ``last_uid`` alone.
+        """
+        modifier = f"(CHANGEDSINCE {modseq} VANISHED)" if qresync else f"(CHANGEDSINCE {modseq})"
+        status, payload = client.uid("FETCH", f"1:{last_uid}", _FLAGS_FETCH_ITEMS, modifier)
+        if status != "OK" or payload is None:
+            raise MailConnectorError("IMAP fetch request failed.")
+
+        flags_by_uid = {uid: flags for uid, flags in _parse_flags_fetch_payload(payload) if uid <= last_uid}
+        vanished: set[int] = set()
+        if qresync:
+            _, vanished_payload = client.response("VANISHED")
+            for item in vanished_payload or []:
+                if item is None:
+                    continue
+                text = _decode_bytes(item).replace("(EARLIER)", "").strip()
+                vanished.update(uid for uid in _parse_uid_set(text) if uid <= last_uid)
+        logger.info("imap_changedsince_fetched changed=%s vanished=%s", len(flags_by_uid), len(vanished))
+        return tuple(sorted(flags_by_uid.items())), tuple(sorted(vanished))
+
+    def _read_uid_state(
+        self,
+        client: imaplib.IMAP4_SSL,
+        mailbox: str,
+        *,
+        with_modseq: bool = False,
+    ) -> tuple[int, int, int | None]:
+        items = "(UIDVALIDITY UIDNEXT HIGHESTMODSEQ)" if with_modseq else "(UIDVALIDITY UIDNEXT)"
+        status, payload = client.status(mailbox, items)
         if status != "OK" or not payload or payload[0] is None:
             raise MailConnectorError("IMAP mailbox status request failed.")
 
@@ -155,7 +282,9 @@ class ImapConnector:
         uidnext = _extract_int_token(text, "UIDNEXT")
         if uidvalidity is None or uidnext is None:
             raise MailConnectorError("IMAP mailbox status response is invalid.")
-        return uidvalidity, uidnext
+        # Servers may report HIGHESTMODSEQ 0 for mailboxes that do not persist mod-sequences.
+        highestmodseq = _extract_int_token(text, "HIGHESTMODSEQ") if with_modseq else None
+        return uidvalidity, uidnext, highestmodseq or None
 
     def _search_uids(
         self,
@@ -184,49 +313,323 @@ class ImapConnector:
                 uids.add(uid)
         return sorted(uids)
 
-    def _fetch_header(self, client: imaplib.IMAP4_SSL, uid: int) -> RemoteEmailHeader:
-        status, payload = client.uid(
-            "FETCH",
-            str(uid),
-            "(UID FLAGS BODY.PEEK[HEADER.FIELDS (MESSAGE-ID SUBJECT FROM DATE)])",
-        )
+    def _iter_headers(self, client: imaplib.IMAP4_SSL, uids: list[int]) -> Iterator[RemoteEmailHeader]:
+        """Fetch headers in UID-set chunks, yielding messages as each chunk is parsed."""
+        for offset in range(0, len(uids), self.fetch_batch_size):
+            chunk = uids[offset : offset + self.fetch_batch_size]
+            yield from self._fetch_header_chunk(client, chunk)
+
+    def _fetch_header_chunk(self, client: imaplib.IMAP4_SSL, uids: list[int]) -> list[RemoteEmailHeader]:
+        status, payload = client.uid("FETCH", _format_uid_set(uids), _HEADER_FETCH_ITEMS)
         if status != "OK" or payload is None:
             raise MailConnectorError("IMAP fetch request failed.")
 
-        header_bytes = b""
-        parsed_flags: tuple[str, ...] = ()
-        for item in payload:
-            if isinstance(item, tuple):
-                meta = _decode_bytes(item[0])
-                flags = _parse_flags(meta)
-                if flags:
-                    parsed_flags = flags
-                value = item[1]
-                if isinstance(value, bytes):
-                    header_bytes += value
-            elif isinstance(item, bytes):
-                flags = _parse_flags(_decode_bytes(item))
-                if flags:
-                    parsed_flags = flags
-
-        parsed = BytesParser(policy=default).parsebytes(header_bytes)
-        subject = _decode_header_value(parsed.get("Subject"))
-        sender_raw = parsed.get("From")
-        sender = parseaddr(sender_raw)[1] if sender_raw else ""
-        if not sender:
-            sender = sender_raw or ""
-
-        received_at = _parse_received_at(parsed.get("Date"))
-        external_id = (parsed.get("Message-ID") or "").strip() or f"uid:{uid}"
-
-        return RemoteEmailHeader(
-            external_id=external_id,
-            mailbox_uid=uid,
-            subject=subject or None,
-            sender=sender.strip() or None,
-            received_at=received_at,
-            flags=parsed_flags,
-        )
+        requested = set(uids)
+        headers_by_uid: dict[int, RemoteEmailHeader] = {}
+        for uid, header_bytes, flags in _split_fetch_payload(payload):
+            if uid not in requested:
+                # Servers may interleave unsolicited FETCH responses (e.g. flag updates).
+                continue
+            headers_by_uid[uid] = _build_remote_header(uid, header_bytes, flags)
+        return [headers_by_uid[uid] for uid in uids if uid in headers_by_uid]
+
+
+class ImapSession:
+    """One authenticated IMAP connection; implements ``MailConnector`` without re-login."""
+
+    def __init__(self, *, connector: ImapConnector, client: imaplib.IMAP4_SSL, qresync: bool = False) -> None:
+        self._connector = connector
+        self._client = client
+        self.qresync = qresync
+        self.mailbox: str | None = None
+
+    def select(self, mailbox: str) -> None:
+        status, _ = self._client.select(mailbox, readonly=True)
+        if status != "OK":
+            raise MailConnectorError("IMAP mailbox is unavailable.")
+        self.mailbox = mailbox
+
+    def fetch_headers(
+        self,
+        *,
+        mailbox: str,
+        cursor_uidvalidity: int | None,
+        cursor_uidnext: int | None,
+        received_since: date | None = None,
+        cursor_modseq: int | None = None,
+    ) -> MailSyncBatch:
+        with _map_imap_errors():
+            if mailbox != self.mailbox:
+                self.select(mailbox)
+            return self._connector._fetch_selected(
+                self._client,
+                mailbox=mailbox,
+                cursor_uidvalidity=cursor_uidvalidity,
+                cursor_uidnext=cursor_uidnext,
+                received_since=received_since,
+                cursor_modseq=cursor_modseq,
+                qresync=self.qresync,
+            )
+
+    def wait_for_changes(self, *, timeout_sec: float) -> bool:
+        """Block in IMAP IDLE until the server reports mailbox changes or ``timeout_sec`` passes.
+
+        Returns ``True`` when an untagged EXISTS/EXPUNGE/VANISHED/FETCH/RECENT update arrived; other
+        untagged responses (e.g. ``* OK Still here``) are keepalives and IDLE continues.
+        Servers without the IDLE capability are polled: the call sleeps and reports a change
+        so the caller runs a (cheap) incremental sync.
+        """
+        with _map_imap_errors():
+            if "IDLE" not in _capabilities(self._client):
+                time.sleep(timeout_sec)
+                return True
+            if hasattr(self._client, "idle"):
+                return self._idle(timeout_sec)
+            return self._idle_compat(timeout_sec)
+
+    def _idle(self, timeout_sec: float) -> bool:
+        # imaplib.IMAP4.idle() (Python 3.14+) sends DONE and reads the tagged reply on exit.
+        with self._client.idle(duration=timeout_sec) as idler:
+            for response_type, _ in idler:
+                if str(response_type).upper() in _MAILBOX_UPDATE_RESPONSES:
+                    return True
+        return False
+
+    def _idle_compat(self, timeout_sec: float) -> bool:
+        """IDLE for interpreters whose imaplib lacks ``idle()``, over its line-level methods."""
+        client = self._client
+        tag = client._new_tag()
+        client.send(tag + b" IDLE\r\n")
+        if not client.readline().startswith(b"+"):
+            raise MailConnectorError("IMAP server rejected IDLE.")
+
+        changed = False
+        deadline = time.monotonic() + timeout_sec
+        try:
+            while not changed:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                client.sock.settimeout(remaining)
+                line = client.readline()
+                if not line:
+                    raise MailConnectorError("IMAP connection closed during IDLE.")
+                changed = _is_mailbox_update(line)
+        except TimeoutError:
+            # socket.SocketIO refuses reads after a timeout; no complete line arrived, so a
+            # fresh reader over the same socket loses nothing. Closing the old reader leaves
+            # the socket open.
+            stale_file = client.file
+            client.file = client.sock.makefile("rb")
+            stale_file.close()
+        finally:
+            client.sock.settimeout(self._connector.timeout_sec)
+
+        client.send(b"DONE\r\n")
+        while True:
+            line = client.readline()
+            if not line:
+                raise MailConnectorError("IMAP connection closed during IDLE.")
+            if line.startswith(tag):
+                if not line[len(tag) :].strip().upper().startswith(b"OK"):
+                    raise MailConnectorError("IMAP IDLE failed.")
+                return changed
+            changed = changed or _is_mailbox_update(line)
+
+
+@contextmanager
+def _map_imap_errors() -> Iterator[None]:
+    try:
+        yield
+    except MailConnectorError:
+        raise
+    except imaplib.IMAP4.error:
+        raise MailConnectorError("IMAP request failed.") from None
+    except (OSError, TimeoutError):
+        raise MailConnectorError("IMAP endpoint is unreachable.") from None
+
+
+class ImapSessionPool:
+    """Authenticated sessions shared by worker threads, reused across mailboxes.
+
+    A session is checked out by one thread at a time and re-SELECTs when handed a
+    different mailbox. Sessions are opened lazily, up to one per concurrent checkout;
+    a session whose command failed is logged out instead of being returned to the pool.
+    """
+
+    def __init__(self, connector: ImapConnector, *, size: int) -> None:
+        if size <= 0:
+            raise MailConnectorError("IMAP session pool size is invalid.")
+        self._connector = connector
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._idle: list[tuple[ImapSession, ExitStack]] = []
+        self._open: list[ExitStack] = []
+
+    @contextmanager
+    def session(self, mailbox: str) -> Iterator[ImapSession]:
+        with self._slots:
+            with self._lock:
+                entry = self._idle.pop() if self._idle else None
+            if entry is None:
+                stack = ExitStack()
+                entry = (stack.enter_context(self._connector.open_session(mailbox)), stack)
+                with self._lock:
+                    self._open.append(stack)
+            imap_session, stack = entry
+            try:
+                yield imap_session
+            except BaseException:
+                with self._lock:
+                    self._open.remove(stack)
+                stack.close()
+                raise
+            with self._lock:
+                self._idle.append(entry)
+
+    def close(self) -> None:
+        with self._lock:
+            stacks = list(self._open)
+            self._open.clear()
+            self._idle.clear()
+        for stack in stacks:
+            stack.close()
+
+    def __enter__(self) -> ImapSessionPool:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.close()
+        return False
+
+
+def _capabilities(client: imaplib.IMAP4_SSL) -> set[str]:
+    return {str(item).upper() for item in getattr(client, "capabilities", ())}
+
+
+def _is_mailbox_update(line: bytes) -> bool:
+    parts = line.split()
+    # "* 12 EXISTS" carries a number first; "* VANISHED 5" (QRESYNC's EXPUNGE) does not.
+    return bool(parts) and parts[0] == b"*" and any(
+        _decode_bytes(token).upper() in _MAILBOX_UPDATE_RESPONSES for token in parts[1:3]
+    )
+
+
+def _format_uid_set(uids: list[int]) -> str:
+    """Compress sorted UIDs into an IMAP sequence set, e.g. [1, 2, 3, 7] -> '1:3,7'."""
+    parts: list[str] = []
+    run_start: int | None = None
+    run_end: int | None = None
+    for uid in uids:
+        if run_end is not None and uid == run_end + 1:
+            run_end = uid
+            continue
+        if run_start is not None:
+            parts.append(str(run_start) if run_start == run_end else f"{run_start}:{run_end}")
+        run_start = uid
+        run_end = uid
+    if run_start is not None:
+        parts.append(str(run_start) if run_start == run_end else f"{run_start}:{run_end}")
+    return ",".join(parts)
+
+
+def _parse_uid_set(value: str) -> list[int]:
+    """Expand an IMAP sequence set such as ``'1:3,7'`` into UIDs."""
+    uids: list[int] = []
+    for part in value.split(","):
+        start, separator, end = part.strip().partition(":")
+        try:
+            low = int(start)
+            high = int(end) if separator else low
+        except ValueError:
+            continue
+        if low > high:
+            low, high = high, low
+        uids.extend(range(low, high + 1))
+    return uids
+
+
+def _split_fetch_payload(
+    payload: list[tuple[bytes, bytes] | bytes | None],
+) -> list[tuple[int, bytes, tuple[str, ...]]]:
+    """Group a multi-message imaplib FETCH payload into (uid, header_bytes, flags) items.
+
+    imaplib returns one ``(meta, literal)`` tuple per message, optionally followed by a
+    bytes item with attributes sent after the literal (for example ``b' UID 42 FLAGS (\\Seen))'``).
+    A bytes item is merged into the current message only when its ``UID`` matches; a whole
+    untagged FETCH response (``b'7 (FLAGS (\\Seen) UID 50)'``) for another message, such as
+    an unsolicited flag update, is ignored.
+    """
+    messages: list[tuple[int, bytes, tuple[str, ...]]] = []
+    in_message = False
+    current_uid: int | None = None
+    current_header = b""
+    current_flags: tuple[str, ...] = ()
+
+    def _flush() -> None:
+        if current_uid is not None:
+            messages.append((current_uid, current_header, current_flags))
+
+    for item in payload:
+        if isinstance(item, tuple):
+            _flush()
+            in_message = True
+            meta = _decode_bytes(item[0])
+            current_uid = _extract_int_token(meta, "UID")
+            current_flags = _parse_flags(meta)
+            value = item[1]
+            current_header = value if isinstance(value, bytes) else b""
+        elif isinstance(item, bytes) and in_message:
+            text = _decode_bytes(item)
+            uid = _extract_int_token(text, "UID")
+            if _FETCH_RESPONSE_START.match(text):
+                if uid is None or uid != current_uid:
+                    continue
+            elif uid is not None:
+                if current_uid is None:
+                    # Some servers send UID after the literal rather than before it.
+                    current_uid = uid
+                elif uid != current_uid:
+                    continue
+            flags = _parse_flags(text)
+            if flags:
+                current_flags = flags
+    _flush()
+    return messages
+
+
+def _parse_flags_fetch_payload(payload: list[tuple[bytes, bytes] | bytes | None]) -> list[tuple[int, tuple[str, ...]]]:
+    """Parse a literal-free ``(UID FLAGS)`` FETCH payload into ``(uid, flags)`` items."""
+    updates: list[tuple[int, tuple[str, ...]]] = []
+    for item in payload:
+        if item is None:
+            continue
+        text = _decode_bytes(item[0] if isinstance(item, tuple) else item)
+        uid = _extract_int_token(text, "UID")
+        if uid is not None:
+            updates.append((uid, _parse_flags(text)))
+    return updates
+
+
+def _build_remote_header(uid: int, header_bytes: bytes, flags: tuple[str, ...]) -> RemoteEmailHeader:
+    parsed = BytesParser(policy=default).parsebytes(header_bytes)
+    subject = _decode_header_value(parsed.get("Subject"))
+    sender_raw = parsed.get("From")
+    sender = parseaddr(sender_raw)[1] if sender_raw else ""
+    if not sender:
+        sender = sender_raw or ""
+
+    received_at = _parse_received_at(parsed.get("Date"))
+    external_id = (parsed.get("Message-ID") or "").strip() or f"uid:{uid}"
+
+    return RemoteEmailHeader(
+        external_id=external_id,
+        mailbox_uid=uid,
+        subject=subject or None,
+        sender=sender.strip() or None,
+        received_at=received_at,
+        flags=flags,
+    )
 
 
 def _decode_bytes(value: bytes | str) -> str:
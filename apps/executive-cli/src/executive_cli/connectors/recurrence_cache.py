@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, tzinfo
+from pathlib import Path
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+_CACHE_VERSION = 2
+_UNUSED_ENTRY_TTL_DAYS = 14
+# Properties that determine occurrence starts. DTSTAMP, SUMMARY, LAST-MODIFIED and the like
+# are left out: many servers regenerate DTSTAMP on every response.
+_RECURRENCE_PROPERTIES = frozenset({"DTSTART", "DTEND", "DURATION", "RRULE", "RDATE", "EXDATE"})
+
+ExpandFn = Callable[[datetime, datetime], list[datetime]]
+
+
+@dataclass
+class _Entry:
+    content_hash: str
+    range_start: datetime
+    range_end: datetime
+    starts: list[datetime]
+    used_on: date
+
+
+class RecurrenceExpansionCache:
+    """Occurrence starts of recurring VEVENTs, persisted between sync runs.
+
+    Entries are keyed by ``(collection prefix, UID, default timezone)``, since floating
+    DTSTART/RRULE times resolve in the sync timezone, and are valid only for the hash of the
+    VEVENT content they were expanded from, so any edit (RRULE, EXDATE, DTSTART, ...) forces
+    a fresh expansion. An entry covers a closed range of occurrence starts: a request inside
+    that range is answered from the cache, and a range that slid forward only expands the
+    new tail. Thread-safe, since collections are parsed concurrently.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries: dict[str, _Entry] | None = None
+        self._dirty = False
+
+    def expand(
+        self,
+        *,
+        collection: str,
+        uid: str,
+        timezone_name: str,
+        content_hash: str,
+        range_start: datetime,
+        range_end: datetime,
+        tz: tzinfo | None,
+        expand_fn: ExpandFn,
+    ) -> list[datetime]:
+        """Return sorted occurrence starts within ``[range_start, range_end]``.
+
+        ``expand_fn(start, end)`` must return every occurrence start in that closed range.
+        """
+        key = f"{collection}\x1f{uid}\x1f{timezone_name}"
+        today = date.today()
+        with self._lock:
+            entries = self._load()
+            entry = entries.get(key)
+            if entry is not None and entry.content_hash == content_hash:
+                if entry.range_start <= range_start and range_end <= entry.range_end:
+                    if entry.used_on != today:
+                        entry.used_on = today
+                        self._dirty = True
+                    return _localize(_clip(entry.starts, range_start, range_end), tz)
+
+        if entry is not None and entry.content_hash == content_hash and entry.range_start <= range_start <= entry.range_end:
+            # The window slid forward: keep the cached head and expand only the new tail.
+            tail = expand_fn(entry.range_end, range_end)
+            starts = sorted(set(_clip(entry.starts, range_start, entry.range_end)) | set(tail))
+        else:
+            starts = sorted(expand_fn(range_start, range_end))
+
+        with self._lock:
+            self._load()[key] = _Entry(
+                content_hash=content_hash,
+                range_start=range_start,
+                range_end=range_end,
+                starts=starts,
+                used_on=today,
+            )
+            self._dirty = True
+        return _localize(starts, tz)
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._dirty or self.path is None or self._entries is None:
+                return
+            cutoff = date.today() - timedelta(days=_UNUSED_ENTRY_TTL_DAYS)
+            payload = {
+                "version": _CACHE_VERSION,
+                "entries": {
+                    key: {
+                        "hash": entry.content_hash,
+                        "range": [entry.range_start.isoformat(), entry.range_end.isoformat()],
+                        "starts": [start.isoformat() for start in entry.starts],
+                        "used_on": entry.used_on.isoformat(),
+                    }
+                    for key, entry in self._entries.items()
+                    if entry.used_on >= cutoff
+                },
+            }
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+                tmp_path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+                os.replace(tmp_path, self.path)
+            except OSError as exc:
+                logger.warning("caldav_expansion_cache_save_failed error=%s", exc.__class__.__name__)
+                return
+            self._dirty = False
+
+    def _load(self) -> dict[str, _Entry]:
+        if self._entries is not None:
+            return self._entries
+        self._entries = {}
+        if self.path is None or not self.path.exists():
+            return self._entries
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+            if payload.get("version") != _CACHE_VERSION:
+                return self._entries
+            for key, raw in payload["entries"].items():
+                range_start, range_end = raw["range"]
+                self._entries[key] = _Entry(
+                    content_hash=raw["hash"],
+                    range_start=datetime.fromisoformat(range_start),
+                    range_end=datetime.fromisoformat(range_end),
+                    starts=[datetime.fromisoformat(value) for value in raw["starts"]],
+                    used_on=date.fromisoformat(raw["used_on"]),
+                )
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            logger.warning("caldav_expansion_cache_unreadable path=%s", self.path)
+            self._entries = {}
+        return self._entries
+
+
+def hash_recurrence_lines(lines: list[str]) -> str:
+    """Hash the VEVENT content lines that affect recurrence, parameters (TZID) included."""
+    relevant = [line for line in lines if _property_name(line) in _RECURRENCE_PROPERTIES]
+    return hashlib.sha1("\n".join(relevant).encode("utf-8")).hexdigest()
+
+
+def _property_name(line: str) -> str:
+    end = len(line)
+    for separator in (";", ":"):
+        index = line.find(separator)
+        if index != -1:
+            end = min(end, index)
+    return line[:end].strip().upper()
+
+
+def _clip(starts: list[datetime], range_start: datetime, range_end: datetime) -> list[datetime]:
+    return [start for start in starts if range_start <= start <= range_end]
+
+
+def _localize(starts: list[datetime], tz: tzinfo | None) -> list[datetime]:
+    # Cached starts come back from JSON with fixed offsets; restore the event's own zone.
+    if tz is None:
+        return list(starts)
+    return [start.astimezone(tz) for start in starts]
@@ -0,0 +1,174 @@
+"""Resident ``execas serve`` daemon.
+
+Keeps one interpreter warm for the commands ``daemon_client`` forwards: imported command
+modules, the click command tree, the memoized engine with open pooled connections, the
+migrated-schema check and the ZoneInfo cache.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import logging
+import os
+import socket
+import socketserver
+import sys
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import Any, Sequence
+
+from executive_cli.daemon_client import (
+    FORWARDED_GROUPS,
+    STATUS_DB_MISMATCH,
+    STATUS_ENV_MISMATCH,
+    STATUS_OK,
+    STATUS_REJECTED,
+    DaemonError,
+    DaemonResponse,
+    command_environment,
+    get_socket_path,
+    is_forwardable,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def run_command(command: Any, argv: Sequence[str]) -> DaemonResponse:
+    """Invoke the root click ``command`` in this process, capturing its output and exit code."""
+    stdout, stderr = io.StringIO(), io.StringIO()
+    exit_code = 0
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        try:
+            command.main(args=list(argv), prog_name="execas")
+        except SystemExit as exc:
+            exit_code = _exit_code(exc.code)
+        except Exception:
+            traceback.print_exc()
+            exit_code = 1
+    return DaemonResponse(exit_code=exit_code, stdout=stdout.getvalue(), stderr=stderr.getvalue())
+
+
+def _exit_code(code: object) -> int:
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    # sys.exit("message"): Python prints the message to stderr and exits with 1.
+    print(code, file=sys.stderr)
+    return 1
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: DaemonServer
+
+    def handle(self) -> None:
+        try:
+            request = json.loads(self.rfile.readline())
+            argv = [str(item) for item in request["argv"]]
+            db_path = str(request["db_path"])
+            cwd = str(request["cwd"])
+            env = {str(name): str(value) for name, value in request["env"].items()}
+        except (ValueError, KeyError, TypeError, AttributeError):
+            self._reply({"status": STATUS_REJECTED})
+            return
+
+        if db_path != str(self.server.db_path):
+            self._reply({"status": STATUS_DB_MISMATCH})
+            return
+        # Engine pragmas and other settings are read once per process, so a caller with
+        # different EXECAS_* settings runs the command itself rather than with ours.
+        if env != self.server.environment:
+            self._reply({"status": STATUS_ENV_MISMATCH})
+            return
+        if not is_forwardable(argv):
+            self._reply({"status": STATUS_REJECTED})
+            return
+
+        # Commands run one at a time, so switching the process cwd for one is safe.
+        daemon_cwd = os.getcwd()
+        try:
+            os.chdir(cwd)
+        except OSError:
+            self._reply({"status": STATUS_REJECTED})
+            return
+        try:
+            response = run_command(self.server.command, argv)
+        finally:
+            os.chdir(daemon_cwd)
+        logger.debug("daemon_command argv=%s exit_code=%s", " ".join(argv[:2]), response.exit_code)
+        self._reply(
+            {
+                "status": STATUS_OK,
+                "exit_code": response.exit_code,
+                "stdout": response.stdout,
+                "stderr": response.stderr,
+            }
+        )
+
+    def _reply(self, payload: dict[str, object]) -> None:
+        self.wfile.write(json.dumps(payload).encode("utf-8"))
+
+
+class DaemonServer(socketserver.UnixStreamServer):
+    """Serves one command at a time: commands share process-wide stdout/stderr redirection."""
+
+    def __init__(self, socket_path: Path, *, command: Any, db_path: Path) -> None:
+        self.socket_path = socket_path
+        self.command = command
+        self.db_path = db_path
+        # The settings this process was started with, which cached state was built from.
+        self.environment = command_environment()
+        super().__init__(str(socket_path), _RequestHandler)
+
+    def server_bind(self) -> None:
+        # Create the socket owner-only; a chmod after bind would leave a window where other
+        # local users could connect.
+        previous_umask = os.umask(0o177)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(previous_umask)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.socket_path.unlink(missing_ok=True)
+
+
+def create_server(socket_path: Path | None = None) -> DaemonServer:
+    """Warm up the command modules and database engine, then bind the daemon socket."""
+    import typer
+
+    from executive_cli.cli import app
+    from executive_cli.db import get_engine, initialize_database
+
+    path = socket_path or get_socket_path()
+    _claim_socket_path(path)
+
+    db_path = initialize_database()
+    with get_engine(ensure_directory=True).connect() as connection:
+        connection.exec_driver_sql("SELECT 1")
+    # Build the click tree once (a Typer app rebuilds it on every call) and import the
+    # forwarded command modules up front.
+    command = typer.main.get_command(app)
+    for name in FORWARDED_GROUPS:
+        command.commands[name].load()
+
+    server = DaemonServer(path, command=command, db_path=db_path)
+    logger.info("daemon_listening socket=%s db_path=%s", path, db_path)
+    return server
+
+
+def _claim_socket_path(path: Path) -> None:
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(str(path))
+        except OSError:
+            # Left behind by a daemon that did not shut down cleanly.
+            path.unlink()
+            return
+    raise DaemonError(f"An execas daemon is already listening on {path}.")
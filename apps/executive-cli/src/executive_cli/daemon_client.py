@@ -0,0 +1,126 @@
+"""Thin client for the ``execas serve`` daemon, imported by the ``execas`` launcher.
+
+Imports only the standard library (and the SQLAlchemy-free ``paths`` module), so a
+forwarded command costs interpreter start plus one round trip over a Unix socket.
+
+Protocol: the client sends one JSON line ``{"argv": [...], "db_path": "...", "cwd": "...",
+"env": {...}}`` (``env`` holds the caller's ``EXECAS_*`` settings) and reads
+one JSON reply ``{"status": "ok", "exit_code": n, "stdout": "...", "stderr": "..."}``.
+Any other status means the daemon did not run the command and the client falls back
+to in-process execution.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+from pathlib import Path
+from typing import NamedTuple, Sequence
+
+from executive_cli.paths import get_db_path
+
+DAEMON_ENV = "EXECAS_DAEMON"
+SOCKET_PATH_ENV = "EXECAS_SOCKET_PATH"
+CLIENT_TIMEOUT_SEC = 30.0
+
+# Groups that only touch the local database and never prompt. Network sync, ingest and
+# keychain commands always run in the calling process (they are slow, interactive, or
+# depend on the caller's environment), as does anything outside this list.
+FORWARDED_GROUPS = frozenset(
+    {"area", "busy", "commitment", "config", "db", "decision", "people", "plan", "project", "review", "task"}
+)
+_LOCAL_ONLY_COMMANDS = frozenset({("review", "scrum-metrics")})
+
+STATUS_OK = "ok"
+STATUS_DB_MISMATCH = "db_mismatch"
+STATUS_REJECTED = "rejected"
+STATUS_ENV_MISMATCH = "env_mismatch"
+
+# Client-side switches, or (EXECAS_DB_PATH) checked separately as the resolved db_path.
+_UNCOMPARED_ENV = frozenset({DAEMON_ENV, SOCKET_PATH_ENV, "EXECAS_DB_PATH"})
+
+
+class DaemonError(RuntimeError):
+    """Raised when the daemon cannot start or a forwarded command loses its reply."""
+
+
+class DaemonResponse(NamedTuple):
+    exit_code: int
+    stdout: str
+    stderr: str
+
+
+def get_socket_path() -> Path:
+    override = os.getenv(SOCKET_PATH_ENV)
+    if override:
+        return Path(override).expanduser()
+    db_path = get_db_path()
+    return db_path.with_name(f"{db_path.name}.sock")
+
+
+def command_environment() -> dict[str, str]:
+    """The ``EXECAS_*`` settings a command may read; the daemon serves only callers sharing them."""
+    return {
+        name: value
+        for name, value in os.environ.items()
+        if name.startswith("EXECAS_") and name not in _UNCOMPARED_ENV
+    }
+
+
+def is_forwardable(argv: Sequence[str]) -> bool:
+    if not argv or argv[0] not in FORWARDED_GROUPS:
+        return False
+    return tuple(argv[:2]) not in _LOCAL_ONLY_COMMANDS
+
+
+def forward_command(argv: Sequence[str], *, socket_path: Path | None = None) -> DaemonResponse | None:
+    """Run ``argv`` in the daemon; ``None`` means the caller should run it in-process."""
+    if os.getenv(DAEMON_ENV, "").strip() == "0" or not is_forwardable(argv):
+        return None
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+
+    path = socket_path or get_socket_path()
+    payload = {
+        "argv": list(argv),
+        "db_path": str(get_db_path()),
+        "cwd": os.getcwd(),
+        "env": command_environment(),
+    }
+    request = json.dumps(payload).encode("utf-8") + b"\n"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(CLIENT_TIMEOUT_SEC)
+        try:
+            client.connect(str(path))
+        except OSError:
+            # No daemon (or a stale socket file): nothing was sent, so running locally is safe.
+            return None
+        try:
+            client.sendall(request)
+            client.shutdown(socket.SHUT_WR)
+            reply = _read_until_eof(client)
+        except OSError as exc:
+            # The command may already have run; retrying locally could apply it twice.
+            raise DaemonError(f"execas daemon did not reply: {exc.__class__.__name__}") from exc
+
+    # An empty or malformed reply (e.g. the daemon died mid-command) is not a refusal, so
+    # running locally is just as unsafe as after a transport error.
+    try:
+        response = json.loads(reply)
+        if response.get("status") != STATUS_OK:
+            return None
+        return DaemonResponse(
+            exit_code=int(response["exit_code"]),
+            stdout=str(response["stdout"]),
+            stderr=str(response["stderr"]),
+        )
+    except (ValueError, TypeError, KeyError, AttributeError) as exc:
+        raise DaemonError("execas daemon sent an invalid reply") from exc
+
+
+def _read_until_eof(sock: socket.socket) -> bytes:
+    chunks: list[bytes] = []
+    while chunk := sock.recv(65536):
+        chunks.append(chunk)
+    return b"".join(chunks)
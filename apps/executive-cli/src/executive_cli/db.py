@@ -1,13 +1,20 @@
 from __future__ import annotations
 
+import atexit
+import logging
 import os
+import sqlite3
+import threading
+from contextlib import closing
+from dataclasses import dataclass
 from pathlib import Path
 
-from alembic import command
-from alembic.config import Config
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 from sqlmodel import Session, create_engine, select
 
 from executive_cli.models import Calendar, Settings
+from executive_cli.paths import PROJECT_ROOT, get_db_path
 
 DEFAULT_SETTINGS: dict[str, str] = {
     "timezone": "Europe/Moscow",
@@ -17,31 +24,19 @@ DEFAULT_SETTINGS: dict[str, str] = {
     "lunch_duration_min": "60",
     "min_focus_block_min": "30",
     "buffer_min": "5",
+    "planner_engine": "greedy",
+    "planner_time_budget_ms": "200",
     "ingest_auto_threshold": "0.8",
     "ingest_llm_provider": "anthropic",
     "ingest_llm_model": "claude-sonnet-4-5-20250929",
     "ingest_llm_temperature": "0",
 }
+logger = logging.getLogger(__name__)
+
 PRIMARY_CALENDAR_SLUG = "primary"
 PRIMARY_CALENDAR_NAME = "Primary"
 
 
-# /apps/executive-cli/src/executive_cli/db.py -> /apps/executive-cli
-PROJECT_ROOT = Path(__file__).resolve().parents[2]
-DEFAULT_DB_PATH = PROJECT_ROOT / ".data" / "execas.sqlite"
-
-
-def get_db_path() -> Path:
-    db_path_env = os.getenv("EXECAS_DB_PATH")
-    if not db_path_env:
-        return DEFAULT_DB_PATH
-
-    candidate = Path(db_path_env).expanduser()
-    if candidate.is_absolute():
-        return candidate
-    return (Path.cwd() / candidate).resolve()
-
-
 def ensure_db_directory() -> Path:
     db_path = get_db_path()
     db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -53,20 +48,210 @@ def get_database_url(*, ensure_directory: bool = False) -> str:
     return f"sqlite:///{db_path}"
 
 
-def get_engine(*, ensure_directory: bool = False):
-    return create_engine(
-        get_database_url(ensure_directory=ensure_directory),
-        connect_args={"check_same_thread": False},
-    )
+_JOURNAL_MODES = ("DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF")
+_SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+_TEMP_STORES = ("DEFAULT", "FILE", "MEMORY")
+
+
+@dataclass(frozen=True)
+class SqliteTuning:
+    """Connection-level SQLite pragmas applied to every engine connection.
+
+    WAL lets hourly sync writes and interactive reads proceed concurrently; with WAL,
+    ``synchronous=NORMAL`` stays durable across application crashes. ``busy_timeout``
+    makes a writer wait for the lock instead of failing with "database is locked".
+    """
+
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    mmap_size: int = 256 * 1024 * 1024
+    # Negative values are KiB (SQLite convention): 64 MiB page cache.
+    cache_size: int = -64 * 1024
+    temp_store: str = "MEMORY"
+    busy_timeout_ms: int = 5000
+
+    @classmethod
+    def from_env(cls) -> SqliteTuning:
+        defaults = cls()
+        return cls(
+            journal_mode=_read_choice_env("EXECAS_SQLITE_JOURNAL_MODE", _JOURNAL_MODES, defaults.journal_mode),
+            synchronous=_read_choice_env("EXECAS_SQLITE_SYNCHRONOUS", _SYNCHRONOUS_MODES, defaults.synchronous),
+            mmap_size=_read_int_env("EXECAS_SQLITE_MMAP_SIZE", defaults.mmap_size, minimum=0),
+            cache_size=_read_int_env("EXECAS_SQLITE_CACHE_SIZE", defaults.cache_size),
+            temp_store=_read_choice_env("EXECAS_SQLITE_TEMP_STORE", _TEMP_STORES, defaults.temp_store),
+            busy_timeout_ms=_read_int_env("EXECAS_SQLITE_BUSY_TIMEOUT_MS", defaults.busy_timeout_ms, minimum=0),
+        )
+
+    def pragmas(self) -> list[tuple[str, str | int]]:
+        # busy_timeout first, so switching the journal mode already waits for other writers.
+        return [
+            ("busy_timeout", self.busy_timeout_ms),
+            ("journal_mode", self.journal_mode),
+            ("synchronous", self.synchronous),
+            ("mmap_size", self.mmap_size),
+            ("cache_size", self.cache_size),
+            ("temp_store", self.temp_store),
+        ]
+
+
+def _read_choice_env(env_var: str, choices: tuple[str, ...], default: str) -> str:
+    value = (os.getenv(env_var) or "").strip().upper()
+    if not value:
+        return default
+    if value not in choices:
+        logger.warning("sqlite_tuning_invalid env=%s value=%s", env_var, value)
+        return default
+    return value
+
+
+def _read_int_env(env_var: str, default: int, *, minimum: int | None = None) -> int:
+    value = (os.getenv(env_var) or "").strip()
+    if not value:
+        return default
+    try:
+        parsed = int(value)
+    except ValueError:
+        parsed = None
+    if parsed is None or (minimum is not None and parsed < minimum):
+        logger.warning("sqlite_tuning_invalid env=%s value=%s", env_var, value)
+        return default
+    return parsed
+
+
+def apply_sqlite_tuning(engine, tuning: SqliteTuning | None = None) -> None:
+    """Run the tuning pragmas on every new DBAPI connection of ``engine``."""
+    statements = [f"PRAGMA {name}={value}" for name, value in (tuning or SqliteTuning.from_env()).pragmas()]
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record) -> None:
+        del connection_record
+        cursor = dbapi_connection.cursor()
+        try:
+            for statement in statements:
+                cursor.execute(statement)
+        finally:
+            cursor.close()
+
+
+def read_sqlite_pragmas(connection) -> dict[str, str | int]:
+    """Effective values of the tuning pragmas on an open connection, with enum names resolved."""
+    values: dict[str, str | int] = {}
+    for name, _ in SqliteTuning().pragmas():
+        row = connection.exec_driver_sql(f"PRAGMA {name}").first()
+        value = row[0] if row is not None else "-"
+        if name == "synchronous" and isinstance(value, int) and value < len(_SYNCHRONOUS_MODES):
+            value = _SYNCHRONOUS_MODES[value]
+        elif name == "temp_store" and isinstance(value, int) and value < len(_TEMP_STORES):
+            value = _TEMP_STORES[value]
+        elif isinstance(value, str):
+            value = value.upper()
+        values[name] = value
+    return values
+
+
+# Hourly sync runs calendar and mail in parallel threads; interactive commands use one
+# connection. Pooled connections keep their pragmas and page cache between sessions.
+_ENGINE_POOL_SIZE = 4
+_ENGINE_MAX_OVERFLOW = 4
+
+_engines: dict[str, Engine] = {}
+_engines_lock = threading.Lock()
+
+
+def get_engine(*, ensure_directory: bool = False) -> Engine:
+    """Return the process-wide engine for the configured database, creating it on first use.
+
+    Engines are memoized by database URL, so ``EXECAS_DB_PATH`` changes still get their own
+    engine. Tuning pragmas are read from the environment once, when the engine is built.
+    """
+    url = get_database_url(ensure_directory=ensure_directory)
+    with _engines_lock:
+        engine = _engines.get(url)
+        if engine is None:
+            engine = create_engine(
+                url,
+                connect_args={"check_same_thread": False},
+                pool_size=_ENGINE_POOL_SIZE,
+                max_overflow=_ENGINE_MAX_OVERFLOW,
+            )
+            apply_sqlite_tuning(engine)
+            _engines[url] = engine
+        return engine
+
+
+def dispose_engines() -> None:
+    """Close every pooled connection of the cached engines; runs at interpreter exit."""
+    with _engines_lock:
+        engines = list(_engines.values())
+        _engines.clear()
+    for engine in engines:
+        engine.dispose()
+
+
+atexit.register(dispose_engines)
+
+
+# Newest revision in alembic/versions. Bump together with every new migration;
+# tests/test_schema_head.py fails when the two drift apart.
+SCHEMA_HEAD_REVISION = "b3d6f8a1c5e9"
+
+# db path -> file stamp at which the schema was last seen at SCHEMA_HEAD_REVISION.
+_schema_at_head: dict[Path, tuple[int, ...]] = {}
+
+
+def read_schema_revision(db_path: Path) -> str | None:
+    """Return the revision stamped in ``alembic_version``, or ``None`` for an unmigrated file."""
+    if not db_path.exists():
+        return None
+    try:
+        with closing(sqlite3.connect(db_path)) as connection:
+            rows = connection.execute("SELECT version_num FROM alembic_version").fetchall()
+    except sqlite3.Error:
+        return None
+    if len(rows) != 1:
+        return None
+    return rows[0][0]
+
+
+def _db_file_stamp(db_path: Path) -> tuple[int, ...] | None:
+    try:
+        stamp = [db_path.stat().st_mtime_ns]
+    except FileNotFoundError:
+        return None
+    # In WAL mode a migration may still sit in the -wal file, so it is part of the stamp.
+    wal_path = db_path.with_name(f"{db_path.name}-wal")
+    if wal_path.exists():
+        stamp.append(wal_path.stat().st_mtime_ns)
+    return tuple(stamp)
+
+
+def schema_is_at_head(db_path: Path) -> bool:
+    stamp = _db_file_stamp(db_path)
+    if stamp is None:
+        return False
+    if _schema_at_head.get(db_path) == stamp:
+        return True
+    if read_schema_revision(db_path) != SCHEMA_HEAD_REVISION:
+        return False
+    _schema_at_head[db_path] = stamp
+    return True
 
 
 def apply_migrations() -> None:
-    ensure_db_directory()
+    db_path = ensure_db_directory()
+    if schema_is_at_head(db_path):
+        return
+
+    # Alembic costs ~100 ms to import and loads every migration script; only pay for it
+    # when the database is actually behind.
+    from alembic import command
+    from alembic.config import Config
 
     alembic_cfg = Config(str(PROJECT_ROOT / "alembic.ini"))
     alembic_cfg.set_main_option("script_location", str(PROJECT_ROOT / "alembic"))
     alembic_cfg.set_main_option("sqlalchemy.url", get_database_url(ensure_directory=True))
     command.upgrade(alembic_cfg, "head")
+    logger.info("schema_migrated path=%s revision=%s", db_path, read_schema_revision(db_path))
 
 
 def seed_defaults() -> None:
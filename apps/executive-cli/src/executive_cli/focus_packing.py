@@ -0,0 +1,254 @@
+"""Branch-and-bound packing of focus tasks into free gaps.
+
+A pure integer model of the planner's placement problem: each gap is a bin, each task an
+item with a duration and a value, consecutive items in a bin are separated by
+``spacing`` minutes, and the total packed duration is capped. The search maximizes the
+total value and stops at a hard deadline, returning the best packing found so far.
+"""
+
+from __future__ import annotations
+
+import time
+from bisect import bisect_right
+from dataclasses import dataclass
+
+# The deadline is checked once per this many search nodes.
+_DEADLINE_CHECK_INTERVAL = 256
+_SKIP = -1
+
+
+@dataclass(frozen=True)
+class PackingItem:
+    key: int
+    minutes: int
+    value: int
+
+
+@dataclass(frozen=True)
+class PackingResult:
+    """Bin index per packed item key; ``proven_optimal`` is False when the deadline hit."""
+
+    assignment: dict[int, int]
+    value: int
+    proven_optimal: bool
+
+
+def pack_items(
+    items: list[PackingItem],
+    bin_minutes: list[int],
+    *,
+    spacing: int,
+    total_limit: int,
+    lower_bound: int,
+    time_budget_s: float,
+) -> PackingResult | None:
+    """Return the highest-value packing worth more than ``lower_bound``, or None.
+
+    An item of ``m`` minutes uses ``m + spacing`` of a bin whose capacity is its length
+    plus ``spacing``, which is exactly the room sequential placement with a buffer between
+    neighbours needs. Items are tried best value-per-minute first and every subtree is
+    bounded by the fractional relaxation of both the bin space and ``total_limit``.
+    """
+    deadline = time.perf_counter() + time_budget_s
+    ordered = sorted(
+        (item for item in items if item.minutes > 0 and item.value > 0),
+        key=lambda item: (-item.value / (item.minutes + spacing), item.key),
+    )
+    remaining = [minutes + spacing for minutes in bin_minutes]
+    count = len(ordered)
+
+    # The items still undecided at ``position`` are exactly ``ordered[position:]``, so the
+    # bin-space bound is one bisect over prefix sums of that order.
+    weight_prefix = [0] * (count + 1)
+    value_prefix = [0] * (count + 1)
+    for depth, item in enumerate(ordered):
+        weight_prefix[depth + 1] = weight_prefix[depth] + item.minutes + spacing
+        value_prefix[depth + 1] = value_prefix[depth] + item.value
+    # The total-minutes bound needs the same items in value-per-minute order; they live in
+    # a Fenwick tree that drops an item on descent and restores it on backtrack.
+    undecided = _UndecidedItems(sorted(ordered, key=lambda item: (-item.value / item.minutes, item.key)))
+    rank_by_depth = [undecided.rank_of[item.key] for item in ordered]
+
+    choices = [_SKIP] * count
+    options: list[list[int]] = [[] for _ in range(count)]
+    best_value = lower_bound
+    best_choices: list[int] | None = None
+    value = 0
+    total = 0
+    free = sum(remaining)
+    position = 0
+    nodes = 0
+    exhausted = False
+
+    while True:
+        nodes += 1
+        if nodes % _DEADLINE_CHECK_INTERVAL == 0 and time.perf_counter() >= deadline:
+            break
+
+        descend = False
+        if position < count:
+            bound = value + min(
+                _suffix_bound(ordered, weight_prefix, value_prefix, position, free, spacing=spacing),
+                undecided.bound(total_limit - total),
+            )
+            if bound > best_value:
+                item = ordered[position]
+                options[position] = _bin_options(
+                    remaining,
+                    item.minutes + spacing,
+                    fits_total=total + item.minutes <= total_limit,
+                )
+                descend = True
+        elif value > best_value:
+            best_value = value
+            best_choices = list(choices)
+
+        if descend:
+            choice = options[position].pop(0)
+            value, total = _apply(ordered[position], choice, choices, position, remaining, value, total, spacing)
+            if choice != _SKIP:
+                free -= ordered[position].minutes + spacing
+            undecided.remove(rank_by_depth[position])
+            position += 1
+            continue
+
+        # Backtrack to the deepest level that still has an untried option.
+        position -= 1
+        while position >= 0:
+            if choices[position] != _SKIP:
+                free += ordered[position].minutes + spacing
+            value, total = _undo(ordered[position], choices, position, remaining, value, total, spacing)
+            if options[position]:
+                choice = options[position].pop(0)
+                value, total = _apply(ordered[position], choice, choices, position, remaining, value, total, spacing)
+                if choice != _SKIP:
+                    free -= ordered[position].minutes + spacing
+                position += 1
+                break
+            undecided.restore(rank_by_depth[position])
+            position -= 1
+        if position < 0:
+            exhausted = True
+            break
+
+    if best_choices is None:
+        return None
+    assignment = {
+        item.key: choice for item, choice in zip(ordered, best_choices) if choice != _SKIP
+    }
+    return PackingResult(assignment=assignment, value=best_value, proven_optimal=exhausted)
+
+
+def _suffix_bound(
+    ordered: list[PackingItem],
+    weight_prefix: list[int],
+    value_prefix: list[int],
+    position: int,
+    capacity: int,
+    *,
+    spacing: int,
+) -> float:
+    """Fractional-knapsack value of ``ordered[position:]`` in ``capacity``."""
+    limit = weight_prefix[position] + capacity
+    last = bisect_right(weight_prefix, limit, lo=position) - 1
+    bound = float(value_prefix[last] - value_prefix[position])
+    if last < len(ordered):
+        item = ordered[last]
+        bound += item.value * (limit - weight_prefix[last]) / (item.minutes + spacing)
+    return bound
+
+
+class _UndecidedItems:
+    """Fenwick tree over item minutes and values, indexed by value-per-minute rank."""
+
+    def __init__(self, by_minutes: list[PackingItem]) -> None:
+        self.size = len(by_minutes)
+        self.rank_of = {item.key: rank for rank, item in enumerate(by_minutes, start=1)}
+        self._minutes = [0] + [item.minutes for item in by_minutes]
+        self._values = [0] + [item.value for item in by_minutes]
+        self._minutes_tree = [0] * (self.size + 1)
+        self._values_tree = [0] * (self.size + 1)
+        for rank in range(1, self.size + 1):
+            self.restore(rank)
+        self._top_step = 1 << (self.size.bit_length() - 1) if self.size else 0
+
+    def remove(self, rank: int) -> None:
+        self._add(rank, -self._minutes[rank], -self._values[rank])
+
+    def restore(self, rank: int) -> None:
+        self._add(rank, self._minutes[rank], self._values[rank])
+
+    def bound(self, capacity: int) -> float:
+        """Fractional-knapsack value of the items still in the tree within ``capacity``."""
+        if capacity <= 0:
+            return 0.0
+        # Find the longest rank prefix that fits. Removed items weigh nothing, so the rank
+        # right after it is a present item that only fits fractionally.
+        rank = 0
+        minutes = 0
+        value = 0
+        step = self._top_step
+        while step:
+            candidate = rank + step
+            if candidate <= self.size and minutes + self._minutes_tree[candidate] <= capacity:
+                rank = candidate
+                minutes += self._minutes_tree[candidate]
+                value += self._values_tree[candidate]
+            step >>= 1
+        if rank == self.size:
+            return float(value)
+        following = rank + 1
+        return value + self._values[following] * (capacity - minutes) / self._minutes[following]
+
+    def _add(self, rank: int, minutes: int, value: int) -> None:
+        while rank <= self.size:
+            self._minutes_tree[rank] += minutes
+            self._values_tree[rank] += value
+            rank += rank & -rank
+
+
+def _bin_options(remaining: list[int], weight: int, *, fits_total: bool) -> list[int]:
+    options: list[int] = []
+    if fits_total:
+        # Bins with equal free space are interchangeable; trying the earliest is enough.
+        seen: set[int] = set()
+        for index, free in enumerate(remaining):
+            if free >= weight and free not in seen:
+                seen.add(free)
+                options.append(index)
+    options.append(_SKIP)
+    return options
+
+
+def _apply(
+    item: PackingItem,
+    choice: int,
+    choices: list[int],
+    position: int,
+    remaining: list[int],
+    value: int,
+    total: int,
+    spacing: int,
+) -> tuple[int, int]:
+    choices[position] = choice
+    if choice == _SKIP:
+        return value, total
+    remaining[choice] -= item.minutes + spacing
+    return value + item.value, total + item.minutes
+
+
+def _undo(
+    item: PackingItem,
+    choices: list[int],
+    position: int,
+    remaining: list[int],
+    value: int,
+    total: int,
+    spacing: int,
+) -> tuple[int, int]:
+    choice = choices[position]
+    choices[position] = _SKIP
+    if choice == _SKIP:
+        return value, total
+    remaining[choice] += item.minutes + spacing
+    return value - item.value, total - item.minutes
@@ -0,0 +1,362 @@
+from __future__ import annotations
+
+import http.client
+import io
+import logging
+import os
+import ssl
+import threading
+import zlib
+from dataclasses import dataclass, field
+from email.message import Message
+from urllib.error import HTTPError, URLError
+from urllib.parse import urljoin, urlsplit
+import urllib.request
+from urllib.request import Request
+
+logger = logging.getLogger(__name__)
+_MAX_CONNECTIONS_PER_HOST_DEFAULT = 4
+# Same limit as urllib's HTTPRedirectHandler.
+_MAX_REDIRECTS = 10
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+# Read-only methods whose redirects are followed with the method and body unchanged, which
+# is what CalDAV servers expect (e.g. a PROPFIND redirected to the calendar home).
+_REDIRECTABLE_METHODS = frozenset({"GET", "HEAD", "PROPFIND", "REPORT"})
+# Methods safe to re-send after a dropped connection, even if the server may have seen them.
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "PROPFIND", "REPORT"})
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+_HostKey = tuple[str, str, int]
+
+
+@dataclass
+class PooledResponse:
+    """Fully read HTTP response; mirrors the part of ``urlopen`` responses callers use."""
+
+    status: int
+    reason: str
+    headers: Message
+    body: bytes
+
+    def read(self) -> bytes:
+        return self.body
+
+    def __enter__(self) -> PooledResponse:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+@dataclass
+class _HostSlot:
+    limit: threading.BoundedSemaphore
+    idle: list[http.client.HTTPConnection] = field(default_factory=list)
+
+
+class HttpConnectionPool:
+    """Keep-alive HTTP/1.1 connections shared per ``(scheme, host, port)``.
+
+    At most ``max_connections_per_host`` requests run against one host at a time; extra
+    callers block until a connection is returned. Unless streamed, responses are read
+    eagerly so the connection can go back to the pool before the caller parses the body.
+
+    The pool only talks to origin servers: a URL that ``urllib.request.getproxies()`` routes
+    through a proxy (and ``proxy_bypass`` does not exempt) is handed to
+    ``urllib.request.urlopen`` instead, without pooling or compression.
+    """
+
+    def __init__(self, *, max_connections_per_host: int = _MAX_CONNECTIONS_PER_HOST_DEFAULT) -> None:
+        if max_connections_per_host <= 0:
+            raise ValueError("max_connections_per_host must be >= 1")
+        self.max_connections_per_host = max_connections_per_host
+        self._lock = threading.Lock()
+        self._hosts: dict[_HostKey, _HostSlot] = {}
+        self._ssl_context = ssl.create_default_context()
+
+    def urlopen(
+        self,
+        request: Request,
+        *,
+        timeout: float,
+        stream: bool = False,
+    ) -> PooledResponse | StreamingResponse | http.client.HTTPResponse:
+        """Send ``request`` and return the decoded response.
+
+        Raises ``HTTPError`` for non-2xx statuses, ``URLError`` for connection failures and
+        ``TimeoutError`` for socket timeouts, like ``urllib.request.urlopen``. Redirects are
+        followed only for read-only methods (GET, HEAD, PROPFIND, REPORT); ``Authorization``
+        is dropped when a redirect leaves the origin. With ``stream=True`` a successful
+        response is returned unread and keeps its connection until it is closed.
+        """
+        for _ in range(_MAX_REDIRECTS + 1):
+            if _uses_proxy(request.full_url):
+                return urllib.request.urlopen(request, timeout=timeout)
+            response = self._send(request, timeout=timeout)
+            location = response.headers.get("Location")
+            if response.status in _REDIRECT_STATUSES and location and request.get_method() in _REDIRECTABLE_METHODS:
+                with response:
+                    response.read()
+                request = _redirected_request(request, location)
+                continue
+
+            success = 200 <= response.status < 300
+            if stream and success:
+                return response
+            with response:
+                body = response.read()
+            if not success:
+                raise HTTPError(request.full_url, response.status, response.reason, response.headers, io.BytesIO(body))
+            return PooledResponse(status=response.status, reason=response.reason, headers=response.headers, body=body)
+
+        raise HTTPError(request.full_url, response.status, "too many redirects", response.headers, io.BytesIO(b""))
+
+    def _send(self, request: Request, *, timeout: float) -> StreamingResponse:
+        parts = urlsplit(request.full_url)
+        scheme = parts.scheme.lower()
+        if scheme not in {"http", "https"} or not parts.hostname:
+            raise URLError(f"unsupported URL: {request.full_url}")
+        port = parts.port or (443 if scheme == "https" else 80)
+        key = (scheme, parts.hostname, port)
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+
+        headers = {name.title(): value for name, value in request.header_items()}
+        headers.setdefault("Accept-Encoding", "gzip, deflate")
+        headers.setdefault("Connection", "keep-alive")
+        method = request.get_method()
+
+        slot = self._slot(key)
+        slot.limit.acquire()
+        try:
+            connection, raw = self._start(slot, key, method, target, request.data, headers, timeout)
+        except BaseException:
+            slot.limit.release()
+            raise
+
+        return StreamingResponse(pool=self, slot=slot, connection=connection, raw=raw)
+
+    def close(self) -> None:
+        with self._lock:
+            hosts = list(self._hosts.values())
+            self._hosts.clear()
+        for slot in hosts:
+            while slot.idle:
+                slot.idle.pop().close()
+
+    def _slot(self, key: _HostKey) -> _HostSlot:
+        with self._lock:
+            slot = self._hosts.get(key)
+            if slot is None:
+                slot = _HostSlot(limit=threading.BoundedSemaphore(self.max_connections_per_host))
+                self._hosts[key] = slot
+            return slot
+
+    def _start(
+        self,
+        slot: _HostSlot,
+        key: _HostKey,
+        method: str,
+        target: str,
+        body: bytes | None,
+        headers: dict[str, str],
+        timeout: float,
+    ) -> tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+        with self._lock:
+            connection = slot.idle.pop() if slot.idle else None
+        reused = connection is not None
+        if connection is None:
+            connection = self._connect(key, timeout)
+        else:
+            _set_timeout(connection, timeout)
+
+        sent = False
+        try:
+            connection.request(method, target, body=body, headers=headers)
+            sent = True
+            return connection, connection.getresponse()
+        except _STALE_CONNECTION_ERRORS:
+            connection.close()
+            if not reused or (sent and method not in _IDEMPOTENT_METHODS):
+                # Once a POST is fully sent, the server may have acted on it before closing.
+                raise URLError("connection closed by server") from None
+            # The server dropped an idle keep-alive connection; retry once on a fresh one.
+            logger.debug("http_pool_stale_connection host=%s", key[1])
+            return self._start(slot, key, method, target, body, headers, timeout)
+        except TimeoutError:
+            connection.close()
+            raise
+        except (OSError, http.client.HTTPException) as exc:
+            connection.close()
+            raise URLError(exc) from None
+
+    def _release(self, slot: _HostSlot, connection: http.client.HTTPConnection, *, reusable: bool) -> None:
+        if reusable:
+            with self._lock:
+                slot.idle.append(connection)
+        else:
+            connection.close()
+        slot.limit.release()
+
+    def _connect(self, key: _HostKey, timeout: float) -> http.client.HTTPConnection:
+        scheme, host, port = key
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=timeout, context=self._ssl_context)
+        return http.client.HTTPConnection(host, port, timeout=timeout)
+
+
+class StreamingResponse:
+    """Response body read incrementally; the connection returns to the pool on ``close``."""
+
+    def __init__(
+        self,
+        *,
+        pool: HttpConnectionPool,
+        slot: _HostSlot,
+        connection: http.client.HTTPConnection,
+        raw: http.client.HTTPResponse,
+    ) -> None:
+        self.status = raw.status
+        self.reason = raw.reason
+        self.headers = raw.msg
+        self._pool = pool
+        self._slot = slot
+        self._connection = connection
+        self._raw = raw
+        self._decoder = _StreamDecoder(raw.getheader("Content-Encoding"))
+        self._closed = False
+
+    def read(self, size: int = -1) -> bytes:
+        if self._closed:
+            return b""
+        try:
+            while True:
+                chunk = self._raw.read() if size < 0 else self._raw.read(size)
+                if not chunk:
+                    return self._decoder.flush()
+                decoded = self._decoder.decode(chunk)
+                # A compressed chunk may decode to nothing; keep reading so b"" still means EOF.
+                if decoded or size < 0:
+                    return decoded + (self._decoder.flush() if size < 0 else b"")
+        except TimeoutError:
+            self.close()
+            raise
+        except (OSError, http.client.HTTPException) as exc:
+            self.close()
+            raise URLError(exc) from None
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        # Only a fully consumed body leaves the connection at a request boundary.
+        reusable = self._raw.isclosed() and not self._raw.will_close
+        if not reusable:
+            self._raw.close()
+        self._pool._release(self._slot, self._connection, reusable=reusable)
+
+    def __enter__(self) -> StreamingResponse:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.close()
+        return False
+
+
+class _StreamDecoder:
+    def __init__(self, content_encoding: str | None) -> None:
+        self.encoding = (content_encoding or "").strip().lower()
+        self._decompressor: zlib._Decompress | None = None
+        if self.encoding in {"gzip", "x-gzip"}:
+            self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        self._pending_deflate = self.encoding == "deflate"
+
+    def decode(self, chunk: bytes) -> bytes:
+        if self._pending_deflate:
+            self._pending_deflate = False
+            # Some servers send raw deflate without the zlib header.
+            wbits = zlib.MAX_WBITS if _has_zlib_header(chunk) else -zlib.MAX_WBITS
+            self._decompressor = zlib.decompressobj(wbits)
+        if self._decompressor is None:
+            return chunk
+        try:
+            return self._decompressor.decompress(chunk)
+        except zlib.error:
+            raise URLError(f"invalid {self.encoding} response body") from None
+
+    def flush(self) -> bytes:
+        if self._decompressor is None:
+            return b""
+        try:
+            return self._decompressor.flush()
+        except zlib.error:
+            raise URLError(f"invalid {self.encoding} response body") from None
+
+
+def _has_zlib_header(chunk: bytes) -> bool:
+    return len(chunk) >= 2 and chunk[0] & 0x0F == 8 and ((chunk[0] << 8) | chunk[1]) % 31 == 0
+
+
+def _uses_proxy(url: str) -> bool:
+    parts = urlsplit(url)
+    proxies = urllib.request.getproxies()
+    if not proxies.get(parts.scheme.lower()):
+        return False
+    return not urllib.request.proxy_bypass(parts.netloc)
+
+
+def _redirected_request(request: Request, location: str) -> Request:
+    url = urljoin(request.full_url, location)
+    headers = dict(request.header_items())
+    old, new = urlsplit(request.full_url), urlsplit(url)
+    if (old.scheme, old.netloc) != (new.scheme, new.netloc):
+        headers = {name: value for name, value in headers.items() if name.lower() != "authorization"}
+    return Request(url, data=request.data, headers=headers, method=request.get_method())
+
+
+def _set_timeout(connection: http.client.HTTPConnection, timeout: float) -> None:
+    connection.timeout = timeout
+    if connection.sock is not None:
+        connection.sock.settimeout(timeout)
+
+
+def _read_max_connections_per_host() -> int:
+    value = (os.getenv("EXECAS_HTTP_MAX_CONNECTIONS_PER_HOST") or "").strip()
+    if not value:
+        return _MAX_CONNECTIONS_PER_HOST_DEFAULT
+    try:
+        parsed = int(value)
+    except ValueError:
+        parsed = 0
+    if parsed <= 0:
+        logger.warning("http_pool_limit_invalid value=%s", value)
+        return _MAX_CONNECTIONS_PER_HOST_DEFAULT
+    return parsed
+
+
+_default_pool: HttpConnectionPool | None = None
+_default_pool_lock = threading.Lock()
+
+
+def get_default_pool() -> HttpConnectionPool:
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = HttpConnectionPool(max_connections_per_host=_read_max_connections_per_host())
+        return _default_pool
+
+
+def urlopen(
+    request: Request,
+    *,
+    timeout: float,
+    stream: bool = False,
+) -> PooledResponse | StreamingResponse | http.client.HTTPResponse:
+    """Process-wide pooled replacement for ``urllib.request.urlopen``."""
+    return get_default_pool().urlopen(request, timeout=timeout, stream=stream)
@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from sqlmodel import Session, select
 
 from executive_cli.ingest.types import DRAFT_STATUS_PENDING
-from executive_cli.models import IngestLog, Task, TaskDraft, TaskEmailLink, TaskStatus
+from executive_cli.models import OPEN_TASK_STATUSES, IngestLog, Task, TaskDraft, TaskEmailLink
 
 
 @dataclass(frozen=True)
@@ -26,9 +26,7 @@ def detect_dedup(
 ) -> DedupDecision:
     normalized_title = normalize_title(candidate_title)
 
-    active_tasks = session.exec(
-        select(Task).where(Task.status.notin_([TaskStatus.DONE, TaskStatus.CANCELED]))
-    ).all()
+    active_tasks = session.exec(select(Task).where(Task.status.in_(OPEN_TASK_STATUSES))).all()
     for task in active_tasks:
         if normalize_title(task.title) == normalized_title:
             return DedupDecision(skip=True, reason=f"exact_task_match:{task.id}")
@@ -0,0 +1,37 @@
+"""`execas` entry point: forward to a running daemon before importing the CLI."""
+
+from __future__ import annotations
+
+import os
+import sys
+
+from executive_cli.daemon_client import DaemonError, forward_command
+
+IMPORT_PROFILE_ENV = "EXECAS_IMPORT_PROFILE"
+
+
+def _reexec_with_import_profile() -> None:
+    # `-X importtime` cannot be switched on in a running interpreter, so restart the same
+    # command under it; the report goes to stderr, like `python -X importtime` itself.
+    argv = [sys.executable, "-X", "importtime", "-m", "executive_cli", *sys.argv[1:]]
+    os.execv(sys.executable, argv)
+
+
+def main() -> None:
+    if os.environ.get(IMPORT_PROFILE_ENV, "").strip() not in ("", "0"):
+        if "importtime" not in sys._xoptions:
+            _reexec_with_import_profile()
+    else:
+        try:
+            response = forward_command(sys.argv[1:])
+        except DaemonError as exc:
+            sys.stderr.write(f"{exc}\n")
+            sys.exit(1)
+        if response is not None:
+            sys.stdout.write(response.stdout)
+            sys.stderr.write(response.stderr)
+            sys.exit(response.exit_code)
+
+    from executive_cli.cli import main as cli_main
+
+    cli_main()
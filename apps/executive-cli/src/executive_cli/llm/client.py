@@ -6,7 +6,9 @@ import re
 from dataclasses import dataclass
 from typing import Any
 from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
+from urllib.request import Request
+
+from executive_cli.http_pool import urlopen
 
 
 class LLMClientError(RuntimeError):
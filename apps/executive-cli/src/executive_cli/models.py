@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import date, datetime, timezone
 from enum import StrEnum
 
-from sqlalchemy import CheckConstraint, Column, Enum as SQLEnum, Index, UniqueConstraint, text
+from sqlalchemy import DDL, CheckConstraint, Column, Enum as SQLEnum, Index, UniqueConstraint, event, text
 from sqlmodel import Field, SQLModel
 
 
@@ -16,6 +16,10 @@ class TaskStatus(StrEnum):
     CANCELED = "CANCELED"
 
 
+# Statuses of tasks still to be done; queried with IN so ix_tasks_status_due_date serves the lookup.
+OPEN_TASK_STATUSES = (TaskStatus.NOW, TaskStatus.NEXT, TaskStatus.WAITING, TaskStatus.SOMEDAY)
+
+
 class TaskPriority(StrEnum):
     P1 = "P1"
     P2 = "P2"
@@ -53,12 +57,22 @@ class BusyBlock(SQLModel, table=True):
             unique=True,
             sqlite_where=text("external_id IS NOT NULL"),
         ),
+        Index(
+            "ix_busy_blocks_calendar_interval",
+            "calendar_id",
+            "is_deleted",
+            "start_epoch",
+            "end_epoch",
+        ),
     )
 
     id: int | None = Field(default=None, primary_key=True)
     calendar_id: int = Field(foreign_key="calendars.id", index=True)
     start_dt: str
     end_dt: str
+    # UTC epoch seconds of start_dt/end_dt, maintained by triggers (see interval_epoch_triggers).
+    start_epoch: int | None = None
+    end_epoch: int | None = None
     title: str | None = None
     source: str = Field(default="manual")
     external_id: str | None = None
@@ -101,6 +115,13 @@ class Task(SQLModel, table=True):
             "status != 'WAITING' OR (waiting_on IS NOT NULL AND waiting_on != '' AND ping_at IS NOT NULL)",
             name="ck_tasks_waiting_requires_fields",
         ),
+        # Planner (status = NOW), task list (--status/--due), dedup and review (status IN open).
+        Index("ix_tasks_status_due_date", "status", "due_date"),
+        Index("ix_tasks_due_date", "due_date"),
+        Index("ix_tasks_area_id", "area_id"),
+        Index("ix_tasks_project_id", "project_id"),
+        # Task list --commitment and the weekly review commitment nudge (recent tasks).
+        Index("ix_tasks_commitment_created_at", "commitment_id", "created_at"),
     )
 
     id: int | None = Field(default=None, primary_key=True)
@@ -144,11 +165,16 @@ class DayPlan(SQLModel, table=True):
 
 class TimeBlock(SQLModel, table=True):
     __tablename__ = "time_blocks"
+    __table_args__ = (
+        Index("ix_time_blocks_interval", "start_epoch", "end_epoch"),
+    )
 
     id: int | None = Field(default=None, primary_key=True)
     day_plan_id: int = Field(foreign_key="day_plans.id", index=True)
     start_dt: str
     end_dt: str
+    start_epoch: int | None = None
+    end_epoch: int | None = None
     type: str  # "busy" | "focus" | "lunch" | "buffer" | "admin"
     task_id: int | None = Field(default=None, foreign_key="tasks.id")
     label: str | None = None
@@ -203,11 +229,13 @@ class Email(SQLModel, table=True):
     __tablename__ = "emails"
     __table_args__ = (
         UniqueConstraint("source", "external_id", name="uq_emails_source_external_id"),
+        Index("ix_emails_source_mailbox_uid", "source", "mailbox", "mailbox_uid"),
     )
 
     id: int | None = Field(default=None, primary_key=True)
     source: str
     external_id: str
+    mailbox: str | None = None
     mailbox_uid: int | None = None
     subject: str | None = None
     sender: str | None = None
@@ -215,6 +243,22 @@ class Email(SQLModel, table=True):
     first_seen_at: str
     last_seen_at: str
     flags_json: str | None = None
+    expunged_at: str | None = None
+
+
+class EmailLocation(SQLModel, table=True):
+    """One mailbox UID holding a message; ``emails.mailbox`` is only the latest of these."""
+
+    __tablename__ = "email_locations"
+    __table_args__ = (
+        UniqueConstraint("email_id", "mailbox", name="uq_email_locations_email_id_mailbox"),
+        Index("ix_email_locations_mailbox_uid", "mailbox", "mailbox_uid"),
+    )
+
+    id: int | None = Field(default=None, primary_key=True)
+    email_id: int = Field(foreign_key="emails.id")
+    mailbox: str
+    mailbox_uid: int
 
 
 class TaskEmailLink(SQLModel, table=True):
@@ -287,3 +331,49 @@ class IngestLog(SQLModel, table=True):
     confidence: float | None = None
     details_json: str | None = None
     created_at: str
+
+
+INTERVAL_EPOCH_TABLES = ("busy_blocks", "time_blocks")
+_EPOCH_ASSIGNMENTS = (
+    "start_epoch = CAST(strftime('%s', {row}start_dt) AS INTEGER), "
+    "end_epoch = CAST(strftime('%s', {row}end_dt) AS INTEGER)"
+)
+
+
+def interval_epoch_backfill(table_name: str) -> str:
+    """UPDATE filling ``start_epoch``/``end_epoch`` for rows written before the triggers existed."""
+    return f"UPDATE {table_name} SET {_EPOCH_ASSIGNMENTS.format(row='')}"
+
+
+def interval_epoch_triggers(table_name: str) -> list[str]:
+    """SQLite triggers deriving ``start_epoch``/``end_epoch`` from the ISO ``start_dt``/``end_dt``.
+
+    ``strftime('%s', ...)`` honours the stored UTC offset, so the epochs order rows by instant
+    regardless of the timezone each row was written in. Shared by migration f6d9e2a4b5c7 and
+    the ``after_create`` listeners below, so both paths create identical triggers.
+    """
+    assignments = _EPOCH_ASSIGNMENTS.format(row="NEW.")
+    return [
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{table_name}_epoch_insert
+        AFTER INSERT ON {table_name}
+        BEGIN
+            UPDATE {table_name} SET {assignments} WHERE id = NEW.id;
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{table_name}_epoch_update
+        AFTER UPDATE OF start_dt, end_dt ON {table_name}
+        BEGIN
+            UPDATE {table_name} SET {assignments} WHERE id = NEW.id;
+        END
+        """,
+    ]
+
+
+# Tables created outside Alembic (tests, metadata.create_all) get the same triggers.
+for _table_name in INTERVAL_EPOCH_TABLES:
+    _table = SQLModel.metadata.tables[_table_name]
+    for _statement in interval_epoch_triggers(_table_name):
+        # DDL applies %-formatting to its statement; keep strftime's '%s' literal.
+        event.listen(_table, "after_create", DDL(_statement.replace("%", "%%")))
@@ -0,0 +1,21 @@
+"""Filesystem locations, importable without pulling in SQLAlchemy."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+# /apps/executive-cli/src/executive_cli/paths.py -> /apps/executive-cli
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_DB_PATH = PROJECT_ROOT / ".data" / "execas.sqlite"
+
+
+def get_db_path() -> Path:
+    db_path_env = os.getenv("EXECAS_DB_PATH")
+    if not db_path_env:
+        return DEFAULT_DB_PATH
+
+    candidate = Path(db_path_env).expanduser()
+    if candidate.is_absolute():
+        return candidate
+    return (Path.cwd() / candidate).resolve()
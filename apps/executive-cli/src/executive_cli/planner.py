@@ -1,17 +1,23 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import date, datetime, time, timedelta
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-from sqlmodel import Session, delete, select
+from sqlmodel import Session, select
 
-from executive_cli.busy_service import merge_busy_blocks
+from executive_cli.busy_service import (
+    busy_row_epochs,
+    merge_busy_blocks,
+    select_overlapping_busy_blocks,
+)
 from executive_cli.db import DEFAULT_SETTINGS, PRIMARY_CALENDAR_SLUG
+from executive_cli.focus_packing import PackingItem, pack_items
 from executive_cli.models import BusyBlock, Calendar, DayPlan, Settings, Task, TaskPriority, TaskStatus, TimeBlock
-from executive_cli.timeutil import dt_to_db, parse_time_hhmm
+from executive_cli.timeutil import dt_to_db, dt_to_epoch, parse_time_hhmm
 
 VALID_VARIANTS: tuple[str, ...] = ("minimal", "realistic", "aggressive")
+VALID_SCHEDULING_ENGINES: tuple[str, ...] = ("greedy", "optimal")
 
 _PRIORITY_BASE_SCORE: dict[TaskPriority, int] = {
     TaskPriority.P1: 30,
@@ -27,6 +33,8 @@ _TASK_STATUS_ORDER: dict[TaskStatus, int] = {
     TaskStatus.NOW: 0,
 }
 
+_ONE_MINUTE = timedelta(minutes=1)
+
 _VARIANT_FILL_RATIO: dict[str, float] = {
     "minimal": 0.50,
     "realistic": 0.75,
@@ -44,6 +52,8 @@ class PlannerSettings:
     lunch_duration_min: int
     buffer_min: int
     min_focus_block_min: int
+    scheduling_engine: str = "greedy"
+    optimal_time_budget_ms: int = 200
 
 
 @dataclass
@@ -77,6 +87,16 @@ class DidntFitTaskSummary:
     reason: str
 
 
+@dataclass(frozen=True)
+class TimeBlockChanges:
+    """Row-level writes a replan applied to ``time_blocks``."""
+
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0
+    unchanged: int = 0
+
+
 @dataclass(frozen=True)
 class DayPlanResult:
     plan_date: date
@@ -90,59 +110,229 @@ class DayPlanResult:
     full_day_busy: bool
     suggestions_text: str | None
     no_now_hint_text: str | None
+    changes: TimeBlockChanges = TimeBlockChanges()
 
 
 @dataclass(frozen=True)
 class _Gap:
-    start_dt: datetime
-    end_dt: datetime
-    left_block: ScheduledBlock | None
-    right_block: ScheduledBlock | None
+    """Free run in minutes from the window start; bounded sides touch a block, not the window edge."""
+
+    start: int
+    end: int
+    left_bounded: bool
+    right_bounded: bool
+
+
+class _OccupancyMap:
+    """Minute-resolution occupancy of one planning window.
+
+    Byte ``i`` is set when minute ``window_start_dt + i`` is taken. Blocks are marked by
+    slice assignment and free runs are found with ``bytearray.find``, so datetimes are
+    only touched when blocks are marked and when offsets are converted back for output.
+    Every boundary must fall on a whole minute (busy blocks are widened on load).
+    """
+
+    def __init__(self, window_start_dt: datetime, window_end_dt: datetime) -> None:
+        self.window_start_dt = window_start_dt
+        self.size = _minutes_between(window_start_dt, window_end_dt)
+        self._minutes = bytearray(self.size)
+
+    def offset(self, value: datetime) -> int:
+        return (value - self.window_start_dt) // _ONE_MINUTE
+
+    def to_datetime(self, offset: int) -> datetime:
+        return self.window_start_dt + timedelta(minutes=offset)
+
+    def mark(self, block: ScheduledBlock) -> None:
+        start = max(self.offset(block.start_dt), 0)
+        end = min(self.offset(block.end_dt), self.size)
+        if end > start:
+            self._minutes[start:end] = b"\x01" * (end - start)
+
+    def free_minutes(self) -> int:
+        return self._minutes.count(0)
+
+    def gaps(self) -> list[_Gap]:
+        gaps: list[_Gap] = []
+        start = self._minutes.find(0)
+        while start != -1:
+            end = self._minutes.find(1, start)
+            if end == -1:
+                end = self.size
+            gaps.append(_Gap(start=start, end=end, left_bounded=start > 0, right_bounded=end < self.size))
+            start = self._minutes.find(0, end)
+        return gaps
+
+
+class _GapIndex:
+    """Free gaps of one planning window with first-fit lookup and split-on-insert.
+
+    Gaps stay in time order in a fixed array and a max segment tree over it holds the
+    longest buffer-trimmed span per subtree, so both the earliest gap that fits a duration
+    and the update after placing a block cost O(log n). A block placed at the start of a
+    gap's usable span leaves a head piece no longer than one buffer between two blocks,
+    which can never host a block, so every reservation replaces the gap by its tail.
+    """
+
+    def __init__(self, gaps: list[_Gap], *, buffer_min: int) -> None:
+        self._gaps = list(gaps)
+        self._buffer_min = buffer_min
+        self._leaf_offset = 1
+        while self._leaf_offset < len(self._gaps):
+            self._leaf_offset *= 2
+        self._tree = [-1] * (2 * self._leaf_offset)
+        for position, gap in enumerate(self._gaps):
+            self._tree[self._leaf_offset + position] = _usable_gap_length(gap, buffer_min)
+        for node in range(self._leaf_offset - 1, 0, -1):
+            self._tree[node] = max(self._tree[2 * node], self._tree[2 * node + 1])
+
+    def find_first_fit(self, duration_min: int) -> tuple[int, int, int] | None:
+        """Return (gap position, start, end) of the earliest slot that fits ``duration_min``."""
+        if self._tree[1] < duration_min:
+            return None
+        node = 1
+        while node < self._leaf_offset:
+            node = 2 * node if self._tree[2 * node] >= duration_min else 2 * node + 1
+        position = node - self._leaf_offset
+        usable_start, _ = _apply_buffer_to_gap(self._gaps[position], self._buffer_min)
+        return position, usable_start, usable_start + duration_min
+
+    def reserve(self, position: int, end: int) -> None:
+        """Occupy the slot ending at ``end`` (returned by ``find_first_fit``) at ``position``."""
+        gap = self._gaps[position]
+        tail = _Gap(start=end, end=gap.end, left_bounded=True, right_bounded=gap.right_bounded)
+        self._gaps[position] = tail
+        node = self._leaf_offset + position
+        self._tree[node] = _usable_gap_length(tail, self._buffer_min)
+        node //= 2
+        while node:
+            self._tree[node] = max(self._tree[2 * node], self._tree[2 * node + 1])
+            node //= 2
 
 
 def build_and_persist_day_plan(session: Session, *, plan_date: date, variant: str) -> DayPlanResult:
+    normalized_variant = _normalize_variant(variant)
+    settings = load_planner_settings(session)
+    planning_start_dt, planning_end_dt = _planning_window(plan_date, settings)
+    busy_rows = _load_busy_rows(session, range_start=plan_date, range_end=plan_date, timezone=settings.timezone)
+    ranked_tasks = _rank_tasks(_load_candidate_tasks(session), plan_date)
+
+    result = _compute_day_plan(
+        plan_date=plan_date,
+        variant=normalized_variant,
+        settings=settings,
+        ranked_tasks=ranked_tasks,
+        busy_blocks=_busy_blocks_for_day(
+            busy_rows,
+            plan_date=plan_date,
+            timezone=settings.timezone,
+            planning_start_dt=planning_start_dt,
+            planning_end_dt=planning_end_dt,
+        ),
+        has_candidate_tasks=bool(ranked_tasks),
+    )
+    changes = _apply_day_plan(session, plan_date=plan_date, variant=normalized_variant, blocks=result.blocks)
+    session.commit()
+    return replace(result, changes=changes)
+
+
+def build_and_persist_week_plan(
+    session: Session,
+    *,
+    start_date: date,
+    variant: str,
+    days: int = 7,
+) -> list[DayPlanResult]:
+    """Plan ``days`` consecutive days, carrying tasks that did not fit into the next day.
+
+    Settings, candidate tasks and busy blocks are loaded once for the whole range; every
+    day is planned exactly like ``build_and_persist_day_plan`` except that tasks already
+    scheduled on an earlier day are no longer candidates. All plans commit together.
+    """
+    if days < 1:
+        raise ValueError("Invalid --days. Expected >= 1.")
+    normalized_variant = _normalize_variant(variant)
+    settings = load_planner_settings(session)
+    end_date = start_date + timedelta(days=days - 1)
+    busy_rows = _load_busy_rows(session, range_start=start_date, range_end=end_date, timezone=settings.timezone)
+    remaining_tasks = _load_candidate_tasks(session)
+    has_candidate_tasks = bool(remaining_tasks)
+
+    results: list[DayPlanResult] = []
+    for offset in range(days):
+        plan_date = start_date + timedelta(days=offset)
+        planning_start_dt, planning_end_dt = _planning_window(plan_date, settings)
+        result = _compute_day_plan(
+            plan_date=plan_date,
+            variant=normalized_variant,
+            settings=settings,
+            ranked_tasks=_rank_tasks(remaining_tasks, plan_date),
+            busy_blocks=_busy_blocks_for_day(
+                busy_rows,
+                plan_date=plan_date,
+                timezone=settings.timezone,
+                planning_start_dt=planning_start_dt,
+                planning_end_dt=planning_end_dt,
+            ),
+            has_candidate_tasks=has_candidate_tasks,
+        )
+        scheduled_ids = {task.id for task in result.selected_tasks}
+        remaining_tasks = [task for task in remaining_tasks if task.id not in scheduled_ids]
+        changes = _apply_day_plan(session, plan_date=plan_date, variant=normalized_variant, blocks=result.blocks)
+        results.append(replace(result, changes=changes))
+
+    session.commit()
+    return results
+
+
+def _normalize_variant(variant: str) -> str:
     normalized_variant = variant.strip().lower()
     if normalized_variant not in VALID_VARIANTS:
         raise ValueError("Invalid --variant. Expected one of: minimal, realistic, aggressive.")
+    return normalized_variant
 
-    settings = load_planner_settings(session)
+
+def _planning_window(plan_date: date, settings: PlannerSettings) -> tuple[datetime, datetime]:
     planning_start_dt = datetime.combine(plan_date, settings.planning_start, tzinfo=settings.timezone)
     planning_end_dt = datetime.combine(plan_date, settings.planning_end, tzinfo=settings.timezone)
     if planning_start_dt >= planning_end_dt:
         raise ValueError("Invalid settings: planning_start must be earlier than planning_end.")
+    return planning_start_dt, planning_end_dt
 
-    ranked_tasks = _rank_tasks(_load_candidate_tasks(session), plan_date)
-    busy_blocks = _load_busy_blocks(
-        session=session,
-        plan_date=plan_date,
-        timezone=settings.timezone,
-        planning_start_dt=planning_start_dt,
-        planning_end_dt=planning_end_dt,
-    )
 
-    lunch_block = _place_lunch_block(
-        planning_start_dt=planning_start_dt,
-        planning_end_dt=planning_end_dt,
-        busy_blocks=busy_blocks,
-        plan_date=plan_date,
-        settings=settings,
-    )
+def _compute_day_plan(
+    *,
+    plan_date: date,
+    variant: str,
+    settings: PlannerSettings,
+    ranked_tasks: list[RankedTask],
+    busy_blocks: list[ScheduledBlock],
+    has_candidate_tasks: bool,
+) -> DayPlanResult:
+    planning_start_dt, planning_end_dt = _planning_window(plan_date, settings)
+    occupancy = _OccupancyMap(planning_start_dt, planning_end_dt)
+    for busy_block in busy_blocks:
+        occupancy.mark(busy_block)
+    lunch_block = _place_lunch_block(occupancy=occupancy, plan_date=plan_date, settings=settings)
     lunch_skipped = lunch_block is None and settings.lunch_duration_min > 0
+    if lunch_block is not None:
+        occupancy.mark(lunch_block)
 
     fixed_blocks: list[ScheduledBlock] = sorted(
         [*busy_blocks, *([lunch_block] if lunch_block is not None else [])],
         key=_block_sort_key,
     )
-    total_free_minutes = _sum_gap_minutes(planning_start_dt, planning_end_dt, fixed_blocks)
-    target_focus_minutes = _compute_focus_target_minutes(normalized_variant, total_free_minutes)
+    total_free_minutes = occupancy.free_minutes()
+    target_focus_minutes = _compute_focus_target_minutes(variant, total_free_minutes)
 
-    focus_blocks, selected_tasks, didnt_fit_tasks = _schedule_focus_blocks(
-        planning_start_dt=planning_start_dt,
-        planning_end_dt=planning_end_dt,
-        fixed_blocks=fixed_blocks,
+    schedule_focus_blocks = (
+        _schedule_focus_blocks_optimal if settings.scheduling_engine == "optimal" else _schedule_focus_blocks
+    )
+    focus_blocks, selected_tasks, didnt_fit_tasks = schedule_focus_blocks(
+        occupancy=occupancy,
         ranked_tasks=ranked_tasks,
         settings=settings,
-        variant=normalized_variant,
+        variant=variant,
         target_focus_minutes=target_focus_minutes,
     )
 
@@ -153,7 +343,6 @@ def build_and_persist_day_plan(session: Session, *, plan_date: date, variant: st
         occupied_blocks=main_blocks,
         settings=settings,
     )
-    _replace_day_plan(session, plan_date=plan_date, variant=normalized_variant, blocks=all_blocks)
 
     full_day_busy = total_free_minutes == 0
     suggestions_text = (
@@ -163,13 +352,13 @@ def build_and_persist_day_plan(session: Session, *, plan_date: date, variant: st
     )
     no_now_hint_text = (
         "No NOW tasks. Move NEXT -> NOW via execas task move <id> --status NOW."
-        if not ranked_tasks
+        if not has_candidate_tasks
         else None
     )
 
     return DayPlanResult(
         plan_date=plan_date,
-        variant=normalized_variant,
+        variant=variant,
         timezone_name=settings.timezone_name,
         timezone=settings.timezone,
         blocks=all_blocks,
@@ -198,6 +387,13 @@ def load_planner_settings(session: Session) -> PlannerSettings:
     lunch_duration_min = _parse_setting_int(raw_settings, "lunch_duration_min", minimum=0)
     buffer_min = _parse_setting_int(raw_settings, "buffer_min", minimum=0)
     min_focus_block_min = _parse_setting_int(raw_settings, "min_focus_block_min", minimum=1)
+    scheduling_engine = raw_settings.get("planner_engine", DEFAULT_SETTINGS["planner_engine"]).strip().lower()
+    if scheduling_engine not in VALID_SCHEDULING_ENGINES:
+        raise ValueError(
+            f"Invalid planner_engine setting '{scheduling_engine}'. "
+            f"Expected one of: {', '.join(VALID_SCHEDULING_ENGINES)}."
+        )
+    optimal_time_budget_ms = _parse_setting_int(raw_settings, "planner_time_budget_ms", minimum=1)
 
     return PlannerSettings(
         timezone_name=timezone_name,
@@ -208,6 +404,8 @@ def load_planner_settings(session: Session) -> PlannerSettings:
         lunch_duration_min=lunch_duration_min,
         buffer_min=buffer_min,
         min_focus_block_min=min_focus_block_min,
+        scheduling_engine=scheduling_engine,
+        optimal_time_budget_ms=optimal_time_budget_ms,
     )
 
 
@@ -266,36 +464,59 @@ def _score_task(task: Task, plan_date: date) -> int:
     return score
 
 
-def _load_busy_blocks(
-    *,
+def _load_busy_rows(
     session: Session,
-    plan_date: date,
+    *,
+    range_start: date,
+    range_end: date,
     timezone: ZoneInfo,
-    planning_start_dt: datetime,
-    planning_end_dt: datetime,
-) -> list[ScheduledBlock]:
+) -> list[BusyBlock]:
     calendar = session.exec(select(Calendar).where(Calendar.slug == PRIMARY_CALENDAR_SLUG)).first()
     if calendar is None:
         raise ValueError("Primary calendar is not initialized. Run 'execas init' first.")
 
-    day_start = datetime.combine(plan_date, time.min, tzinfo=timezone)
-    day_end = day_start + timedelta(days=1)
-    busy_rows = session.exec(
-        select(BusyBlock)
-        .where(BusyBlock.calendar_id == calendar.id)
-        .where(BusyBlock.is_deleted == 0)
-        .where(BusyBlock.end_dt > dt_to_db(day_start))
-        .where(BusyBlock.start_dt < dt_to_db(day_end))
-        .order_by(BusyBlock.start_dt, BusyBlock.id)
-    ).all()
+    range_start_dt = datetime.combine(range_start, time.min, tzinfo=timezone)
+    range_end_dt = datetime.combine(range_end + timedelta(days=1), time.min, tzinfo=timezone)
+    return select_overlapping_busy_blocks(
+        session,
+        calendar_id=calendar.id,
+        range_start=range_start_dt,
+        range_end=range_end_dt,
+    )
 
-    merged = merge_busy_blocks(busy_rows)
+
+def _busy_blocks_for_day(
+    busy_rows: list[BusyBlock],
+    *,
+    plan_date: date,
+    timezone: ZoneInfo,
+    planning_start_dt: datetime,
+    planning_end_dt: datetime,
+) -> list[ScheduledBlock]:
+    # Merge only the rows touching this local day, as a single-day query would return.
+    day_start = datetime.combine(plan_date, time.min, tzinfo=timezone)
+    day_start_epoch = dt_to_epoch(day_start)
+    day_end_epoch = dt_to_epoch(day_start + timedelta(days=1))
+    day_rows = []
+    for row in busy_rows:
+        row_start_epoch, row_end_epoch = busy_row_epochs(row)
+        if row_end_epoch > day_start_epoch and row_start_epoch < day_end_epoch:
+            day_rows.append(row)
+
+    merged = merge_busy_blocks(day_rows)
     scheduled_busy: list[ScheduledBlock] = []
     for item in merged:
-        start_dt = max(item.start_dt.astimezone(timezone), planning_start_dt)
-        end_dt = min(item.end_dt.astimezone(timezone), planning_end_dt)
+        # The planner works in whole minutes, so busy time is widened to cover every
+        # minute it touches.
+        start_dt = max(_floor_to_minute(item.start_dt.astimezone(timezone)), planning_start_dt)
+        end_dt = min(_ceil_to_minute(item.end_dt.astimezone(timezone)), planning_end_dt)
         if start_dt >= end_dt:
             continue
+        if scheduled_busy and start_dt <= scheduled_busy[-1].end_dt:
+            previous = scheduled_busy[-1]
+            previous.end_dt = max(previous.end_dt, end_dt)
+            previous.label = f"{previous.label} | {item.title}"
+            continue
         scheduled_busy.append(
             ScheduledBlock(
                 start_dt=start_dt,
@@ -310,34 +531,31 @@ def _load_busy_blocks(
 
 def _place_lunch_block(
     *,
-    planning_start_dt: datetime,
-    planning_end_dt: datetime,
-    busy_blocks: list[ScheduledBlock],
+    occupancy: _OccupancyMap,
     plan_date: date,
     settings: PlannerSettings,
 ) -> ScheduledBlock | None:
     if settings.lunch_duration_min <= 0:
         return None
 
-    target_start = datetime.combine(plan_date, settings.lunch_start, tzinfo=settings.timezone)
-    lunch_duration = timedelta(minutes=settings.lunch_duration_min)
+    target_start = occupancy.offset(datetime.combine(plan_date, settings.lunch_start, tzinfo=settings.timezone))
+    lunch_duration = settings.lunch_duration_min
 
-    candidates: list[tuple[int, datetime]] = []
-    for gap in _find_gaps(planning_start_dt, planning_end_dt, busy_blocks):
-        latest_start = gap.end_dt - lunch_duration
-        if latest_start < gap.start_dt:
+    candidates: list[tuple[int, int]] = []
+    for gap in occupancy.gaps():
+        latest_start = gap.end - lunch_duration
+        if latest_start < gap.start:
             continue
-        candidate_start = _clamp_datetime(target_start, lower=gap.start_dt, upper=latest_start)
-        distance_minutes = _abs_minutes(candidate_start - target_start)
-        candidates.append((distance_minutes, candidate_start))
+        candidate_start = min(max(target_start, gap.start), latest_start)
+        candidates.append((abs(candidate_start - target_start), candidate_start))
 
     if not candidates:
         return None
 
-    _, chosen_start = min(candidates, key=lambda candidate: (candidate[0], candidate[1]))
+    _, chosen_start = min(candidates)
     return ScheduledBlock(
-        start_dt=chosen_start,
-        end_dt=chosen_start + lunch_duration,
+        start_dt=occupancy.to_datetime(chosen_start),
+        end_dt=occupancy.to_datetime(chosen_start + lunch_duration),
         type="lunch",
         label="Lunch",
         task_id=None,
@@ -355,15 +573,13 @@ def _compute_focus_target_minutes(variant: str, total_free_minutes: int) -> int:
 
 def _schedule_focus_blocks(
     *,
-    planning_start_dt: datetime,
-    planning_end_dt: datetime,
-    fixed_blocks: list[ScheduledBlock],
+    occupancy: _OccupancyMap,
     ranked_tasks: list[RankedTask],
     settings: PlannerSettings,
     variant: str,
     target_focus_minutes: int,
 ) -> tuple[list[ScheduledBlock], list[SelectedTaskSummary], list[DidntFitTaskSummary]]:
-    occupied_blocks = sorted(fixed_blocks, key=_block_sort_key)
+    gap_index = _GapIndex(occupancy.gaps(), buffer_min=settings.buffer_min)
     focus_blocks: list[ScheduledBlock] = []
     selected_by_id: dict[int, SelectedTaskSummary] = {}
     didnt_fit_tasks: list[DidntFitTaskSummary] = []
@@ -386,13 +602,7 @@ def _schedule_focus_blocks(
             )
             continue
 
-        slot = _find_first_focus_slot(
-            planning_start_dt=planning_start_dt,
-            planning_end_dt=planning_end_dt,
-            occupied_blocks=occupied_blocks,
-            estimate_min=estimate_min,
-            buffer_min=settings.buffer_min,
-        )
+        slot = gap_index.find_first_fit(estimate_min)
         if slot is None:
             didnt_fit_tasks.append(
                 DidntFitTaskSummary(
@@ -419,16 +629,16 @@ def _schedule_focus_blocks(
             )
             continue
 
+        position, start, end = slot
         block = ScheduledBlock(
-            start_dt=slot[0],
-            end_dt=slot[1],
+            start_dt=occupancy.to_datetime(start),
+            end_dt=occupancy.to_datetime(end),
             type="focus",
             label=task.title,
             task_id=task_id,
         )
         focus_blocks.append(block)
-        occupied_blocks.append(block)
-        occupied_blocks.sort(key=_block_sort_key)
+        gap_index.reserve(position, end)
         total_focus_minutes += estimate_min
 
         if task_id not in selected_by_id:
@@ -440,6 +650,110 @@ def _schedule_focus_blocks(
                 estimate_min=task.estimate_min,
             )
 
+    return focus_blocks, _order_selected_tasks(focus_blocks, selected_by_id), didnt_fit_tasks
+
+
+def _schedule_focus_blocks_optimal(
+    *,
+    occupancy: _OccupancyMap,
+    ranked_tasks: list[RankedTask],
+    settings: PlannerSettings,
+    variant: str,
+    target_focus_minutes: int,
+) -> tuple[list[ScheduledBlock], list[SelectedTaskSummary], list[DidntFitTaskSummary]]:
+    """Pack tasks to maximize score-weighted focus minutes within the variant target.
+
+    The greedy plan is computed first and seeds the search as the incumbent, so this
+    engine never returns a lower-value plan than greedy; it is also what comes back when
+    the search finds nothing better within ``optimal_time_budget_ms``.
+    """
+    greedy = _schedule_focus_blocks(
+        occupancy=occupancy,
+        ranked_tasks=ranked_tasks,
+        settings=settings,
+        variant=variant,
+        target_focus_minutes=target_focus_minutes,
+    )
+    scores_by_id = {ranked.task.id: ranked.score for ranked in ranked_tasks}
+    greedy_value = sum(
+        scores_by_id[block.task_id] * _minutes_between(block.start_dt, block.end_dt)
+        for block in greedy[0]
+        if block.task_id is not None
+    )
+
+    gaps = occupancy.gaps()
+    gap_minutes = [_usable_gap_length(gap, settings.buffer_min) for gap in gaps]
+    candidates = [
+        ranked
+        for ranked in ranked_tasks
+        if ranked.task.id is not None and ranked.task.estimate_min >= settings.min_focus_block_min
+    ]
+    packing = pack_items(
+        [
+            PackingItem(key=index, minutes=ranked.task.estimate_min, value=ranked.score * ranked.task.estimate_min)
+            for index, ranked in enumerate(candidates)
+        ],
+        gap_minutes,
+        spacing=settings.buffer_min,
+        total_limit=target_focus_minutes,
+        lower_bound=greedy_value,
+        time_budget_s=settings.optimal_time_budget_ms / 1000,
+    )
+    if packing is None:
+        return greedy
+
+    # Within a gap, packed tasks keep their rank order.
+    next_start = [_apply_buffer_to_gap(gap, settings.buffer_min)[0] for gap in gaps]
+    packed_task_ids: set[int] = set()
+    focus_blocks: list[ScheduledBlock] = []
+    selected_by_id: dict[int, SelectedTaskSummary] = {}
+    for index, ranked in enumerate(candidates):
+        task = ranked.task
+        gap_position = packing.assignment.get(index)
+        if gap_position is None or task.id is None:
+            continue
+        start = next_start[gap_position]
+        end = start + task.estimate_min
+        next_start[gap_position] = end + settings.buffer_min
+        focus_blocks.append(
+            ScheduledBlock(
+                start_dt=occupancy.to_datetime(start),
+                end_dt=occupancy.to_datetime(end),
+                type="focus",
+                label=task.title,
+                task_id=task.id,
+            )
+        )
+        packed_task_ids.add(task.id)
+        selected_by_id[task.id] = SelectedTaskSummary(
+            id=task.id,
+            title=task.title,
+            priority=TaskPriority(task.priority),
+            due_date=task.due_date,
+            estimate_min=task.estimate_min,
+        )
+
+    largest_gap_min = max(gap_minutes, default=0)
+    didnt_fit_tasks: list[DidntFitTaskSummary] = []
+    for ranked in ranked_tasks:
+        task = ranked.task
+        if task.id is None or task.id in packed_task_ids:
+            continue
+        if task.estimate_min < settings.min_focus_block_min:
+            reason = f"estimate < min focus ({settings.min_focus_block_min}m)"
+        elif task.estimate_min > largest_gap_min:
+            reason = f"no slot >= {task.estimate_min}m"
+        else:
+            reason = "not in optimal packing"
+        didnt_fit_tasks.append(DidntFitTaskSummary(id=task.id, title=task.title, reason=reason))
+
+    return focus_blocks, _order_selected_tasks(focus_blocks, selected_by_id), didnt_fit_tasks
+
+
+def _order_selected_tasks(
+    focus_blocks: list[ScheduledBlock],
+    selected_by_id: dict[int, SelectedTaskSummary],
+) -> list[SelectedTaskSummary]:
     selected_tasks: list[SelectedTaskSummary] = []
     seen_task_ids: set[int] = set()
     for block in sorted(focus_blocks, key=_block_sort_key):
@@ -450,25 +764,7 @@ def _schedule_focus_blocks(
             continue
         selected_tasks.append(summary)
         seen_task_ids.add(block.task_id)
-
-    return focus_blocks, selected_tasks, didnt_fit_tasks
-
-
-def _find_first_focus_slot(
-    *,
-    planning_start_dt: datetime,
-    planning_end_dt: datetime,
-    occupied_blocks: list[ScheduledBlock],
-    estimate_min: int,
-    buffer_min: int,
-) -> tuple[datetime, datetime] | None:
-    block_duration = timedelta(minutes=estimate_min)
-    for gap in _find_gaps(planning_start_dt, planning_end_dt, occupied_blocks):
-        usable_start, usable_end = _apply_buffer_to_gap(gap, buffer_min)
-        if usable_end - usable_start < block_duration:
-            continue
-        return usable_start, usable_start + block_duration
-    return None
+    return selected_tasks
 
 
 def _should_schedule_task_for_variant(
@@ -614,90 +910,78 @@ def _materialize_gap_blocks(
     return blocks
 
 
-def _sum_gap_minutes(window_start_dt: datetime, window_end_dt: datetime, occupied_blocks: list[ScheduledBlock]) -> int:
-    return sum(
-        _minutes_between(gap.start_dt, gap.end_dt)
-        for gap in _find_gaps(window_start_dt, window_end_dt, occupied_blocks)
-    )
-
-
-def _find_gaps(
-    window_start_dt: datetime,
-    window_end_dt: datetime,
-    occupied_blocks: list[ScheduledBlock],
-) -> list[_Gap]:
-    gaps: list[_Gap] = []
-    cursor = window_start_dt
-    left_block: ScheduledBlock | None = None
-
-    for block in sorted(occupied_blocks, key=_block_sort_key):
-        if block.end_dt <= window_start_dt or block.start_dt >= window_end_dt:
-            continue
-
-        block_start = max(block.start_dt, window_start_dt)
-        block_end = min(block.end_dt, window_end_dt)
-        if block_start > cursor:
-            gaps.append(
-                _Gap(
-                    start_dt=cursor,
-                    end_dt=block_start,
-                    left_block=left_block,
-                    right_block=block,
-                )
-            )
-
-        if block_end > cursor:
-            cursor = block_end
-            left_block = block
-
-    if cursor < window_end_dt:
-        gaps.append(
-            _Gap(
-                start_dt=cursor,
-                end_dt=window_end_dt,
-                left_block=left_block,
-                right_block=None,
-            )
-        )
-
-    return gaps
-
+def _apply_buffer_to_gap(gap: _Gap, buffer_min: int) -> tuple[int, int]:
+    start = gap.start + (buffer_min if gap.left_bounded else 0)
+    end = gap.end - (buffer_min if gap.right_bounded else 0)
+    if end < start:
+        return start, start
+    return start, end
 
-def _apply_buffer_to_gap(gap: _Gap, buffer_min: int) -> tuple[datetime, datetime]:
-    if buffer_min <= 0:
-        return gap.start_dt, gap.end_dt
 
-    buffer_delta = timedelta(minutes=buffer_min)
-    start_dt = gap.start_dt + (buffer_delta if gap.left_block is not None else timedelta())
-    end_dt = gap.end_dt - (buffer_delta if gap.right_block is not None else timedelta())
-    if end_dt < start_dt:
-        return start_dt, start_dt
-    return start_dt, end_dt
+def _usable_gap_length(gap: _Gap, buffer_min: int) -> int:
+    usable_start, usable_end = _apply_buffer_to_gap(gap, buffer_min)
+    return usable_end - usable_start
 
 
-def _replace_day_plan(
+def _apply_day_plan(
     session: Session,
     *,
     plan_date: date,
     variant: str,
     blocks: list[ScheduledBlock],
-) -> None:
-    existing = session.exec(
+) -> TimeBlockChanges:
+    """Persist ``blocks`` as the plan for (date, variant) with the fewest row writes.
+
+    The plan itself is always recomputed in full (focus placement is a greedy pass over
+    the whole day, so a gap-local recompute could diverge from it); only the writes are
+    incremental. Rows that already hold a wanted block are left alone, stale rows are
+    rewritten in place for new blocks, and only the surplus is inserted or deleted. The
+    ``day_plans`` row keeps its id, so a replan after an hourly sync that changed nothing
+    on this day writes nothing. The caller commits.
+    """
+    day_plan = session.exec(
         select(DayPlan).where(DayPlan.date == plan_date).where(DayPlan.variant == variant)
     ).first()
-    if existing is not None and existing.id is not None:
-        session.exec(delete(TimeBlock).where(TimeBlock.day_plan_id == existing.id))
-        session.delete(existing)
+    if day_plan is None:
+        day_plan = DayPlan(date=plan_date, variant=variant, source="planner")
+        session.add(day_plan)
         session.flush()
-
-    day_plan = DayPlan(date=plan_date, variant=variant, source="planner")
-    session.add(day_plan)
-    session.flush()
-
     if day_plan.id is None:
         raise ValueError("Failed to create day plan row.")
 
+    existing_rows = session.exec(
+        select(TimeBlock)
+        .where(TimeBlock.day_plan_id == day_plan.id)
+        .order_by(TimeBlock.start_epoch, TimeBlock.id)
+    ).all()
+    rows_by_key: dict[tuple[str, str, str, int | None, str], list[TimeBlock]] = {}
+    for row in existing_rows:
+        rows_by_key.setdefault(_time_block_row_key(row), []).append(row)
+
+    unchanged = 0
+    missing: list[ScheduledBlock] = []
     for block in blocks:
+        matches = rows_by_key.get(_scheduled_block_key(block))
+        if matches:
+            matches.pop(0)
+            unchanged += 1
+        else:
+            missing.append(block)
+    stale_rows = sorted(
+        (row for rows in rows_by_key.values() for row in rows),
+        key=lambda row: (row.start_epoch or 0, row.id or 0),
+    )
+
+    for row, block in zip(stale_rows, missing):
+        row.start_dt = dt_to_db(block.start_dt)
+        row.end_dt = dt_to_db(block.end_dt)
+        row.type = block.type
+        row.task_id = block.task_id
+        row.label = block.label
+        session.add(row)
+    for row in stale_rows[len(missing):]:
+        session.delete(row)
+    for block in missing[len(stale_rows):]:
         session.add(
             TimeBlock(
                 day_plan_id=day_plan.id,
@@ -709,23 +993,34 @@ def _replace_day_plan(
             )
         )
 
-    session.commit()
+    reused = min(len(stale_rows), len(missing))
+    return TimeBlockChanges(
+        inserted=len(missing) - reused,
+        updated=reused,
+        deleted=len(stale_rows) - reused,
+        unchanged=unchanged,
+    )
+
+
+def _scheduled_block_key(block: ScheduledBlock) -> tuple[str, str, str, int | None, str]:
+    return (dt_to_db(block.start_dt), dt_to_db(block.end_dt), block.type, block.task_id, block.label)
+
+
+def _time_block_row_key(row: TimeBlock) -> tuple[str, str, str, int | None, str]:
+    return (row.start_dt, row.end_dt, row.type, row.task_id, row.label)
 
 
 def _minutes_between(start_dt: datetime, end_dt: datetime) -> int:
     return int((end_dt - start_dt).total_seconds() // 60)
 
 
-def _abs_minutes(delta: timedelta) -> int:
-    return int(abs(delta.total_seconds()) // 60)
+def _floor_to_minute(value: datetime) -> datetime:
+    return value.replace(second=0, microsecond=0)
 
 
-def _clamp_datetime(value: datetime, *, lower: datetime, upper: datetime) -> datetime:
-    if value < lower:
-        return lower
-    if value > upper:
-        return upper
-    return value
+def _ceil_to_minute(value: datetime) -> datetime:
+    floored = _floor_to_minute(value)
+    return floored if floored == value else floored + _ONE_MINUTE
 
 
 def _block_sort_key(block: ScheduledBlock) -> tuple[datetime, datetime, str, str]:
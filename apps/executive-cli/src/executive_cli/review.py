@@ -7,6 +7,7 @@ from datetime import date, datetime, timedelta, timezone
 from sqlmodel import Session, select
 
 from executive_cli.models import (
+    OPEN_TASK_STATUSES,
     Area,
     Commitment,
     Project,
@@ -155,10 +156,10 @@ def generate_weekly_review(
     generated_str = now.astimezone(MOSCOW_TZ).isoformat()
 
     # Load tasks
-    all_tasks = session.exec(select(Task)).all()
-    now_tasks = [t for t in all_tasks if TaskStatus(t.status) == TaskStatus.NOW]
-    waiting_tasks = [t for t in all_tasks if TaskStatus(t.status) == TaskStatus.WAITING]
-    next_tasks = [t for t in all_tasks if TaskStatus(t.status) == TaskStatus.NEXT]
+    open_tasks = session.exec(select(Task).where(Task.status.in_(OPEN_TASK_STATUSES))).all()
+    now_tasks = [t for t in open_tasks if TaskStatus(t.status) == TaskStatus.NOW]
+    waiting_tasks = [t for t in open_tasks if TaskStatus(t.status) == TaskStatus.WAITING]
+    next_tasks = [t for t in open_tasks if TaskStatus(t.status) == TaskStatus.NEXT]
 
     # Score and sort
     scored_now = sorted([score_task(t, today) for t in now_tasks], key=_sort_key)
@@ -194,14 +195,18 @@ def generate_weekly_review(
     off_track: list[Commitment] = []
 
     _DIFFICULTY_ORDER = {"D5": 0, "D4": 1, "D3": 2, "D2": 3, "D1": 4}
+    commitment_ids = [c.id for c in commitments]
+    on_track_ids = set(
+        session.exec(
+            select(Task.commitment_id)
+            .where(Task.commitment_id.in_(commitment_ids))
+            .where(Task.created_at >= cutoff_iso)
+            .where(Task.status != TaskStatus.CANCELED)
+            .distinct()
+        ).all()
+    ) if commitment_ids else set()
     for c in commitments:
-        recent = [
-            t for t in all_tasks
-            if t.commitment_id == c.id
-            and TaskStatus(t.status) != TaskStatus.CANCELED
-            and t.created_at >= cutoff_iso
-        ]
-        if len(recent) == 0:
+        if c.id not in on_track_ids:
             off_track.append(c)
     off_track.sort(key=lambda c: (_DIFFICULTY_ORDER.get(c.difficulty, 99), c.id))
     off_track = off_track[:3]
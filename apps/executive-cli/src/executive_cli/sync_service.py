@@ -1,18 +1,29 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import date
 from datetime import datetime, timezone as _utc_tz
 import json
 import logging
+import time
+from typing import Callable, Iterable, Sequence
 
+import sqlalchemy as sa
 from sqlmodel import Session, select
 
-from executive_cli.connectors.caldav import CalendarConnector
-from executive_cli.connectors.imap import MailConnector
+from executive_cli.connectors.caldav import CalendarConnector, CalendarSyncBatch, RemoteCalendarEvent
+from executive_cli.connectors.imap import (
+    ImapConnector,
+    ImapSessionPool,
+    MailConnector,
+    MailConnectorError,
+    MailSyncBatch,
+    RemoteEmailHeader,
+)
 from executive_cli.db import PRIMARY_CALENDAR_SLUG
-from executive_cli.models import BusyBlock, Calendar, Email, SyncState
-from executive_cli.timeutil import db_to_dt, dt_to_db
+from executive_cli.models import BusyBlock, Calendar, Email, EmailLocation, SyncState
+from executive_cli.timeutil import dt_to_db, dt_to_epoch
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +32,32 @@ CALDAV_SCOPE_PRIMARY = "primary"
 IMAP_SOURCE = "yandex_imap"
 IMAP_SCOPE_INBOX = "INBOX"
 IMAP_CURSOR_KIND_UID = "uidvalidity_uidnext"
+IMAP_CURSOR_KIND_UID_MODSEQ = "uidvalidity_uidnext_modseq"
+# RFC 2177: clients should re-issue IDLE at least every 29 minutes.
+IMAP_IDLE_TIMEOUT_SEC = 25 * 60
+_UID_CHUNK_SIZE = 500
+
+# Per-connection staging tables for the set-based sync writes; emptied before every batch.
+_BUSY_STAGE_DDL = """
+CREATE TEMP TABLE IF NOT EXISTS busy_blocks_stage (
+    external_id TEXT PRIMARY KEY,
+    start_dt TEXT NOT NULL,
+    end_dt TEXT NOT NULL,
+    title TEXT,
+    external_etag TEXT,
+    external_modified_at TEXT
+)
+"""
+_EMAIL_STAGE_DDL = """
+CREATE TEMP TABLE IF NOT EXISTS emails_stage (
+    external_id TEXT PRIMARY KEY,
+    mailbox_uid INTEGER NOT NULL,
+    subject TEXT,
+    sender TEXT,
+    received_at TEXT,
+    flags_json TEXT
+)
+"""
 
 
 @dataclass(frozen=True)
@@ -39,6 +76,7 @@ class MailSyncResult:
     updated: int
     cursor: str
     cursor_kind: str
+    expunged: int = 0
 
 
 def sync_calendar_primary(
@@ -78,96 +116,21 @@ def sync_calendar_primary(
         )
         raise
 
-    if batch.full_snapshot:
-        existing_rows = session.exec(
-            select(BusyBlock)
-            .where(BusyBlock.calendar_id == calendar.id)
-            .where(BusyBlock.source == CALDAV_SOURCE)
-        ).all()
-    else:
-        candidate_external_ids = {event.external_id for event in batch.events}
-        candidate_external_ids.update(batch.deleted_external_ids)
-        if candidate_external_ids:
-            existing_rows = session.exec(
-                select(BusyBlock)
-                .where(BusyBlock.calendar_id == calendar.id)
-                .where(BusyBlock.source == CALDAV_SOURCE)
-                .where(BusyBlock.external_id.in_(candidate_external_ids))
-            ).all()
-        else:
-            existing_rows = []
-    existing_by_external_id = {
-        row.external_id: row for row in existing_rows if row.external_id is not None
-    }
-
-    inserted = 0
-    updated = 0
-    skipped = 0
-    soft_deleted = 0
-    seen_external_ids: set[str] = set()
-
     try:
         for event in batch.events:
             if event.start_dt >= event.end_dt:
                 raise ValueError(f"Invalid interval for event {event.external_id}: start_dt >= end_dt")
 
-            seen_external_ids.add(event.external_id)
-            existing = existing_by_external_id.get(event.external_id)
-            if existing is None:
-                row = BusyBlock(
-                    calendar_id=calendar.id,
-                    start_dt=dt_to_db(event.start_dt),
-                    end_dt=dt_to_db(event.end_dt),
-                    title=event.title,
-                    source=CALDAV_SOURCE,
-                    external_id=event.external_id,
-                    external_etag=event.external_etag,
-                    external_modified_at=event.external_modified_at,
-                    is_deleted=0,
-                )
-                session.add(row)
-                existing_by_external_id[event.external_id] = row
-                inserted += 1
-                continue
-
-            if existing.external_etag == event.external_etag and existing.is_deleted == 0:
-                skipped += 1
-                continue
-
-            existing.start_dt = dt_to_db(event.start_dt)
-            existing.end_dt = dt_to_db(event.end_dt)
-            existing.title = event.title
-            existing.external_etag = event.external_etag
-            existing.external_modified_at = event.external_modified_at
-            existing.is_deleted = 0
-            session.add(existing)
-            updated += 1
-
-        if batch.full_snapshot:
-            for row in existing_rows:
-                if row.external_id is None:
-                    continue
-                if row.external_id in seen_external_ids:
-                    continue
-                if batch.coverage_start is not None and batch.coverage_end is not None:
-                    row_start = db_to_dt(row.start_dt)
-                    row_end = db_to_dt(row.end_dt)
-                    if row_end <= batch.coverage_start or row_start >= batch.coverage_end:
-                        continue
-                if row.is_deleted == 0:
-                    row.is_deleted = 1
-                    session.add(row)
-                    soft_deleted += 1
-        else:
-            for external_id in batch.deleted_external_ids:
-                row = existing_by_external_id.get(external_id)
-                if row is None:
-                    continue
-                if row.is_deleted == 1:
-                    continue
-                row.is_deleted = 1
-                session.add(row)
-                soft_deleted += 1
+        events, (repeat_inserted, repeat_updated, repeat_skipped) = _dedupe_busy_events(
+            session, calendar_id=calendar.id, events=batch.events
+        )
+        _stage_busy_events(session, events)
+        inserted, updated, skipped = _count_busy_changes(session, calendar_id=calendar.id)
+        inserted += repeat_inserted
+        updated += repeat_updated
+        skipped += repeat_skipped
+        _upsert_staged_busy_events(session, calendar_id=calendar.id)
+        soft_deleted = _soft_delete_unstaged_busy_blocks(session, calendar_id=calendar.id, batch=batch)
 
         updated_at = datetime.now(_utc_tz.utc).isoformat()
         if state is None:
@@ -243,37 +206,122 @@ def sync_mailbox(
 ) -> MailSyncResult:
     scope = mailbox.strip() or IMAP_SCOPE_INBOX
     logger.info("mail_sync_started source=%s scope=%s", IMAP_SOURCE, scope)
-    state = session.exec(
+    state = _load_mail_state(session, scope)
+    try:
+        batch = _fetch_mail_batch(connector, scope=scope, state=state, received_since=received_since)
+    except Exception:
+        logger.error("mail_sync_failed source=%s scope=%s stage=fetch", IMAP_SOURCE, scope)
+        raise
+    return _apply_mail_batch(session, scope=scope, state=state, batch=batch)
+
+
+def sync_mailboxes(
+    session: Session,
+    *,
+    connector: ImapConnector,
+    mailboxes: Sequence[str],
+    received_since: date | None = None,
+    max_sessions: int | None = None,
+) -> dict[str, MailSyncResult]:
+    """Sync several mailboxes in one run, each under its own ``SyncState`` scope.
+
+    Headers are fetched concurrently over a small pool of authenticated IMAP sessions
+    that switch mailboxes with SELECT instead of logging in again. Batches are applied
+    on the calling thread, one commit per mailbox, as soon as each fetch completes. A
+    failed mailbox does not roll back the others; the first error is re-raised after
+    every other mailbox has been applied.
+    """
+    scopes = list(dict.fromkeys(mailbox.strip() or IMAP_SCOPE_INBOX for mailbox in mailboxes))
+    if not scopes:
+        return {}
+    states = {scope: _load_mail_state(session, scope) for scope in scopes}
+    pool_size = min(max_sessions or connector.max_sessions, len(scopes))
+    logger.info("mail_sync_started source=%s scopes=%s sessions=%s", IMAP_SOURCE, ",".join(scopes), pool_size)
+
+    results: dict[str, MailSyncResult] = {}
+    first_error: Exception | None = None
+    with ImapSessionPool(connector, size=pool_size) as session_pool, ThreadPoolExecutor(
+        max_workers=pool_size,
+        thread_name_prefix="execas-imap",
+    ) as executor:
+
+        def _fetch(scope: str) -> MailSyncBatch:
+            with session_pool.session(scope) as imap_session:
+                return _fetch_mail_batch(
+                    imap_session,
+                    scope=scope,
+                    state=states[scope],
+                    received_since=received_since,
+                )
+
+        futures = {executor.submit(_fetch, scope): scope for scope in scopes}
+        for future in as_completed(futures):
+            scope = futures[future]
+            try:
+                batch = future.result()
+                results[scope] = _apply_mail_batch(session, scope=scope, state=states[scope], batch=batch)
+            except Exception as exc:
+                logger.error("mail_sync_failed source=%s scope=%s", IMAP_SOURCE, scope)
+                if first_error is None:
+                    first_error = exc
+
+    if first_error is not None:
+        raise first_error
+    return {scope: results[scope] for scope in scopes}
+
+
+def _load_mail_state(session: Session, scope: str) -> SyncState | None:
+    return session.exec(
         select(SyncState)
         .where(SyncState.source == IMAP_SOURCE)
         .where(SyncState.scope == scope)
     ).first()
-    cursor_uidvalidity, cursor_uidnext = _parse_uid_cursor(state.cursor if state is not None else None)
 
-    try:
-        if received_since is None:
-            batch = connector.fetch_headers(
-                mailbox=scope,
-                cursor_uidvalidity=cursor_uidvalidity,
-                cursor_uidnext=cursor_uidnext,
-            )
-        else:
-            batch = connector.fetch_headers(
-                mailbox=scope,
-                cursor_uidvalidity=cursor_uidvalidity,
-                cursor_uidnext=cursor_uidnext,
-                received_since=received_since,
-            )
-    except Exception:
-        logger.error("mail_sync_failed source=%s scope=%s stage=fetch", IMAP_SOURCE, scope)
-        raise
-    if cursor_uidvalidity is not None and cursor_uidvalidity != batch.uidvalidity:
+
+def _fetch_mail_batch(
+    connector: MailConnector,
+    *,
+    scope: str,
+    state: SyncState | None,
+    received_since: date | None,
+) -> MailSyncBatch:
+    cursor_uidvalidity, cursor_uidnext, cursor_modseq = _parse_uid_cursor(
+        state.cursor if state is not None else None
+    )
+    fetch_kwargs: dict[str, object] = {}
+    if received_since is not None:
+        fetch_kwargs["received_since"] = received_since
+    if cursor_modseq is not None:
+        fetch_kwargs["cursor_modseq"] = cursor_modseq
+    return connector.fetch_headers(
+        mailbox=scope,
+        cursor_uidvalidity=cursor_uidvalidity,
+        cursor_uidnext=cursor_uidnext,
+        **fetch_kwargs,
+    )
+
+
+def _apply_mail_batch(
+    session: Session,
+    *,
+    scope: str,
+    state: SyncState | None,
+    batch: MailSyncBatch,
+) -> MailSyncResult:
+    cursor_uidvalidity, _, _ = _parse_uid_cursor(state.cursor if state is not None else None)
+    uidvalidity_changed = cursor_uidvalidity is not None and cursor_uidvalidity != batch.uidvalidity
+    if uidvalidity_changed:
         logger.warning(
             "mail_sync_uidvalidity_changed source=%s scope=%s",
             IMAP_SOURCE,
             scope,
         )
-    new_cursor = f"{batch.uidvalidity}:{batch.uidnext}"
+    if batch.highestmodseq is None:
+        new_cursor = f"{batch.uidvalidity}:{batch.uidnext}"
+        cursor_kind = IMAP_CURSOR_KIND_UID
+    else:
+        new_cursor = f"{batch.uidvalidity}:{batch.uidnext}:{batch.highestmodseq}"
+        cursor_kind = IMAP_CURSOR_KIND_UID_MODSEQ
     now_iso = datetime.now(_utc_tz.utc).isoformat()
 
     # If a provider serves duplicate Message-ID entries in one batch, keep the latest UID.
@@ -282,64 +330,34 @@ def sync_mailbox(
         for message in sorted(batch.messages, key=lambda message: message.mailbox_uid)
         if message.external_id
     }
-    incoming_external_ids = tuple(deduped_messages.keys())
-    if incoming_external_ids:
-        existing_rows = session.exec(
-            select(Email)
-            .where(Email.source == IMAP_SOURCE)
-            .where(Email.external_id.in_(incoming_external_ids))
-        ).all()
-    else:
-        existing_rows = []
-    existing_by_external_id = {row.external_id: row for row in existing_rows}
 
-    inserted = 0
-    updated = 0
     try:
         for message in deduped_messages.values():
             if message.mailbox_uid <= 0:
                 raise ValueError("Email mailbox UID must be > 0.")
 
-            flags_json = json.dumps(list(message.flags))
-            existing = existing_by_external_id.get(message.external_id)
-            if existing is None:
-                row = Email(
-                    source=IMAP_SOURCE,
-                    external_id=message.external_id,
-                    mailbox_uid=message.mailbox_uid,
-                    subject=message.subject,
-                    sender=message.sender,
-                    received_at=message.received_at,
-                    first_seen_at=now_iso,
-                    last_seen_at=now_iso,
-                    flags_json=flags_json,
-                )
-                session.add(row)
-                existing_by_external_id[message.external_id] = row
-                inserted += 1
-                continue
-
-            existing.mailbox_uid = message.mailbox_uid
-            existing.subject = message.subject
-            existing.sender = message.sender
-            existing.received_at = message.received_at
-            existing.last_seen_at = now_iso
-            existing.flags_json = flags_json
-            session.add(existing)
-            updated += 1
+        _stage_email_headers(session, deduped_messages.values())
+        inserted, updated = _count_email_changes(session)
+        if uidvalidity_changed:
+            # Old UIDs of this mailbox no longer name the same messages.
+            session.exec(sa.delete(EmailLocation).where(EmailLocation.mailbox == scope))
+        _upsert_staged_email_headers(session, mailbox=scope, now_iso=now_iso)
+        _upsert_staged_email_locations(session, mailbox=scope)
+        updated += _apply_flag_updates(session, mailbox=scope, updates=batch.flag_updates, now_iso=now_iso)
+        expunged = _mark_expunged(session, mailbox=scope, uids=batch.vanished_uids, now_iso=now_iso)
 
         if state is None:
             state = SyncState(
                 source=IMAP_SOURCE,
                 scope=scope,
                 cursor=new_cursor,
-                cursor_kind=IMAP_CURSOR_KIND_UID,
+                cursor_kind=cursor_kind,
                 updated_at=now_iso,
             )
             session.add(state)
         else:
             state.cursor = new_cursor
-            state.cursor_kind = IMAP_CURSOR_KIND_UID
+            state.cursor_kind = cursor_kind
             state.updated_at = now_iso
             session.add(state)
 
@@ -350,35 +368,450 @@ def sync_mailbox(
         raise
 
     logger.info(
-        "mail_sync_completed source=%s scope=%s inserted=%s updated=%s",
+        "mail_sync_completed source=%s scope=%s inserted=%s updated=%s expunged=%s",
         IMAP_SOURCE,
         scope,
         inserted,
         updated,
+        expunged,
     )
 
     return MailSyncResult(
         inserted=inserted,
         updated=updated,
         cursor=new_cursor,
-        cursor_kind=IMAP_CURSOR_KIND_UID,
+        cursor_kind=cursor_kind,
+        expunged=expunged,
     )
 
 
-def _parse_uid_cursor(cursor: str | None) -> tuple[int | None, int | None]:
+def watch_mailbox(
+    session: Session,
+    *,
+    connector: ImapConnector,
+    mailbox: str = IMAP_SCOPE_INBOX,
+    idle_timeout_sec: float = IMAP_IDLE_TIMEOUT_SEC,
+    retries: int = 5,
+    backoff_sec: int = 5,
+    max_syncs: int | None = None,
+    on_result: Callable[[MailSyncResult], None] | None = None,
+    sleep_fn: Callable[[float], None] = time.sleep,
+) -> int:
+    """Keep one IMAP session open and run ``sync_mailbox`` whenever IDLE reports changes.
+
+    A dropped connection is re-opened with exponential backoff; ``retries`` bounds
+    consecutive failures. Returns the number of completed syncs (``max_syncs`` stops the
+    loop, which is meant for tests and one-off runs).
+    """
+    scope = mailbox.strip() or IMAP_SCOPE_INBOX
+    completed = 0
+    failures = 0
+
+    def _done() -> bool:
+        return max_syncs is not None and completed >= max_syncs
+
+    while not _done():
+        try:
+            with connector.open_session(scope) as imap_session:
+                logger.info("mail_watch_connected source=%s scope=%s", IMAP_SOURCE, scope)
+                changed = True
+                while not _done():
+                    if changed:
+                        result = sync_mailbox(session, connector=imap_session, mailbox=scope)
+                        completed += 1
+                        failures = 0
+                        if on_result is not None:
+                            on_result(result)
+                        if _done():
+                            break
+                    changed = imap_session.wait_for_changes(timeout_sec=idle_timeout_sec)
+        except MailConnectorError as exc:
+            if failures >= retries:
+                raise
+            delay_sec = backoff_sec * (2**failures)
+            failures += 1
+            logger.warning(
+                "mail_watch_reconnecting source=%s scope=%s attempt=%s backoff_sec=%s error_type=%s",
+                IMAP_SOURCE,
+                scope,
+                failures,
+                delay_sec,
+                exc.__class__.__name__,
+            )
+            sleep_fn(float(delay_sec))
+
+    return completed
+
+
+def _dedupe_busy_events(
+    session: Session,
+    *,
+    calendar_id: int,
+    events: Sequence[RemoteCalendarEvent],
+) -> tuple[list[RemoteCalendarEvent], tuple[int, int, int]]:
+    """Collapse repeated external_ids to one event each, as applying them row by row would.
+
+    Occurrences apply in order: the first is inserted or compared with the stored row, a later
+    one is skipped when its etag matches the previous applied one and updated otherwise. The
+    staged event is the last applied occurrence. Every occurrence is counted, so the returned
+    ``(inserted, updated, skipped)`` correction is added to what ``_count_busy_changes`` reports
+    for the single staged row.
+    """
+    occurrences: dict[str, list[RemoteCalendarEvent]] = {}
+    for event in events:
+        occurrences.setdefault(event.external_id, []).append(event)
+    repeated_ids = [external_id for external_id, items in occurrences.items() if len(items) > 1]
+    if not repeated_ids:
+        return list(events), (0, 0, 0)
+
+    stored = {
+        row.external_id: (row.external_etag, row.is_deleted)
+        for row in session.exec(
+            select(BusyBlock.external_id, BusyBlock.external_etag, BusyBlock.is_deleted)
+            .where(BusyBlock.calendar_id == calendar_id)
+            .where(BusyBlock.source == CALDAV_SOURCE)
+            .where(BusyBlock.external_id.in_(repeated_ids))
+        ).all()
+    }
+    inserted = updated = skipped = 0
+    deduped: list[RemoteCalendarEvent] = []
+    for external_id, items in occurrences.items():
+        if len(items) == 1:
+            deduped.append(items[0])
+            continue
+        state = stored.get(external_id)
+        kept = items[0]
+        for event in items:
+            if state is None:
+                inserted += 1
+            elif state == (event.external_etag, 0):
+                skipped += 1
+                continue
+            else:
+                updated += 1
+            state = (event.external_etag, 0)
+            kept = event
+        deduped.append(kept)
+        # _count_busy_changes counts the staged event once against the stored row; undo that.
+        original = stored.get(external_id)
+        if original is None:
+            inserted -= 1
+        elif original == (kept.external_etag, 0):
+            skipped -= 1
+        else:
+            updated -= 1
+    return deduped, (inserted, updated, skipped)
+
+
+def _stage_busy_events(session: Session, events: Sequence[RemoteCalendarEvent]) -> None:
+    """Load the batch into a per-connection temp table for the set-based statements below."""
+    session.exec(sa.text(_BUSY_STAGE_DDL))
+    session.exec(sa.text("DELETE FROM temp.busy_blocks_stage"))
+    if not events:
+        return
+    # Plain DB-API executemany: per-row SQLAlchemy parameter processing would dominate here.
+    session.connection().exec_driver_sql(
+        "INSERT INTO temp.busy_blocks_stage "
+        "(external_id, start_dt, end_dt, title, external_etag, external_modified_at) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        [
+            (
+                event.external_id,
+                dt_to_db(event.start_dt),
+                dt_to_db(event.end_dt),
+                event.title,
+                event.external_etag,
+                event.external_modified_at,
+            )
+            for event in events
+        ],
+    )
+
+
+def _count_busy_changes(session: Session, *, calendar_id: int) -> tuple[int, int, int]:
+    """Return ``(inserted, updated, skipped)`` for the staged batch before it is applied."""
+    total, inserted, skipped = session.exec(
+        sa.text(
+            """
+            SELECT
+                COUNT(*),
+                COALESCE(SUM(b.id IS NULL), 0),
+                COALESCE(SUM(b.id IS NOT NULL AND b.external_etag IS s.external_etag AND b.is_deleted = 0), 0)
+            FROM temp.busy_blocks_stage AS s
+            LEFT JOIN busy_blocks AS b
+                ON b.calendar_id = :calendar_id
+                AND b.source = :source
+                AND b.external_id = s.external_id
+            """
+        ),
+        params={"calendar_id": calendar_id, "source": CALDAV_SOURCE},
+    ).one()
+    return inserted, total - inserted - skipped, skipped
+
+
+def _upsert_staged_busy_events(session: Session, *, calendar_id: int) -> None:
+    # Rows whose etag is unchanged and that are still live are left untouched (skipped).
+    session.exec(
+        sa.text(
+            """
+            INSERT INTO busy_blocks (
+                calendar_id, start_dt, end_dt, title, source,
+                external_id, external_etag, external_modified_at, is_deleted
+            )
+            SELECT
+                :calendar_id, start_dt, end_dt, title, :source,
+                external_id, external_etag, external_modified_at, 0
+            FROM temp.busy_blocks_stage
+            WHERE true
+            ON CONFLICT (calendar_id, source, external_id) WHERE external_id IS NOT NULL DO UPDATE SET
+                start_dt = excluded.start_dt,
+                end_dt = excluded.end_dt,
+                title = excluded.title,
+                external_etag = excluded.external_etag,
+                external_modified_at = excluded.external_modified_at,
+                is_deleted = 0
+            WHERE NOT (busy_blocks.external_etag IS excluded.external_etag AND busy_blocks.is_deleted = 0)
+            """
+        ),
+        params={"calendar_id": calendar_id, "source": CALDAV_SOURCE},
+    )
+
+
+def _soft_delete_unstaged_busy_blocks(session: Session, *, calendar_id: int, batch: CalendarSyncBatch) -> int:
+    """Soft-delete live rows the batch says are gone; returns the number of rows affected."""
+    coverage_clause = sa.true()
+    if batch.coverage_start is not None and batch.coverage_end is not None:
+        # Epoch columns compare instants, so rows stored with different UTC offsets still match.
+        coverage_clause = sa.and_(
+            BusyBlock.end_epoch > dt_to_epoch(batch.coverage_start),
+            BusyBlock.start_epoch < dt_to_epoch(batch.coverage_end),
+        )
+
+    if batch.full_snapshot:
+        scope_clause = coverage_clause
+        if batch.snapshot_id_prefixes:
+            # Partial snapshot: rows of skipped (unchanged) collections are left untouched.
+            scope_clause = sa.and_(
+                coverage_clause,
+                sa.or_(*[_prefix_clause(prefix) for prefix in batch.snapshot_id_prefixes]),
+            )
+    else:
+        # A deleted id removes the object itself and every expanded instance of it; replaced
+        # series only lose the instances inside the coverage window that were not re-sent.
+        deleted_clauses = [_series_instances_clause(series_id) for series_id in sorted(set(batch.deleted_external_ids))]
+        replaced_clauses = [
+            _series_instances_clause(series_id) for series_id in sorted(set(batch.replaced_series_ids))
+        ]
+        if replaced_clauses:
+            deleted_clauses.append(sa.and_(coverage_clause, sa.or_(*replaced_clauses)))
+        if not deleted_clauses:
+            return 0
+        scope_clause = sa.or_(*deleted_clauses)
+
+    staged_ids = sa.select(sa.column("external_id")).select_from(sa.text("temp.busy_blocks_stage"))
+    result = session.exec(
+        sa.update(BusyBlock)
+        .where(BusyBlock.calendar_id == calendar_id)
+        .where(BusyBlock.source == CALDAV_SOURCE)
+        .where(BusyBlock.external_id.is_not(None))
+        .where(BusyBlock.is_deleted == 0)
+        .where(BusyBlock.external_id.not_in(staged_ids))
+        .where(scope_clause)
+        .values(is_deleted=1)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+
+def _stage_email_headers(session: Session, messages: Iterable[RemoteEmailHeader]) -> None:
+    session.exec(sa.text(_EMAIL_STAGE_DDL))
+    session.exec(sa.text("DELETE FROM temp.emails_stage"))
+    rows = [
+        (
+            message.external_id,
+            message.mailbox_uid,
+            message.subject,
+            message.sender,
+            message.received_at,
+            json.dumps(list(message.flags)),
+        )
+        for message in messages
+    ]
+    if not rows:
+        return
+    session.connection().exec_driver_sql(
+        "INSERT INTO temp.emails_stage (external_id, mailbox_uid, subject, sender, received_at, flags_json) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        rows,
+    )
+
+
+def _count_email_changes(session: Session) -> tuple[int, int]:
+    """Return ``(inserted, updated)`` for the staged headers before they are applied."""
+    total, inserted = session.exec(
+        sa.text(
+            """
+            SELECT COUNT(*), COALESCE(SUM(e.id IS NULL), 0)
+            FROM temp.emails_stage AS s
+            LEFT JOIN emails AS e ON e.source = :source AND e.external_id = s.external_id
+            """
+        ),
+        params={"source": IMAP_SOURCE},
+    ).one()
+    return inserted, total - inserted
+
+
+def _upsert_staged_email_headers(session: Session, *, mailbox: str, now_iso: str) -> None:
+    session.exec(
+        sa.text(
+            """
+            INSERT INTO emails (
+                source, external_id, mailbox, mailbox_uid, subject, sender,
+                received_at, first_seen_at, last_seen_at, flags_json, expunged_at
+            )
+            SELECT
+                :source, external_id, :mailbox, mailbox_uid, subject, sender,
+                received_at, :now, :now, flags_json, NULL
+            FROM temp.emails_stage
+            WHERE true
+            ON CONFLICT (source, external_id) DO UPDATE SET
+                mailbox = excluded.mailbox,
+                mailbox_uid = excluded.mailbox_uid,
+                subject = excluded.subject,
+                sender = excluded.sender,
+                received_at = excluded.received_at,
+                last_seen_at = excluded.last_seen_at,
+                flags_json = excluded.flags_json,
+                expunged_at = NULL
+            """
+        ),
+        params={"source": IMAP_SOURCE, "mailbox": mailbox, "now": now_iso},
+    )
+
+
+def _upsert_staged_email_locations(session: Session, *, mailbox: str) -> None:
+    session.exec(
+        sa.text(
+            """
+            INSERT INTO email_locations (email_id, mailbox, mailbox_uid)
+            SELECT e.id, :mailbox, s.mailbox_uid
+            FROM temp.emails_stage AS s
+            JOIN emails AS e ON e.source = :source AND e.external_id = s.external_id
+            WHERE true
+            ON CONFLICT (email_id, mailbox) DO UPDATE SET
+                mailbox_uid = excluded.mailbox_uid
+            """
+        ),
+        params={"source": IMAP_SOURCE, "mailbox": mailbox},
+    )
+
+
+def _apply_flag_updates(
+    session: Session,
+    *,
+    mailbox: str,
+    updates: tuple[tuple[int, tuple[str, ...]], ...],
+    now_iso: str,
+) -> int:
+    """Store CONDSTORE flag changes on the messages these UIDs of ``mailbox`` name; returns rows updated."""
+    if not updates:
+        return 0
+    result = session.connection().exec_driver_sql(
+        "UPDATE emails SET flags_json = ?, last_seen_at = ? "
+        "WHERE source = ? AND id IN (SELECT email_id FROM email_locations WHERE mailbox = ? AND mailbox_uid = ?)",
+        [(json.dumps(list(flags)), now_iso, IMAP_SOURCE, mailbox, uid) for uid, flags in updates],
+    )
+    return result.rowcount
+
+
+def _series_instances_clause(series_id: str):
+    return sa.or_(
+        BusyBlock.external_id == series_id,
+        BusyBlock.external_id.like(f"{_escape_like(series_id)};%", escape="\\"),
+    )
+
+
+def _prefix_clause(prefix: str):
+    return BusyBlock.external_id.like(f"{_escape_like(prefix)}%", escape="\\")
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _mark_expunged(session: Session, *, mailbox: str, uids: tuple[int, ...], now_iso: str) -> int:
+    """Drop the locations the server reported as VANISHED; returns the rows newly expunged.
+
+    A message is expunged only once no synced mailbox still holds it. Rows still held
+    elsewhere move their ``mailbox``/``mailbox_uid`` to one of the remaining locations.
+    """
+    if not uids:
+        return 0
+    expunged = 0
+    remaining = sa.select(EmailLocation.id).where(EmailLocation.email_id == Email.id).exists()
+    first_location = (
+        sa.select(EmailLocation.mailbox, EmailLocation.mailbox_uid)
+        .where(EmailLocation.email_id == Email.id)
+        .order_by(EmailLocation.mailbox)
+        .limit(1)
+    )
+    for offset in range(0, len(uids), _UID_CHUNK_SIZE):
+        vanished = (
+            sa.select(EmailLocation.id, EmailLocation.email_id)
+            .where(EmailLocation.mailbox == mailbox)
+            .where(EmailLocation.mailbox_uid.in_(uids[offset : offset + _UID_CHUNK_SIZE]))
+        )
+        rows = session.exec(vanished).all()
+        if not rows:
+            continue
+        session.exec(
+            sa.delete(EmailLocation)
+            .where(EmailLocation.id.in_([row.id for row in rows]))
+            .execution_options(synchronize_session=False)
+        )
+        email_ids = sorted({row.email_id for row in rows})
+        result = session.exec(
+            sa.update(Email)
+            .where(Email.source == IMAP_SOURCE)
+            .where(Email.id.in_(email_ids))
+            .where(Email.expunged_at.is_(None))
+            .where(~remaining)
+            .values(expunged_at=now_iso)
+            .execution_options(synchronize_session=False)
+        )
+        expunged += result.rowcount
+        session.exec(
+            sa.update(Email)
+            .where(Email.id.in_(email_ids))
+            .where(Email.mailbox == mailbox)
+            .where(remaining)
+            .values(
+                mailbox=first_location.with_only_columns(EmailLocation.mailbox).scalar_subquery(),
+                mailbox_uid=first_location.with_only_columns(EmailLocation.mailbox_uid).scalar_subquery(),
+            )
+            .execution_options(synchronize_session=False)
+        )
+    return expunged
+
+
+def _parse_uid_cursor(cursor: str | None) -> tuple[int | None, int | None, int | None]:
+    """Parse ``uidvalidity:uidnext`` with an optional trailing ``:highestmodseq``."""
     if cursor is None:
-        return None, None
+        return None, None, None
 
-    parts = cursor.split(":", maxsplit=1)
-    if len(parts) != 2:
-        return None, None
+    parts = cursor.split(":")
+    if len(parts) not in (2, 3):
+        return None, None, None
 
     try:
         uidvalidity = int(parts[0])
         uidnext = int(parts[1])
+        modseq = int(parts[2]) if len(parts) == 3 else None
     except ValueError:
-        return None, None
+        return None, None, None
 
     if uidvalidity <= 0 or uidnext <= 0:
-        return None, None
-    return uidvalidity, uidnext
+        return None, None, None
+    if modseq is not None and modseq <= 0:
+        modseq = None
+    return uidvalidity, uidnext, modseq
@@ -39,6 +39,13 @@ def dt_to_db(dt: datetime) -> str:
     return dt.isoformat()
 
 
+def dt_to_epoch(dt: datetime) -> int:
+    """Convert tz-aware datetime to UTC epoch seconds, matching the DB ``*_epoch`` columns."""
+    if dt.tzinfo is None:
+        raise ValueError("dt_to_epoch requires a tz-aware datetime")
+    return int(dt.timestamp())
+
+
 def db_to_dt(s: str) -> datetime:
     """Parse ISO-8601 string from DB into a datetime."""
     return datetime.fromisoformat(s)
@@ -4,8 +4,9 @@ import pytest
 from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session, SQLModel, create_engine, select
 
+from executive_cli.db import get_engine, initialize_database
 from executive_cli.models import BusyBlock, Calendar
-from executive_cli.timeutil import dt_to_db
+from executive_cli.timeutil import dt_to_db, dt_to_epoch
 
 
 def _create_engine(tmp_path):
@@ -68,3 +69,53 @@ def test_busy_block_interval_constraint_accepts_positive_interval(tmp_path) -> N
 
         blocks = session.exec(select(BusyBlock)).all()
         assert len(blocks) == 1
+
+
+def test_busy_block_epoch_columns_follow_start_and_end_via_triggers(tmp_path) -> None:
+    engine = _create_engine(tmp_path)
+    tz_plus_3 = timezone(timedelta(hours=3))
+
+    with Session(engine) as session:
+        calendar = _create_calendar(session)
+        block = BusyBlock(
+            calendar_id=calendar.id,
+            start_dt=dt_to_db(datetime(2026, 2, 20, 10, 0, tzinfo=tz_plus_3)),
+            end_dt=dt_to_db(datetime(2026, 2, 20, 11, 0, tzinfo=tz_plus_3)),
+        )
+        session.add(block)
+        session.commit()
+        session.refresh(block)
+        assert block.start_epoch == dt_to_epoch(datetime(2026, 2, 20, 7, 0, tzinfo=timezone.utc))
+        assert block.end_epoch == block.start_epoch + 3600
+
+        block.end_dt = dt_to_db(datetime(2026, 2, 20, 8, 30, tzinfo=timezone.utc))
+        session.add(block)
+        session.commit()
+        session.refresh(block)
+        assert block.end_epoch == block.start_epoch + 90 * 60
+
+
+def test_migrated_schema_serves_busy_range_lookup_from_interval_index(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("EXECAS_DB_PATH", str(tmp_path / "migrated.sqlite"))
+    initialize_database()
+
+    with get_engine().connect() as connection:
+        plan = connection.exec_driver_sql(
+            "EXPLAIN QUERY PLAN SELECT id FROM busy_blocks "
+            "WHERE calendar_id = 1 AND is_deleted = 0 AND start_epoch < 200 AND end_epoch > 100 "
+            "ORDER BY start_epoch, id"
+        ).all()
+        triggers = {
+            row[0]
+            for row in connection.exec_driver_sql(
+                "SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'trg_%_epoch_%'"
+            )
+        }
+
+    assert any("ix_busy_blocks_calendar_interval" in row[-1] for row in plan)
+    assert triggers == {
+        "trg_busy_blocks_epoch_insert",
+        "trg_busy_blocks_epoch_update",
+        "trg_time_blocks_epoch_insert",
+        "trg_time_blocks_epoch_update",
+    }
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
 from datetime import datetime, timezone
+import io
+import threading
+import time
 from urllib.error import HTTPError, URLError
 
 import pytest
@@ -9,11 +13,14 @@ from executive_cli.connectors.caldav import (
     CalDavConnector,
     CalendarConnectorError,
     RemoteCalendarEvent,
+    _SyncCollectionChanges,
+    _SyncTokenInvalidError,
     _build_sync_window,
-    _decode_ical_text,
     _parse_ical_events,
-    _parse_ical_time_fragment,
 )
+from executive_cli.connectors.href_index import CalendarHrefIndex
+from executive_cli.connectors.ical import decode_text, parse_time_fragment
+from executive_cli.timeutil import MOSCOW_TZ
 
 
 class _ResponseStub:
@@ -62,6 +69,24 @@ def test_from_env_loads_password_from_keychain_when_env_missing(monkeypatch) ->
     assert connector.password == "secret-from-keychain"
 
 
+def test_from_env_reads_concurrency_and_timeout_overrides(monkeypatch) -> None:
+    monkeypatch.setenv("EXECAS_CALDAV_URL", "https://caldav.example.com")
+    monkeypatch.setenv("EXECAS_CALDAV_USERNAME", "alice")
+    monkeypatch.setenv("EXECAS_CALDAV_PASSWORD", "secret")
+    monkeypatch.setenv("EXECAS_CALDAV_MAX_WORKERS", "8")
+    monkeypatch.setenv("EXECAS_CALDAV_TIMEOUT_SEC", "5.5")
+
+    connector = CalDavConnector.from_env()
+    assert connector.max_workers == 8
+    assert connector.timeout_sec == 5.5
+
+    monkeypatch.setenv("EXECAS_CALDAV_MAX_WORKERS", "0")
+    monkeypatch.setenv("EXECAS_CALDAV_TIMEOUT_SEC", "bad-value")
+    connector = CalDavConnector.from_env()
+    assert connector.max_workers == 4
+    assert connector.timeout_sec == 20.0
+
+
 def test_build_sync_window_uses_env_overrides(monkeypatch) -> None:
     monkeypatch.setenv("EXECAS_CALDAV_SYNC_LOOKBACK_DAYS", "7")
     monkeypatch.setenv("EXECAS_CALDAV_SYNC_LOOKAHEAD_DAYS", "21")
@@ -280,8 +305,8 @@ def test_resolve_collection_url_discovers_events_collection(monkeypatch) -> None
 
     monkeypatch.setattr(CalDavConnector, "_request_xml_url", _request)
 
-    collection_url = connector._resolve_collection_url()
-    assert collection_url == "https://caldav.yandex.ru/calendars/alice/events/"
+    collection_urls = connector._resolve_collection_urls()
+    assert collection_urls[0] == "https://caldav.yandex.ru/calendars/alice/events/"
 
 
 def test_resolve_collection_urls_prefers_vevent_supported_collections(monkeypatch) -> None:
@@ -384,19 +409,75 @@ END:VCALENDAR</c:calendar-data>
   </d:response>
 </d:multistatus>
 """
-    monkeypatch.setattr(
-        CalDavConnector,
-        "_request_xml",
-        lambda self, *, method, depth, body: payload,
-    )
+    requests: list[tuple[str, str, str]] = []
+
+    def _open(self, url, *, method, depth, body):
+        requests.append((url, method, depth))
+        return io.BytesIO(payload)
+
+    monkeypatch.setattr(CalDavConnector, "_open_xml_url", _open)
+    monkeypatch.setattr("executive_cli.connectors.caldav._STREAM_CHUNK_SIZE", 64)
 
     events = connector._fetch_full_snapshot(timezone_name="Europe/Moscow")
+    assert requests == [("https://calendar.example/dav", "REPORT", "1")]
     assert [event.external_id for event in events] == ["uid-1", "uid-2;20260221T100000Z"]
     assert events[0].title == "Plan, sync"
     assert events[0].external_etag == '"etag-1"'
     assert events[1].external_modified_at == "2026-02-20T06:00:00+00:00"
 
 
+def test_fetch_full_snapshot_sends_time_range_calendar_query(monkeypatch) -> None:
+    connector = CalDavConnector(
+        base_url="https://calendar.example/dav",
+        username="alice",
+        password="secret",
+    )
+    captured: dict[str, str] = {}
+
+    def _open(self, url: str, *, method: str, depth: str, body: str):
+        captured.update(url=url, method=method, depth=depth, body=body)
+        return io.BytesIO(b'<d:multistatus xmlns:d="DAV:" />')
+
+    monkeypatch.setattr(CalDavConnector, "_open_xml_url", _open)
+
+    events = connector._fetch_full_snapshot(
+        timezone_name="Europe/Moscow",
+        window_start=datetime(2026, 1, 20, 3, 0, tzinfo=MOSCOW_TZ),
+        window_end=datetime(2027, 1, 20, 0, 0, tzinfo=timezone.utc),
+        collection_url="https://calendar.example/dav/events/",
+    )
+
+    assert events == []
+    assert captured["url"] == "https://calendar.example/dav/events/"
+    assert captured["method"] == "REPORT"
+    assert captured["depth"] == "1"
+    assert "<c:calendar-query" in captured["body"]
+    assert '<c:comp-filter name="VEVENT">' in captured["body"]
+    assert '<c:time-range start="20260120T000000Z" end="20270120T000000Z" />' in captured["body"]
+
+
+def test_iter_multistatus_responses_yields_responses_from_chunked_stream(monkeypatch) -> None:
+    connector = CalDavConnector(
+        base_url="https://calendar.example/dav",
+        username="alice",
+        password="secret",
+    )
+    responses = "".join(
+        f"<d:response><d:href>/dav/{index}.ics</d:href></d:response>" for index in range(50)
+    )
+    payload = f'<d:multistatus xmlns:d="DAV:">{responses}</d:multistatus>'.encode("utf-8")
+    monkeypatch.setattr("executive_cli.connectors.caldav._STREAM_CHUNK_SIZE", 16)
+
+    hrefs = [
+        response.findtext("{DAV:}href")
+        for response in connector._iter_multistatus_responses(io.BytesIO(payload))
+    ]
+    assert hrefs == [f"/dav/{index}.ics" for index in range(50)]
+
+    with pytest.raises(CalendarConnectorError, match="invalid"):
+        list(connector._iter_multistatus_responses(io.BytesIO(b"<d:multistatus xmlns:d='DAV:'><d:response>")))
+
+
 def test_parse_ical_events_handles_unfolding_and_fallback_end() -> None:
     calendar_data = """BEGIN:VCALENDAR
 BEGIN:VEVENT
@@ -485,11 +566,11 @@ END:VCALENDAR
 
 def test_parse_ical_time_fragment_rejects_unknown_format() -> None:
     with pytest.raises(ValueError, match="Unsupported iCal datetime value"):
-        _parse_ical_time_fragment("2026-02-20 10:00")
+        parse_time_fragment("2026-02-20 10:00")
 
 
 def test_decode_ical_text_unescapes_sequences() -> None:
-    assert _decode_ical_text(r"Line1\nLine2\,x\;y\\z") == "Line1\nLine2,x;y\\z"
+    assert decode_text(r"Line1\nLine2\,x\;y\\z") == "Line1\nLine2,x;y\\z"
 
 
 def test_request_xml_maps_transport_errors(monkeypatch) -> None:
@@ -532,3 +613,390 @@ def test_request_xml_maps_transport_errors(monkeypatch) -> None:
     )
     with pytest.raises(CalendarConnectorError, match="timed out"):
         connector._request_xml(method="PROPFIND", depth="0", body="<x/>")
+
+
+def test_fetch_events_with_sync_token_returns_incremental_delta(monkeypatch) -> None:
+    connector = CalDavConnector(
+        base_url="https://calendar.example/dav/events/",
+        username="alice",
+        password="secret",
+    )
+    monkeypatch.setattr(
+        CalDavConnector,
+        "_fetch_collection_props",
+        lambda self, *, collection_url=None: {"ctag": "ctag-2", "sync_token": "token-2"},
+    )
+    sync_payload = b"""<?xml version="1.0" encoding="utf-8"?>
+<d:multistatus xmlns:d="DAV:">
+  <d:response>
+    <d:href>/dav/events/uid-1.ics</d:href>
+    <d:propstat>
+      <d:status>HTTP/1.1 200 OK</d:status>
+      <d:prop><d:getetag>"etag-1b"</d:getetag></d:prop>
+    </d:propstat>
+  </d:response>
+  <d:response>
+    <d:href>/dav/events/3f2a9c.ics</d:href>
+    <d:status>HTTP/1.1 404 Not Found</d:status>
+  </d:response>
+  <d:sync-token>token-2</d:sync-token>
+</d:multistatus>
+"""
+    multiget_payload = b"""<?xml version="1.0" encoding="utf-8"?>
+<d:multistatus xmlns:d="DAV:" xmlns:c="urn:ietf:params:xml:ns:caldav">
+  <d:response>
+    <d:href>/dav/events/uid-1.ics</d:href>
+    <d:propstat>
+      <d:status>HTTP/1.1 200 OK</d:status>
+      <d:prop>
+        <d:getetag>"etag-1b"</d:getetag>
+        <c:calendar-data>BEGIN:VCALENDAR
+BEGIN:VEVENT
+UID:uid-1
+DTSTART:20260220T100000Z
+DTEND:20260220T110000Z
+SUMMARY:Moved
+END:VEVENT
+END:VCALENDAR</c:calendar-data>
+      </d:prop>
+    </d:propstat>
+  </d:response>
+</d:multistatus>
+"""
+    requests: list[tuple[str, str, str]] = []
+
+    def _request(self, url: str, *, method: str, depth: str, body: str):
+        requests.append((url, method, depth))
+        if "<d:sync-collection" in body:
+            assert "<d:sync-token>token-1</d:sync-token>" in body
+            return sync_payload
+        if "<c:calendar-multiget" in body:
+            assert "<d:href>/dav/events/uid-1.ics</d:href>" in body
+            return multiget_payload
+        raise AssertionError(body)
+
+    monkeypatch.setattr(CalDavConnector, "_request_xml_url", _request)
+    monkeypatch.setattr(
+        "executive_cli.connectors.caldav._build_sync_window",
+        lambda: (
+            datetime(2026, 2, 1, tzinfo=timezone.utc),
+            datetime(2026, 3, 1, tzinfo=timezone.utc),
+        ),
+    )
+    # Removed hrefs are resolved through the index built when the objects were fetched.
+    connector.href_index.record(collection="/dav/events|", href_path="/dav/events/3f2a9c.ics", uids={"uid-gone"})
+
+    batch = connector.fetch_events(
+        calendar_slug="primary",
+        cursor='{"https://calendar.example/dav/events/":"token-1"}',
+        cursor_kind="sync_token",
+        timezone_name="Europe/Moscow",
+    )
+
+    assert [method for _url, method, _depth in requests] == ["REPORT", "REPORT"]
+    assert batch.full_snapshot is False
+    assert batch.cursor_kind == "sync_token"
+    assert batch.cursor == '{"https://calendar.example/dav/events/":"token-2"}'
+    assert [event.external_id for event in batch.events] == ["/dav/events|uid-1"]
+    assert batch.events[0].external_etag == '"etag-1b"'
+    assert batch.replaced_series_ids == ("/dav/events|uid-1",)
+    assert batch.deleted_external_ids == ("/dav/events|uid-gone",)
+    assert connector.href_index.resolve(collection="/dav/events|", href_path="/dav/events/3f2a9c.ics") is None
+    assert connector.href_index.resolve(collection="/dav/events|", href_path="/dav/events/uid-1.ics") == ("uid-1",)
+
+
+def test_fetch_events_snapshots_collection_with_unresolved_removed_href(monkeypatch, tmp_path) -> None:
+    index_path = tmp_path / "caldav_href_index.json"
+    connector = CalDavConnector(
+        base_url="https://caldav.example.com",
+        username="alice",
+        password="secret",
+        href_index=CalendarHrefIndex(index_path),
+    )
+    work_url = "https://caldav.example.com/calendars/alice/work/"
+    home_url = "https://caldav.example.com/calendars/alice/home/"
+    monkeypatch.setattr(CalDavConnector, "_resolve_collection_urls", lambda self: [work_url, home_url])
+    tokens = {work_url: "work-2", home_url: "home-1"}
+    monkeypatch.setattr(
+        CalDavConnector,
+        "_fetch_collection_props",
+        lambda self, *, collection_url=None: {"sync_token": tokens[collection_url]},
+    )
+    monkeypatch.setattr(
+        CalDavConnector,
+        "_fetch_sync_collection_changes",
+        lambda self, *, collection_url, sync_token: _SyncCollectionChanges(
+            sync_token="work-2",
+            changed_hrefs=[],
+            removed_hrefs=["/calendars/alice/work/unknown.ics"],
+        ),
+    )
+    snapshot_payload = b"""<?xml version="1.0" encoding="utf-8"?>
+<d:multistatus xmlns:d="DAV:" xmlns:c="urn:ietf:params:xml:ns:caldav">
+  <d:response>
+    <d:href>/calendars/alice/work/a1b2.ics</d:href>
+    <d:propstat>
+      <d:status>HTTP/1.1 200 OK</d:status>
+      <d:prop>
+        <c:calendar-data>BEGIN:VCALENDAR
+BEGIN:VEVENT
+UID:uid-kept
+DTSTART:20260220T100000Z
+DTEND:20260220T110000Z
+END:VEVENT
+END:VCALENDAR</c:calendar-data>
+      </d:prop>
+    </d:propstat>
+  </d:response>
+</d:multistatus>
+"""
+    snapshot_urls: list[str] = []
+
+    @contextmanager
+    def _open(self, url: str, *, method: str, depth: str, body: str):
+        snapshot_urls.append(url)
+        yield io.BytesIO(snapshot_payload)
+
+    monkeypatch.setattr(CalDavConnector, "_open_xml_url", _open)
+    monkeypatch.setattr(
+        "executive_cli.connectors.caldav._build_sync_window",
+        lambda: (
+            datetime(2026, 2, 1, tzinfo=timezone.utc),
+            datetime(2026, 3, 1, tzinfo=timezone.utc),
+        ),
+    )
+
+    batch = connector.fetch_events(
+        calendar_slug="primary",
+        cursor=f'{{"{home_url}":"home-1","{work_url}":"work-1"}}',
+        cursor_kind="sync_token",
+        timezone_name="Europe/Moscow",
+    )
+
+    assert snapshot_urls == [work_url]
+    assert batch.full_snapshot is True
+    assert batch.snapshot_id_prefixes == ("/calendars/alice/work|",)
+    assert batch.cursor == f'{{"{home_url}":"home-1","{work_url}":"work-2"}}'
+    assert [event.external_id for event in batch.events] == ["/calendars/alice/work|uid-kept"]
+    reloaded = CalendarHrefIndex(index_path)
+    assert reloaded.resolve(collection="/calendars/alice/work|", href_path="/calendars/alice/work/a1b2.ics") == (
+        "uid-kept",
+    )
+
+
+def test_fetch_events_falls_back_to_snapshot_when_sync_token_is_invalid(monkeypatch) -> None:
+    connector = CalDavConnector(
+        base_url="https://calendar.example/dav/events/",
+        username="alice",
+        password="secret",
+    )
+    monkeypatch.setattr(
+        CalDavConnector,
+        "_fetch_collection_props",
+        lambda self, *, collection_url=None: {"sync_token": "token-9"},
+    )
+
+    def _reject(self, *, collection_url: str, sync_token: str):
+        raise _SyncTokenInvalidError("CalDAV sync-token is no longer valid.")
+
+    monkeypatch.setattr(CalDavConnector, "_fetch_sync_collection_changes", _reject)
+    monkeypatch.setattr(
+        CalDavConnector,
+        "_fetch_full_snapshot",
+        lambda self, *, timezone_name, window_start=None, window_end=None, external_id_prefix="", collection_url=None: [],
+    )
+
+    batch = connector.fetch_events(
+        calendar_slug="primary",
+        cursor='{"https://calendar.example/dav/events/":"token-old"}',
+        cursor_kind="sync_token",
+        timezone_name="Europe/Moscow",
+    )
+
+    assert batch.full_snapshot is True
+    assert batch.cursor == '{"https://calendar.example/dav/events/":"token-9"}'
+
+
+def test_fetch_events_skips_sync_report_for_collections_with_unchanged_token(monkeypatch) -> None:
+    connector = CalDavConnector(
+        base_url="https://caldav.example.com",
+        username="alice",
+        password="secret",
+    )
+    work_url = "https://caldav.example.com/calendars/alice/work/"
+    home_url = "https://caldav.example.com/calendars/alice/home/"
+    monkeypatch.setattr(CalDavConnector, "_resolve_collection_urls", lambda self: [work_url, home_url])
+    tokens = {work_url: "work-2", home_url: "home-1"}
+    monkeypatch.setattr(
+        CalDavConnector,
+        "_fetch_collection_props",
+        lambda self, *, collection_url=None: {"sync_token": tokens[collection_url]},
+    )
+    reported_urls: list[str] = []
+
+    def _request(self, url: str, *, method: str, depth: str, body: str):
+        assert "<d:sync-collection" in body
+        reported_urls.append(url)
+        return b"""<?xml version="1.0" encoding="utf-8"?>
+<d:multistatus xmlns:d="DAV:"><d:sync-token>work-2</d:sync-token></d:multistatus>
+"""
+
+    monkeypatch.setattr(CalDavConnector, "_request_xml_url", _request)
+
+    batch = connector.fetch_events(
+        calendar_slug="primary",
+        cursor=f'{{"{home_url}":"home-1","{work_url}":"work-1"}}',
+        cursor_kind="sync_token",
+        timezone_name="Europe/Moscow",
+    )
+
+    assert reported_urls == [work_url]
+    assert batch.full_snapshot is False
+    assert batch.events == []
+    assert batch.cursor == f'{{"{home_url}":"home-1","{work_url}":"work-2"}}'
+
+    reported_urls.clear()
+    tokens[work_url] = "work-2"
+    batch = connector.fetch_events(
+        calendar_slug="primary",
+        cursor=batch.cursor,
+        cursor_kind="sync_token",
+        timezone_name="Europe/Moscow",
+    )
+
+    assert reported_urls == []
+    assert batch.cursor == f'{{"{home_url}":"home-1","{work_url}":"work-2"}}'
+
+
+def test_request_xml_maps_invalid_sync_token_precondition(monkeypatch) -> None:
+    connector = CalDavConnector(
+        base_url="https://calendar.example/dav",
+        username="alice",
+        password="secret",
+    )
+
+    def _raise_403(request, timeout):
+        body = io.BytesIO(b'<d:error xmlns:d="DAV:"><d:valid-sync-token/></d:error>')
+        raise HTTPError(request.full_url, 403, "forbidden", hdrs=None, fp=body)
+
+    monkeypatch.setattr("executive_cli.connectors.caldav.urlopen", _raise_403)
+    with pytest.raises(_SyncTokenInvalidError):
+        connector._request_xml(method="REPORT", depth="0", body="<x/>")
+
+
+def test_fetch_events_refetches_only_collections_with_changed_ctag(monkeypatch) -> None:
+    connector = CalDavConnector(
+        base_url="https://caldav.example.com",
+        username="alice",
+        password="secret",
+    )
+    work_url = "https://caldav.example.com/calendars/alice/work/"
+    home_url = "https://caldav.example.com/calendars/alice/home/"
+    monkeypatch.setattr(CalDavConnector, "_resolve_collection_urls", lambda self: [work_url, home_url])
+    ctags = {work_url: "work-2", home_url: "home-1"}
+    monkeypatch.setattr(
+        CalDavConnector,
+        "_fetch_collection_props",
+        lambda self, *, collection_url=None: {"ctag": ctags[collection_url]},
+    )
+
+    fetched_urls: list[str] = []
+
+    def _snapshot(
+        self,
+        *,
+        timezone_name: str,
+        window_start=None,
+        window_end=None,
+        external_id_prefix: str = "",
+        collection_url: str | None = None,
+    ):
+        del timezone_name, window_start, window_end, external_id_prefix
+        fetched_urls.append(collection_url)
+        return []
+
+    monkeypatch.setattr(CalDavConnector, "_fetch_full_snapshot", _snapshot)
+
+    batch = connector.fetch_events(
+        calendar_slug="primary",
+        cursor=f"{home_url}::home-1|{work_url}::work-1",
+        cursor_kind="multi_ctag",
+        timezone_name="Europe/Moscow",
+    )
+
+    assert fetched_urls == [work_url]
+    assert batch.full_snapshot is True
+    assert batch.snapshot_id_prefixes == ("/calendars/alice/work|",)
+    assert batch.cursor == f"{home_url}::home-1|{work_url}::work-2"
+
+    fetched_urls.clear()
+    batch = connector.fetch_events(
+        calendar_slug="primary",
+        cursor=f"{home_url}::home-1",
+        cursor_kind="multi_ctag",
+        timezone_name="Europe/Moscow",
+    )
+    assert fetched_urls == [work_url, home_url]
+    assert batch.snapshot_id_prefixes == ()
+
+
+def test_fetch_events_fetches_collections_concurrently_in_stable_order(monkeypatch) -> None:
+    connector = CalDavConnector(
+        base_url="https://caldav.example.com",
+        username="alice",
+        password="secret",
+        max_workers=2,
+    )
+    work_url = "https://caldav.example.com/calendars/alice/work/"
+    home_url = "https://caldav.example.com/calendars/alice/home/"
+    monkeypatch.setattr(CalDavConnector, "_resolve_collection_urls", lambda self: [work_url, home_url])
+    monkeypatch.setattr(
+        CalDavConnector,
+        "_fetch_collection_props",
+        lambda self, *, collection_url=None: {"ctag": "ctag-1"},
+    )
+
+    barrier = threading.Barrier(2, timeout=5)
+    thread_names: set[str] = set()
+
+    def _snapshot(
+        self,
+        *,
+        timezone_name: str,
+        window_start=None,
+        window_end=None,
+        external_id_prefix: str = "",
+        collection_url: str | None = None,
+    ):
+        del timezone_name, window_start, window_end
+        barrier.wait()
+        thread_names.add(threading.current_thread().name)
+        if collection_url == work_url:
+            time.sleep(0.05)
+        return [
+            RemoteCalendarEvent(
+                external_id=f"{external_id_prefix}uid-1",
+                start_dt=datetime(2026, 2, 20, 10, 0, tzinfo=timezone.utc),
+                end_dt=datetime(2026, 2, 20, 11, 0, tzinfo=timezone.utc),
+                title=collection_url or "",
+                external_etag=None,
+                external_modified_at=None,
+            )
+        ]
+
+    monkeypatch.setattr(CalDavConnector, "_fetch_full_snapshot", _snapshot)
+
+    batch = connector.fetch_events(
+        calendar_slug="primary",
+        cursor=None,
+        cursor_kind=None,
+        timezone_name="Europe/Moscow",
+    )
+
+    assert len(thread_names) == 2
+    assert all(name.startswith("execas-caldav") for name in thread_names)
+    assert [event.external_id for event in batch.events] == [
+        "/calendars/alice/home|uid-1",
+        "/calendars/alice/work|uid-1",
+    ]
+    assert batch.cursor == f"{home_url}::ctag-1|{work_url}::ctag-1"
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+from dateutil.rrule import DAILY, rrule
+
+from executive_cli.connectors.caldav import _parse_ical_events
+from executive_cli.connectors.recurrence_cache import RecurrenceExpansionCache
+
+DTSTART = datetime(2026, 2, 16, 9, 30, tzinfo=timezone.utc)
+DAILY_RULE = rrule(DAILY, dtstart=DTSTART)
+
+CALENDAR_DATA = """BEGIN:VCALENDAR
+BEGIN:VEVENT
+UID:uid-daily
+DTSTART;TZID=Europe/Moscow:20260216T123000
+DTEND;TZID=Europe/Moscow:20260216T130000
+SUMMARY:Standup
+RRULE:FREQ=DAILY
+EXDATE;TZID=Europe/Moscow:20260218T123000
+END:VEVENT
+END:VCALENDAR
+"""
+
+
+class _CountingExpand:
+    def __init__(self) -> None:
+        self.calls: list[tuple[datetime, datetime]] = []
+
+    def __call__(self, range_start: datetime, range_end: datetime) -> list[datetime]:
+        self.calls.append((range_start, range_end))
+        return DAILY_RULE.between(range_start, range_end, inc=True)
+
+
+def _expand(cache: RecurrenceExpansionCache, expand_fn, *, start: datetime, end: datetime, content_hash="h1"):
+    return cache.expand(
+        collection="/cal|",
+        uid="uid-daily",
+        timezone_name="UTC",
+        content_hash=content_hash,
+        range_start=start,
+        range_end=end,
+        tz=timezone.utc,
+        expand_fn=expand_fn,
+    )
+
+
+def test_expansion_cache_reuses_and_extends_window_forward() -> None:
+    cache = RecurrenceExpansionCache()
+    expand_fn = _CountingExpand()
+    start = datetime(2026, 2, 16, tzinfo=timezone.utc)
+    end = start + timedelta(days=10)
+
+    first = _expand(cache, expand_fn, start=start, end=end)
+    second = _expand(cache, expand_fn, start=start + timedelta(days=1), end=end)
+    assert len(first) == 10
+    assert second == first[1:]
+    assert expand_fn.calls == [(start, end)]
+
+    slid = _expand(cache, expand_fn, start=start + timedelta(days=1), end=end + timedelta(days=1))
+    assert expand_fn.calls[-1] == (end, end + timedelta(days=1))
+    assert slid == DAILY_RULE.between(start + timedelta(days=1), end + timedelta(days=1), inc=True)
+
+    _expand(cache, expand_fn, start=start, end=end, content_hash="h2")
+    assert expand_fn.calls[-1] == (start, end)
+
+
+def test_expansion_cache_persists_between_instances(tmp_path) -> None:
+    path = tmp_path / "cache.json"
+    start = datetime(2026, 2, 16, tzinfo=timezone.utc)
+    end = start + timedelta(days=5)
+
+    cache = RecurrenceExpansionCache(path)
+    expected = _expand(cache, _CountingExpand(), start=start, end=end)
+    cache.save()
+
+    expand_fn = _CountingExpand()
+    reloaded = _expand(RecurrenceExpansionCache(path), expand_fn, start=start, end=end)
+    assert reloaded == expected
+    assert expand_fn.calls == []
+
+
+def test_parse_ical_events_with_expansion_cache_matches_uncached(monkeypatch) -> None:
+    window_start = datetime(2026, 2, 16, tzinfo=timezone.utc)
+    window_end = datetime(2026, 2, 21, tzinfo=timezone.utc)
+    kwargs = dict(
+        calendar_data=CALENDAR_DATA,
+        default_timezone=ZoneInfo("Europe/Moscow"),
+        window_start=window_start,
+        window_end=window_end,
+        external_id_prefix="/cal|",
+    )
+    cache = RecurrenceExpansionCache()
+
+    uncached = _parse_ical_events(**kwargs)
+    cached = _parse_ical_events(**kwargs, expansion_cache=cache)
+    assert cached == uncached
+    assert "/cal|uid-daily;20260218T093000Z" not in {event.external_id for event in cached}
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("recurrence should be served from cache")
+
+    monkeypatch.setattr("executive_cli.connectors.caldav.rrulestr", _fail)
+    again = _parse_ical_events(**kwargs, expansion_cache=cache)
+    assert again == uncached
+    assert again[0].start_dt.tzinfo == ZoneInfo("Europe/Moscow")
+
+
+def test_expansion_cache_separates_default_timezones() -> None:
+    floating = CALENDAR_DATA.replace(";TZID=Europe/Moscow", "")
+    window = {
+        "window_start": datetime(2026, 2, 16, tzinfo=timezone.utc),
+        "window_end": datetime(2026, 2, 20, tzinfo=timezone.utc),
+        "external_id_prefix": "/cal|",
+    }
+    cache = RecurrenceExpansionCache()
+
+    for tz in (ZoneInfo("Europe/Moscow"), timezone.utc, ZoneInfo("Europe/Moscow")):
+        cached = _parse_ical_events(calendar_data=floating, default_timezone=tz, expansion_cache=cache, **window)
+        uncached = _parse_ical_events(calendar_data=floating, default_timezone=tz, **window)
+        assert [event.start_dt for event in cached] == [event.start_dt for event in uncached]
+
+
+def test_expansion_cache_ignores_dtstamp_and_summary_changes(monkeypatch) -> None:
+    window = {
+        "default_timezone": ZoneInfo("Europe/Moscow"),
+        "window_start": datetime(2026, 2, 16, tzinfo=timezone.utc),
+        "window_end": datetime(2026, 2, 21, tzinfo=timezone.utc),
+        "external_id_prefix": "/cal|",
+    }
+    cache = RecurrenceExpansionCache()
+    first = _parse_ical_events(
+        calendar_data=CALENDAR_DATA.replace("SUMMARY:Standup", "DTSTAMP:20260301T080000Z\nSUMMARY:Standup"),
+        expansion_cache=cache,
+        **window,
+    )
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("recurrence should be served from cache")
+
+    monkeypatch.setattr("executive_cli.connectors.caldav.rrulestr", _fail)
+    again = _parse_ical_events(
+        calendar_data=CALENDAR_DATA.replace("SUMMARY:Standup", "DTSTAMP:20260302T090000Z\nSUMMARY:Daily sync"),
+        expansion_cache=cache,
+        **window,
+    )
+    assert [event.start_dt for event in again] == [event.start_dt for event in first]
+    assert {event.title for event in again} == {"Daily sync"}
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
 from sqlmodel import Session, select
 from typer.testing import CliRunner
 
+from executive_cli.busy_service import select_overlapping_busy_blocks
 from executive_cli.cli import app
 from executive_cli.db import PRIMARY_CALENDAR_SLUG, get_engine
 from executive_cli.models import BusyBlock, Calendar
@@ -75,3 +76,42 @@ def test_calendar_next_week_validates_non_empty_source(tmp_path, monkeypatch) ->
     result = runner.invoke(app, ["calendar", "next-week", "--source", "   "])
     assert result.exit_code != 0
     assert "--source must not be empty." in result.output
+
+
+def test_calendar_next_week_keeps_rows_whose_offset_sqlite_cannot_parse(tmp_path, monkeypatch) -> None:
+    db_path = tmp_path / "calendar_next_week_offset_seconds.sqlite"
+    monkeypatch.setenv("EXECAS_DB_PATH", str(db_path))
+    runner = CliRunner()
+    init_result = runner.invoke(app, ["init"])
+    assert init_result.exit_code == 0
+
+    # An offset with seconds makes strftime('%s', ...) in the epoch trigger yield NULL.
+    odd_tz = timezone(timedelta(hours=3, seconds=30))
+    with Session(get_engine(ensure_directory=True)) as session:
+        calendar = session.exec(select(Calendar).where(Calendar.slug == PRIMARY_CALENDAR_SLUG)).one()
+        session.add(
+            BusyBlock(
+                calendar_id=calendar.id,
+                start_dt=dt_to_db(datetime(2026, 2, 18, 10, 0, tzinfo=odd_tz)),
+                end_dt=dt_to_db(datetime(2026, 2, 18, 11, 0, tzinfo=odd_tz)),
+                title="Offset with seconds",
+                source=CALDAV_SOURCE,
+                external_id="uid-odd",
+            )
+        )
+        session.commit()
+        stored = session.exec(select(BusyBlock).where(BusyBlock.external_id == "uid-odd")).one()
+        assert stored.start_epoch is None
+
+        rows = select_overlapping_busy_blocks(
+            session,
+            calendar_id=calendar.id,
+            range_start=datetime(2026, 2, 16, 0, 0, tzinfo=MOSCOW_TZ),
+            range_end=datetime(2026, 2, 23, 0, 0, tzinfo=MOSCOW_TZ),
+        )
+        assert [row.external_id for row in rows] == ["uid-odd"]
+
+    result = runner.invoke(app, ["calendar", "next-week", "--anchor-date", "2026-02-15"])
+    assert result.exit_code == 0
+    assert "Count: 1" in result.output
+    assert "Offset with seconds" in result.output
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone
 
 import pytest
 from sqlmodel import Session, SQLModel, create_engine, select
@@ -179,6 +179,52 @@ def test_sync_service_etag_guard_skips_unchanged_rows(tmp_path) -> None:
         assert row.end_dt == dt_to_db(datetime(2026, 2, 20, 10, 0, tzinfo=MOSCOW_TZ))
 
 
+def test_sync_service_counts_repeated_external_ids_like_per_row_apply(tmp_path) -> None:
+    engine = _create_engine(tmp_path)
+
+    with Session(engine) as session:
+        calendar = _seed_primary_calendar(session)
+        session.add(
+            BusyBlock(
+                calendar_id=calendar.id,
+                start_dt=dt_to_db(datetime(2026, 2, 20, 9, 0, tzinfo=MOSCOW_TZ)),
+                end_dt=dt_to_db(datetime(2026, 2, 20, 10, 0, tzinfo=MOSCOW_TZ)),
+                title="Stored",
+                source=CALDAV_SOURCE,
+                external_id="uid-1",
+                external_etag="etag-1",
+            )
+        )
+        session.commit()
+
+        connector = FakeConnector(
+            CalendarSyncBatch(
+                events=[
+                    # uid-1: skipped (etag unchanged), updated (new etag), skipped (same as previous).
+                    _event(external_id="uid-1", start_h=9, end_h=10, etag="etag-1", title="Stored"),
+                    _event(external_id="uid-1", start_h=11, end_h=12, etag="etag-2", title="Moved"),
+                    _event(external_id="uid-1", start_h=15, end_h=16, etag="etag-2", title="Ignored"),
+                    # uid-2: inserted, then updated by a changed etag.
+                    _event(external_id="uid-2", start_h=13, end_h=14, etag="etag-a", title="First"),
+                    _event(external_id="uid-2", start_h=14, end_h=15, etag="etag-b", title="Second"),
+                ],
+                cursor="ctag-2",
+                cursor_kind="ctag",
+                full_snapshot=False,
+            )
+        )
+        result = sync_calendar_primary(session, connector=connector)
+        assert (result.inserted, result.updated, result.skipped) == (1, 2, 2)
+
+        rows = {
+            row.external_id: row
+            for row in session.exec(select(BusyBlock).where(BusyBlock.source == CALDAV_SOURCE)).all()
+        }
+        assert (rows["uid-1"].title, rows["uid-1"].external_etag) == ("Moved", "etag-2")
+        assert rows["uid-1"].start_dt == dt_to_db(datetime(2026, 2, 20, 11, 0, tzinfo=MOSCOW_TZ))
+        assert (rows["uid-2"].title, rows["uid-2"].external_etag) == ("Second", "etag-b")
+
+
 def test_sync_service_soft_deletes_missing_remote_and_keeps_manual_rows(tmp_path) -> None:
     engine = _create_engine(tmp_path)
 
@@ -304,6 +350,47 @@ def test_sync_service_soft_delete_is_limited_to_coverage_window(tmp_path) -> Non
         assert window_row.is_deleted == 1
 
 
+def test_sync_service_soft_delete_compares_coverage_by_instant_across_offsets(tmp_path) -> None:
+    engine = _create_engine(tmp_path)
+    utc = timezone.utc
+
+    with Session(engine) as session:
+        calendar = _seed_primary_calendar(session)
+        # Ends 06:30Z: before the coverage window even though "09:30+03:00" > "07:00+00:00" as text.
+        # Ends 07:30Z: inside the coverage window even though "07:30+00:00" < "10:00+03:00" as text.
+        for external_id, start_dt, end_dt in [
+            ("uid-before", datetime(2026, 2, 20, 9, 0, tzinfo=MOSCOW_TZ), datetime(2026, 2, 20, 9, 30, tzinfo=MOSCOW_TZ)),
+            ("uid-inside", datetime(2026, 2, 20, 7, 0, tzinfo=utc), datetime(2026, 2, 20, 7, 30, tzinfo=utc)),
+        ]:
+            session.add(
+                BusyBlock(
+                    calendar_id=calendar.id,
+                    start_dt=dt_to_db(start_dt),
+                    end_dt=dt_to_db(end_dt),
+                    source=CALDAV_SOURCE,
+                    external_id=external_id,
+                    external_etag="etag",
+                )
+            )
+        session.commit()
+
+        connector = FakeConnector(
+            CalendarSyncBatch(
+                events=[],
+                cursor="ctag-2",
+                cursor_kind="ctag",
+                full_snapshot=True,
+                coverage_start=datetime(2026, 2, 20, 7, 0, tzinfo=utc),
+                coverage_end=datetime(2026, 2, 21, 7, 0, tzinfo=utc),
+            )
+        )
+        result = sync_calendar_primary(session, connector=connector)
+        deleted = {row.external_id: row.is_deleted for row in session.exec(select(BusyBlock)).all()}
+
+    assert result.soft_deleted == 1
+    assert deleted == {"uid-before": 0, "uid-inside": 1}
+
+
 def test_sync_service_does_not_advance_cursor_on_failure(tmp_path) -> None:
     engine = _create_engine(tmp_path)
 
@@ -397,7 +484,7 @@ def test_calendar_sync_command_shows_fallback_on_connector_error(tmp_path, monke
     def _raise_from_env(cls):
         raise CalendarConnectorError("CalDAV endpoint is unreachable.")
 
-    monkeypatch.setattr("executive_cli.cli.CalDavConnector.from_env", classmethod(_raise_from_env))
+    monkeypatch.setattr("executive_cli.connectors.caldav.CalDavConnector.from_env", classmethod(_raise_from_env))
 
     result = runner.invoke(app, ["calendar", "sync"])
     assert result.exit_code == 1
@@ -423,7 +510,7 @@ def test_calendar_sync_command_executes_real_sync_flow(tmp_path, monkeypatch) ->
     )
 
     monkeypatch.setattr(
-        "executive_cli.cli.CalDavConnector.from_env",
+        "executive_cli.connectors.caldav.CalDavConnector.from_env",
         classmethod(lambda cls: connector),
     )
 
@@ -473,7 +560,7 @@ def test_calendar_sync_force_full_resets_cursor_before_fetch(tmp_path, monkeypat
         )
     )
     monkeypatch.setattr(
-        "executive_cli.cli.CalDavConnector.from_env",
+        "executive_cli.connectors.caldav.CalDavConnector.from_env",
         classmethod(lambda cls: connector),
     )
 
@@ -481,3 +568,101 @@ def test_calendar_sync_force_full_resets_cursor_before_fetch(tmp_path, monkeypat
     assert result.exit_code == 0
     assert "Forced full calendar resync applied" in result.output
     assert connector.calls == [("primary", None, None, "Europe/Moscow")]
+
+
+def test_sync_service_incremental_batch_applies_series_deletes_and_replacements(tmp_path) -> None:
+    engine = _create_engine(tmp_path)
+
+    with Session(engine) as session:
+        calendar = _seed_primary_calendar(session)
+
+        def _row(external_id: str, start_h: int, end_h: int) -> BusyBlock:
+            return BusyBlock(
+                calendar_id=calendar.id,
+                start_dt=dt_to_db(datetime(2026, 2, 20, start_h, 0, tzinfo=MOSCOW_TZ)),
+                end_dt=dt_to_db(datetime(2026, 2, 20, end_h, 0, tzinfo=MOSCOW_TZ)),
+                title=external_id,
+                source=CALDAV_SOURCE,
+                external_id=external_id,
+                external_etag="etag-old",
+            )
+
+        session.add(_row("/cal|uid-weekly;20260220T060000Z", 9, 10))
+        session.add(_row("/cal|uid-weekly;20260220T080000Z", 11, 12))
+        session.add(_row("/cal|uid-gone", 13, 14))
+        session.add(_row("/cal|uid-gone-series;20260220T120000Z", 15, 16))
+        session.add(_row("/cal|uid-untouched", 17, 18))
+        session.commit()
+
+        connector = FakeConnector(
+            CalendarSyncBatch(
+                events=[
+                    _event(
+                        external_id="/cal|uid-weekly;20260220T060000Z",
+                        start_h=9,
+                        end_h=10,
+                        etag="etag-new",
+                        title="Weekly",
+                    )
+                ],
+                cursor='{"https://calendar.example/cal/":"token-2"}',
+                cursor_kind="sync_token",
+                full_snapshot=False,
+                deleted_external_ids=("/cal|uid-gone", "/cal|uid-gone-series"),
+                coverage_start=datetime(2026, 2, 16, 0, 0, tzinfo=MOSCOW_TZ),
+                coverage_end=datetime(2026, 2, 23, 0, 0, tzinfo=MOSCOW_TZ),
+                replaced_series_ids=("/cal|uid-weekly",),
+            )
+        )
+        result = sync_calendar_primary(session, connector=connector)
+        assert result.updated == 1
+        assert result.soft_deleted == 3
+
+    with Session(engine) as session:
+        rows = session.exec(select(BusyBlock).order_by(BusyBlock.external_id)).all()
+        assert {row.external_id: row.is_deleted for row in rows} == {
+            "/cal|uid-gone": 1,
+            "/cal|uid-gone-series;20260220T120000Z": 1,
+            "/cal|uid-untouched": 0,
+            "/cal|uid-weekly;20260220T060000Z": 0,
+            "/cal|uid-weekly;20260220T080000Z": 1,
+        }
+
+
+def test_sync_service_partial_snapshot_keeps_rows_of_skipped_collections(tmp_path) -> None:
+    engine = _create_engine(tmp_path)
+
+    with Session(engine) as session:
+        calendar = _seed_primary_calendar(session)
+        for external_id, start_h in (("/cal/work|uid-w", 9), ("/cal/home|uid-h", 11)):
+            session.add(
+                BusyBlock(
+                    calendar_id=calendar.id,
+                    start_dt=dt_to_db(datetime(2026, 2, 20, start_h, 0, tzinfo=MOSCOW_TZ)),
+                    end_dt=dt_to_db(datetime(2026, 2, 20, start_h + 1, 0, tzinfo=MOSCOW_TZ)),
+                    title=external_id,
+                    source=CALDAV_SOURCE,
+                    external_id=external_id,
+                    external_etag="etag-1",
+                )
+            )
+        session.commit()
+
+        connector = FakeConnector(
+            CalendarSyncBatch(
+                events=[],
+                cursor="multi",
+                cursor_kind="multi_ctag",
+                full_snapshot=True,
+                snapshot_id_prefixes=("/cal/work|",),
+            )
+        )
+        result = sync_calendar_primary(session, connector=connector)
+        assert result.soft_deleted == 1
+
+    with Session(engine) as session:
+        rows = session.exec(select(BusyBlock).order_by(BusyBlock.external_id)).all()
+        assert {row.external_id: row.is_deleted for row in rows} == {
+            "/cal/home|uid-h": 0,
+            "/cal/work|uid-w": 1,
+        }
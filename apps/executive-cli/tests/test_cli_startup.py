@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+
+from typer.testing import CliRunner
+
+from executive_cli.cli import COMMAND_GROUPS, app
+from executive_cli.launcher import IMPORT_PROFILE_ENV
+
+_HEAVY_PREFIXES = ("sqlalchemy", "sqlmodel", "alembic", "executive_cli.connectors", "executive_cli.ingest")
+
+_PROBE = """
+import json, sys
+from typer.testing import CliRunner
+from executive_cli.cli import app
+result = CliRunner().invoke(app, sys.argv[1:])
+print(json.dumps({"exit_code": result.exit_code, "modules": sorted(sys.modules)}))
+"""
+
+
+def _run_probe(*args: str) -> dict:
+    completed = subprocess.run(
+        [sys.executable, "-c", _PROBE, *args],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def test_root_help_lists_every_group_without_importing_command_modules() -> None:
+    probe = _run_probe("--help")
+
+    assert probe["exit_code"] == 0
+    loaded = [name for name in probe["modules"] if name.startswith(("executive_cli.commands", *_HEAVY_PREFIXES))]
+    assert loaded == []
+
+    result = CliRunner().invoke(app, ["--help"])
+    for name in COMMAND_GROUPS:
+        assert name in result.output
+
+
+def test_group_dispatch_imports_only_that_command_module() -> None:
+    probe = _run_probe("secret", "--help")
+
+    assert probe["exit_code"] == 0
+    commands = [name for name in probe["modules"] if name.startswith("executive_cli.commands.")]
+    assert commands == ["executive_cli.commands.secret"]
+    assert not [name for name in probe["modules"] if name.startswith(_HEAVY_PREFIXES)]
+
+
+def test_import_profile_env_reruns_command_under_importtime() -> None:
+    completed = subprocess.run(
+        [sys.executable, "-m", "executive_cli", "--help"],
+        capture_output=True,
+        text=True,
+        env={**os.environ, IMPORT_PROFILE_ENV: "1"},
+    )
+
+    assert completed.returncode == 0
+    assert "Executive Assistant CLI." in completed.stdout
+    assert "import time:" in completed.stderr
+    assert "executive_cli.cli" in completed.stderr
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import os
+import socket
+import stat
+import threading
+
+import pytest
+from typer.testing import CliRunner
+
+from executive_cli.cli import app
+from executive_cli import daemon as daemon_module
+from executive_cli.daemon import create_server
+from executive_cli.daemon_client import DaemonError, forward_command, is_forwardable
+
+
+@pytest.fixture
+def daemon(tmp_path, monkeypatch):
+    monkeypatch.setenv("EXECAS_DB_PATH", str(tmp_path / "execas.sqlite"))
+    socket_path = tmp_path / "execas.sock"
+    server = create_server(socket_path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield socket_path
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join(timeout=5)
+
+
+def test_forwarded_commands_match_in_process_output(daemon) -> None:
+    created = forward_command(
+        ["task", "capture", "Write memo", "--estimate", "30", "--priority", "P2"],
+        socket_path=daemon,
+    )
+    assert created is not None
+    assert created.exit_code == 0, created.stderr
+
+    forwarded = forward_command(["task", "list"], socket_path=daemon)
+    local = CliRunner().invoke(app, ["task", "list"])
+    assert forwarded is not None
+    assert forwarded.exit_code == 0
+    assert forwarded.stdout == local.output
+    assert 'title="Write memo"' in forwarded.stdout
+
+    invalid = forward_command(["config", "set", "buffer_min", "-1"], socket_path=daemon)
+    assert invalid is not None
+    assert invalid.exit_code != 0
+    assert invalid.stdout + invalid.stderr
+
+
+def test_client_runs_locally_when_daemon_cannot_serve(daemon, tmp_path, monkeypatch) -> None:
+    assert not is_forwardable(["secret", "status"])
+    assert not is_forwardable(["review", "scrum-metrics"])
+    assert forward_command(["secret", "status"], socket_path=daemon) is None
+    assert forward_command(["task", "list"], socket_path=tmp_path / "missing.sock") is None
+
+    monkeypatch.setenv("EXECAS_DAEMON", "0")
+    assert forward_command(["task", "list"], socket_path=daemon) is None
+    monkeypatch.delenv("EXECAS_DAEMON")
+
+    # A daemon bound to another database never runs the command.
+    monkeypatch.setenv("EXECAS_DB_PATH", str(tmp_path / "other.sqlite"))
+    assert forward_command(["task", "list"], socket_path=daemon) is None
+
+
+def test_daemon_socket_is_owner_only(daemon) -> None:
+    assert stat.S_IMODE(os.stat(daemon).st_mode) == 0o600
+
+
+def test_daemon_runs_in_caller_cwd_and_refuses_other_settings(daemon, tmp_path, monkeypatch) -> None:
+    seen_cwds: list[str] = []
+    real_run_command = daemon_module.run_command
+
+    def _recording_run_command(command, argv):
+        seen_cwds.append(os.getcwd())
+        return real_run_command(command, argv)
+
+    monkeypatch.setattr(daemon_module, "run_command", _recording_run_command)
+    caller_dir = tmp_path / "caller"
+    caller_dir.mkdir()
+    daemon_cwd = os.getcwd()
+    monkeypatch.chdir(caller_dir)
+
+    response = forward_command(["task", "list"], socket_path=daemon)
+    assert response is not None
+    assert seen_cwds == [str(caller_dir)]
+    assert os.getcwd() == str(caller_dir)
+    monkeypatch.chdir(daemon_cwd)
+
+    # Settings the daemon read at startup could differ from the caller's: run locally.
+    monkeypatch.setenv("EXECAS_SQLITE_SYNCHRONOUS", "FULL")
+    assert forward_command(["task", "list"], socket_path=daemon) is None
+    assert len(seen_cwds) == 1
+
+
+def test_create_server_refuses_live_socket_and_replaces_stale_one(daemon, tmp_path) -> None:
+    with pytest.raises(DaemonError):
+        create_server(daemon)
+
+    stale_path = tmp_path / "stale.sock"
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(stale_path))
+    stale.close()
+    assert stale_path.exists()
+
+    server = create_server(stale_path)
+    server.server_close()
+    assert not stale_path.exists()
+
+
+def test_forward_command_raises_when_daemon_closes_without_reply(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("EXECAS_DB_PATH", str(tmp_path / "execas.sqlite"))
+    socket_path = tmp_path / "closing.sock"
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(str(socket_path))
+    listener.listen(1)
+
+    def _accept_and_close() -> None:
+        connection, _ = listener.accept()
+        # Drain the request first so the close is a clean EOF rather than a reset.
+        while connection.recv(65536):
+            pass
+        connection.close()
+
+    thread = threading.Thread(target=_accept_and_close, daemon=True)
+    thread.start()
+    try:
+        with pytest.raises(DaemonError, match="invalid reply"):
+            forward_command(["task", "list"], socket_path=socket_path)
+    finally:
+        thread.join(timeout=5)
+        listener.close()
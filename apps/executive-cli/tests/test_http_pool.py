@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import gzip
+import http.client
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+from urllib.error import HTTPError, URLError
+from urllib.request import Request
+
+import pytest
+
+from executive_cli.http_pool import HttpConnectionPool
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    peers: list[tuple[str, int]] = []
+    methods: list[str] = []
+    drop_after_response = False
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length)
+        type(self).peers.append(self.client_address)
+        type(self).methods.append(self.command)
+
+        if self.path == "/moved":
+            self.send_response(301)
+            self.send_header("Location", "/echo")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path == "/missing":
+            self._reply(404, b"not here")
+            return
+        if self.path == "/gzip" and "gzip" in (self.headers.get("Accept-Encoding") or ""):
+            self._reply(200, gzip.compress(b"compressed:" + body), encoding="gzip")
+            return
+        self._reply(200, b"echo:" + body)
+        if type(self).drop_after_response:
+            # Close without announcing it, like a server reaping an idle keep-alive socket.
+            self.close_connection = True
+
+    do_REPORT = do_POST
+
+    def _reply(self, status: int, payload: bytes, *, encoding: str | None = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(payload)))
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args) -> None:
+        del format, args
+
+
+@pytest.fixture
+def server():
+    _Handler.peers = []
+    _Handler.methods = []
+    _Handler.drop_after_response = False
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def _post(url: str, body: bytes) -> Request:
+    return Request(url, data=body, method="POST", headers={"Content-Type": "text/plain"})
+
+
+def test_pool_reuses_keep_alive_connection(server) -> None:
+    pool = HttpConnectionPool()
+    try:
+        bodies = [pool.urlopen(_post(f"{server}/echo", f"n{i}".encode()), timeout=5).read() for i in range(3)]
+    finally:
+        pool.close()
+
+    assert bodies == [b"echo:n0", b"echo:n1", b"echo:n2"]
+    assert len(_Handler.peers) == 3
+    assert len(set(_Handler.peers)) == 1
+
+
+def test_pool_decodes_gzip_response(server) -> None:
+    pool = HttpConnectionPool()
+    try:
+        with pool.urlopen(_post(f"{server}/gzip", b"payload"), timeout=5) as response:
+            assert response.read() == b"compressed:payload"
+    finally:
+        pool.close()
+
+
+def test_pool_streams_gzip_body_and_reuses_connection_after_close(server) -> None:
+    pool = HttpConnectionPool()
+    try:
+        with pool.urlopen(_post(f"{server}/gzip", b"x" * 5000), timeout=5, stream=True) as response:
+            chunks = []
+            while chunk := response.read(64):
+                chunks.append(chunk)
+        assert b"".join(chunks) == b"compressed:" + b"x" * 5000
+
+        pool.urlopen(_post(f"{server}/echo", b"next"), timeout=5)
+    finally:
+        pool.close()
+    assert len(set(_Handler.peers)) == 1
+
+
+def test_pool_raises_http_error_with_readable_body(server) -> None:
+    pool = HttpConnectionPool()
+    try:
+        with pytest.raises(HTTPError) as exc_info:
+            pool.urlopen(_post(f"{server}/missing", b""), timeout=5)
+        assert exc_info.value.code == 404
+        assert exc_info.value.read() == b"not here"
+
+        # The connection survives a non-2xx response and is reused.
+        pool.urlopen(_post(f"{server}/echo", b"after"), timeout=5)
+    finally:
+        pool.close()
+    assert len(set(_Handler.peers)) == 1
+
+
+def test_pool_retries_once_when_idle_connection_was_dropped(server) -> None:
+    _Handler.drop_after_response = True
+    pool = HttpConnectionPool()
+    try:
+        first = pool.urlopen(Request(f"{server}/echo", data=b"a", method="REPORT"), timeout=5).read()
+        second = pool.urlopen(Request(f"{server}/echo", data=b"b", method="REPORT"), timeout=5).read()
+    finally:
+        pool.close()
+
+    assert (first, second) == (b"echo:a", b"echo:b")
+    assert len(set(_Handler.peers)) == 2
+
+
+def test_pool_follows_redirects_for_read_only_methods(server) -> None:
+    pool = HttpConnectionPool()
+    try:
+        report = Request(f"{server}/moved", data=b"<q/>", method="REPORT")
+        assert pool.urlopen(report, timeout=5).read() == b"echo:<q/>"
+
+        with pytest.raises(HTTPError) as exc_info:
+            pool.urlopen(_post(f"{server}/moved", b"x"), timeout=5)
+        assert exc_info.value.code == 301
+    finally:
+        pool.close()
+
+    assert _Handler.methods == ["REPORT", "REPORT", "POST"]
+
+
+def test_pool_hands_proxied_urls_to_urllib(monkeypatch) -> None:
+    opened: list[str] = []
+    monkeypatch.setattr("urllib.request.getproxies", lambda: {"https": "http://proxy.example:3128"})
+    monkeypatch.setattr("urllib.request.proxy_bypass", lambda host: host == "intranet.example")
+    monkeypatch.setattr("urllib.request.urlopen", lambda request, timeout: opened.append(request.full_url) or "raw")
+    pool = HttpConnectionPool()
+    monkeypatch.setattr(pool, "_send", lambda request, *, timeout: pytest.fail("pool must not connect"))
+
+    assert pool.urlopen(Request("https://calendar.example/dav/"), timeout=5) == "raw"
+    assert opened == ["https://calendar.example/dav/"]
+
+    def _direct(request, *, timeout):
+        raise TimeoutError("direct connection")
+
+    monkeypatch.setattr(pool, "_send", _direct)
+    with pytest.raises(TimeoutError, match="direct connection"):
+        pool.urlopen(Request("https://intranet.example/dav/"), timeout=5)
+
+
+class _DroppedConnection:
+    """Idle connection the server closed: the request is sent, but no response arrives."""
+
+    sock = None
+    timeout = None
+
+    def __init__(self) -> None:
+        self.requests = 0
+
+    def request(self, method, target, *, body=None, headers=None) -> None:
+        self.requests += 1
+
+    def getresponse(self):
+        raise http.client.RemoteDisconnected("Remote end closed connection without response")
+
+    def close(self) -> None:
+        pass
+
+
+def test_pool_does_not_resend_post_after_response_was_lost(monkeypatch) -> None:
+    pool = HttpConnectionPool()
+    dropped = _DroppedConnection()
+    pool._slot(("http", "llm.example", 80)).idle.append(dropped)
+    monkeypatch.setattr(pool, "_connect", lambda key, timeout: pytest.fail("POST must not be re-sent"))
+
+    with pytest.raises(URLError, match="closed by server"):
+        pool.urlopen(_post("http://llm.example/v1/messages", b"{}"), timeout=5)
+    assert dropped.requests == 1
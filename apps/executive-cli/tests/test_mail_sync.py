@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
 from datetime import date, datetime, timezone
 
 import pytest
@@ -7,10 +8,16 @@ from sqlmodel import Session, SQLModel, create_engine, select
 from typer.testing import CliRunner
 
 from executive_cli.cli import app
-from executive_cli.connectors.imap import ImapConnector, MailConnectorError, MailSyncBatch, RemoteEmailHeader
+from executive_cli.connectors.imap import (
+    ImapConnector,
+    ImapSession,
+    MailConnectorError,
+    MailSyncBatch,
+    RemoteEmailHeader,
+)
 from executive_cli.db import get_engine
-from executive_cli.models import Email, SyncState
-from executive_cli.sync_service import IMAP_SCOPE_INBOX, IMAP_SOURCE, sync_mailbox
+from executive_cli.models import Email, EmailLocation, SyncState
+from executive_cli.sync_service import IMAP_SCOPE_INBOX, IMAP_SOURCE, sync_mailbox, sync_mailboxes, watch_mailbox
 
 
 def _create_engine(tmp_path):
@@ -206,7 +213,7 @@ def test_mail_sync_command_shows_fallback_on_connector_error(tmp_path, monkeypat
     def _raise_from_env(cls):
         raise MailConnectorError("IMAP endpoint is unreachable.")
 
-    monkeypatch.setattr("executive_cli.cli.ImapConnector.from_env", classmethod(_raise_from_env))
+    monkeypatch.setattr("executive_cli.connectors.imap.ImapConnector.from_env", classmethod(_raise_from_env))
 
     result = runner.invoke(app, ["mail", "sync"])
     assert result.exit_code == 1
@@ -239,7 +246,7 @@ def test_mail_sync_command_executes_real_sync_flow(tmp_path, monkeypatch) -> Non
         )
     )
     monkeypatch.setattr(
-        "executive_cli.cli.ImapConnector.from_env",
+        "executive_cli.connectors.imap.ImapConnector.from_env",
         classmethod(lambda cls: connector),
     )
 
@@ -269,16 +276,16 @@ def test_mail_sync_command_this_year_applies_year_start_filter(tmp_path, monkeyp
     assert init_result.exit_code == 0
 
     connector = FakeConnector(MailSyncBatch(messages=[], uidvalidity=500, uidnext=1))
-    monkeypatch.setattr("executive_cli.cli.ImapConnector.from_env", classmethod(lambda cls: connector))
+    monkeypatch.setattr("executive_cli.connectors.imap.ImapConnector.from_env", classmethod(lambda cls: connector))
 
     captured: dict[str, date | None] = {"received_since": None}
 
     def _sync_mailbox_stub(session, *, connector, mailbox, received_since=None):
         del session, connector, mailbox
         captured["received_since"] = received_since
-        return type("Result", (), {"inserted": 0, "updated": 0, "cursor_kind": "uidvalidity_uidnext", "cursor": "500:1"})()
+        return type("Result", (), {"inserted": 0, "updated": 0, "expunged": 0, "cursor_kind": "uidvalidity_uidnext", "cursor": "500:1"})()
 
-    monkeypatch.setattr("executive_cli.cli.sync_mailbox", _sync_mailbox_stub)
+    monkeypatch.setattr("executive_cli.commands.mail.sync_mailbox", _sync_mailbox_stub)
 
     result = runner.invoke(app, ["mail", "sync", "--this-year"])
     assert result.exit_code == 0
@@ -406,3 +413,487 @@ def test_imap_connector_search_uses_since_filter(monkeypatch) -> None:
         received_since=date(2026, 1, 1),
     )
     assert calls["criteria"] == "1:* SINCE 01-Jan-2026"
+
+
+def test_imap_connector_fetches_headers_in_uid_set_chunks(monkeypatch) -> None:
+    connector = ImapConnector(
+        host="imap.example.com",
+        username="alice",
+        password="secret",
+        fetch_batch_size=3,
+    )
+
+    fetch_sets: list[str] = []
+
+    def _message(uid: int, *, trailing_flags: bool = False) -> list[tuple[bytes, bytes] | bytes]:
+        header = (
+            f"Message-ID: <m{uid}@example.com>\r\n"
+            f"Subject: Message {uid}\r\n"
+            "From: Bob <bob@example.com>\r\n\r\n"
+        ).encode()
+        if trailing_flags:
+            meta = f"{uid} (UID {uid} BODY[HEADER.FIELDS (MESSAGE-ID SUBJECT FROM DATE)] {{{len(header)}}}"
+            return [(meta.encode(), header), b" FLAGS (\\Flagged))"]
+        meta = f"{uid} (UID {uid} FLAGS (\\Seen) BODY[HEADER.FIELDS (MESSAGE-ID SUBJECT FROM DATE)] {{{len(header)}}}"
+        return [(meta.encode(), header), b")"]
+
+    class _ImapStub:
+        def __init__(self, host: str, port: int, timeout: float):
+            del host, port, timeout
+
+        def login(self, username: str, password: str):
+            del username, password
+            return "OK", [b"Logged in"]
+
+        def select(self, mailbox: str, readonly: bool = False):
+            del mailbox, readonly
+            return "OK", [b"5"]
+
+        def status(self, mailbox: str, criteria: str):
+            del mailbox, criteria
+            return "OK", [b"INBOX (UIDVALIDITY 900 UIDNEXT 11)"]
+
+        def uid(self, command: str, *args):
+            if command == "SEARCH":
+                return "OK", [b"1 2 3 7 10"]
+            if command == "FETCH":
+                fetch_sets.append(args[0])
+                if args[0] == "1:3":
+                    # UID 2 is gone server-side; unsolicited updates for UIDs 50 and 99 must be
+                    # ignored, and UID 50's flags must not be credited to UID 1.
+                    unsolicited = b"4 (FLAGS (\\Deleted) UID 50)"
+                    return "OK", [*_message(1), unsolicited, *_message(3, trailing_flags=True), *_message(99)]
+                if args[0] == "7,10":
+                    return "OK", [*_message(7), *_message(10)]
+            raise AssertionError((command, args))
+
+        def logout(self):
+            return "BYE", [b"Logged out"]
+
+    monkeypatch.setattr("executive_cli.connectors.imap.imaplib.IMAP4_SSL", _ImapStub)
+
+    batch = connector.fetch_headers(mailbox="INBOX", cursor_uidvalidity=None, cursor_uidnext=None)
+    assert fetch_sets == ["1:3", "7,10"]
+    assert [message.mailbox_uid for message in batch.messages] == [1, 3, 7, 10]
+    assert batch.messages[0].external_id == "<m1@example.com>"
+    assert batch.messages[0].flags == ("\\Seen",)
+    assert batch.messages[1].flags == ("\\Flagged",)
+    assert batch.messages[3].subject == "Message 10"
+
+
+def test_imap_from_env_rejects_invalid_fetch_batch_size(monkeypatch) -> None:
+    monkeypatch.setenv("EXECAS_IMAP_HOST", "imap.example.com")
+    monkeypatch.setenv("EXECAS_IMAP_USERNAME", "alice")
+    monkeypatch.setenv("EXECAS_IMAP_PASSWORD", "secret")
+    monkeypatch.setenv("EXECAS_IMAP_FETCH_BATCH_SIZE", "0")
+
+    with pytest.raises(MailConnectorError, match="batch size"):
+        ImapConnector.from_env()
+
+    monkeypatch.setenv("EXECAS_IMAP_FETCH_BATCH_SIZE", "250")
+    assert ImapConnector.from_env().fetch_batch_size == 250
+
+
+def test_imap_session_idle_reports_new_mail_and_terminates_idle() -> None:
+    class _SockStub:
+        def __init__(self) -> None:
+            self.timeouts: list[float] = []
+
+        def settimeout(self, value: float) -> None:
+            self.timeouts.append(value)
+
+    class _ClientStub:
+        capabilities = ("IMAP4REV1", "IDLE")
+
+        def __init__(self) -> None:
+            self.sock = _SockStub()
+            self.sent: list[bytes] = []
+            self.lines = [b"+ idling\r\n", b"* 12 EXISTS\r\n", b"* 1 RECENT\r\n", b"A001 OK IDLE terminated\r\n"]
+
+        def _new_tag(self) -> bytes:
+            return b"A001"
+
+        def send(self, data: bytes) -> None:
+            self.sent.append(data)
+
+        def readline(self) -> bytes:
+            return self.lines.pop(0)
+
+    connector = ImapConnector(host="imap.example.com", username="alice", password="secret", timeout_sec=20.0)
+    client = _ClientStub()
+    session = ImapSession(connector=connector, client=client)
+
+    assert session.wait_for_changes(timeout_sec=300) is True
+    assert client.sent == [b"A001 IDLE\r\n", b"DONE\r\n"]
+    assert 299 < client.sock.timeouts[0] <= 300
+    assert client.sock.timeouts[-1] == 20.0
+    assert client.lines == []
+
+
+def test_imap_session_idle_treats_keepalives_as_idle_and_replaces_timed_out_reader() -> None:
+    class _FileStub:
+        def __init__(self, lines: list[bytes]) -> None:
+            self.lines = lines
+            self.closed = False
+
+        def readline(self) -> bytes:
+            if not self.lines:
+                raise TimeoutError
+            return self.lines.pop(0)
+
+        def close(self) -> None:
+            self.closed = True
+
+    class _SockStub:
+        def __init__(self, reply_lines: list[bytes]) -> None:
+            self.reply_lines = reply_lines
+
+        def settimeout(self, value: float) -> None:
+            pass
+
+        def makefile(self, mode: str) -> _FileStub:
+            return _FileStub(self.reply_lines)
+
+    class _ClientStub:
+        capabilities = ("IMAP4REV1", "IDLE")
+
+        def __init__(self) -> None:
+            self.sock = _SockStub([b"A001 OK IDLE terminated\r\n"])
+            self.file = _FileStub([b"+ idling\r\n", b"* OK Still here\r\n"])
+            self.sent: list[bytes] = []
+
+        def _new_tag(self) -> bytes:
+            return b"A001"
+
+        def send(self, data: bytes) -> None:
+            self.sent.append(data)
+
+        def readline(self) -> bytes:
+            return self.file.readline()
+
+    connector = ImapConnector(host="imap.example.com", username="alice", password="secret", timeout_sec=20.0)
+    client = _ClientStub()
+    timed_out_file = client.file
+    session = ImapSession(connector=connector, client=client)
+
+    assert session.wait_for_changes(timeout_sec=300) is False
+    assert client.sent == [b"A001 IDLE\r\n", b"DONE\r\n"]
+    assert timed_out_file.closed
+    assert client.file is not timed_out_file
+    assert client.file.lines == []
+
+
+def test_imap_session_idle_uses_imaplib_idle_when_available() -> None:
+    class _IdlerStub:
+        def __init__(self, responses: list[tuple[str, list[bytes]]]) -> None:
+            self.responses = responses
+            self.exited = False
+
+        def __enter__(self) -> _IdlerStub:
+            return self
+
+        def __exit__(self, *exc_info: object) -> None:
+            self.exited = True
+
+        def __iter__(self):
+            return iter(self.responses)
+
+    class _ClientStub:
+        capabilities = ("IMAP4REV1", "IDLE")
+
+        def __init__(self, responses: list[tuple[str, list[bytes]]]) -> None:
+            self.idler = _IdlerStub(responses)
+            self.durations: list[float] = []
+
+        def idle(self, duration: float) -> _IdlerStub:
+            self.durations.append(duration)
+            return self.idler
+
+    connector = ImapConnector(host="imap.example.com", username="alice", password="secret")
+    keepalive_only = _ClientStub([("OK", [b"Still here"])])
+    assert ImapSession(connector=connector, client=keepalive_only).wait_for_changes(timeout_sec=60) is False
+    assert keepalive_only.durations == [60]
+    assert keepalive_only.idler.exited
+
+    new_mail = _ClientStub([("OK", [b"Still here"]), ("EXISTS", [b"12"])])
+    assert ImapSession(connector=connector, client=new_mail).wait_for_changes(timeout_sec=60) is True
+    assert new_mail.idler.exited
+
+
+def test_watch_mailbox_syncs_on_changes_and_reconnects(tmp_path) -> None:
+    engine = _create_engine(tmp_path)
+
+    class _WatchSession:
+        def __init__(self, owner) -> None:
+            self.owner = owner
+
+        def fetch_headers(self, *, mailbox, cursor_uidvalidity, cursor_uidnext, received_since=None):
+            self.owner.fetches += 1
+            uid = self.owner.fetches
+            return MailSyncBatch(
+                messages=[RemoteEmailHeader(external_id=f"<m{uid}@example.com>", mailbox_uid=uid)],
+                uidvalidity=7,
+                uidnext=uid + 1,
+            )
+
+        def wait_for_changes(self, *, timeout_sec: float) -> bool:
+            self.owner.idles += 1
+            if self.owner.idles == 1:
+                raise MailConnectorError("IMAP endpoint is unreachable.")
+            return self.owner.idles != 2
+
+    class _WatchConnector:
+        def __init__(self) -> None:
+            self.opened = 0
+            self.fetches = 0
+            self.idles = 0
+
+        @contextmanager
+        def open_session(self, mailbox: str):
+            self.opened += 1
+            yield _WatchSession(self)
+
+    connector = _WatchConnector()
+    delays: list[float] = []
+    results = []
+    with Session(engine) as session:
+        completed = watch_mailbox(
+            session,
+            connector=connector,
+            mailbox="INBOX",
+            max_syncs=3,
+            backoff_sec=2,
+            on_result=results.append,
+            sleep_fn=delays.append,
+        )
+        stored = session.exec(select(Email).order_by(Email.mailbox_uid)).all()
+        state = session.exec(select(SyncState).where(SyncState.source == IMAP_SOURCE)).one()
+
+    assert completed == 3
+    assert connector.opened == 2
+    assert delays == [2.0]
+    assert connector.idles == 3
+    assert [row.external_id for row in stored] == ["<m1@example.com>", "<m2@example.com>", "<m3@example.com>"]
+    assert [result.cursor for result in results] == ["7:2", "7:3", "7:4"]
+    assert state.cursor == "7:4"
+
+
+def test_imap_connector_fetches_changed_flags_and_vanished_uids_with_qresync(monkeypatch) -> None:
+    monkeypatch.setenv("EXECAS_IMAP_HOST", "imap.example.com")
+    monkeypatch.setenv("EXECAS_IMAP_USERNAME", "alice")
+    monkeypatch.setenv("EXECAS_IMAP_PASSWORD", "secret")
+    connector = ImapConnector.from_env()
+
+    calls: list[tuple] = []
+
+    class _ImapStub:
+        capabilities = ("IMAP4REV1", "CONDSTORE", "QRESYNC")
+
+        def __init__(self, host: str, port: int, timeout: float):
+            del host, port, timeout
+
+        def login(self, username: str, password: str):
+            return "OK", [b"Logged in"]
+
+        def enable(self, capability: str):
+            calls.append(("ENABLE", capability))
+            return "OK", [b"QRESYNC"]
+
+        def select(self, mailbox: str, readonly: bool = False):
+            return "OK", [b"1"]
+
+        def status(self, mailbox: str, criteria: str):
+            calls.append(("STATUS", criteria))
+            return "OK", [b"INBOX (UIDVALIDITY 555 UIDNEXT 103 HIGHESTMODSEQ 900)"]
+
+        def uid(self, command: str, *args):
+            calls.append((command, *args))
+            if command == "SEARCH":
+                return "OK", [b""]
+            if command == "FETCH":
+                return (
+                    "OK",
+                    [
+                        b"5 (UID 42 MODSEQ (890) FLAGS (\\Seen \\Flagged))",
+                        b"7 (UID 43 MODSEQ (895) FLAGS ())",
+                    ],
+                )
+            raise AssertionError(command)
+
+        def response(self, code: str):
+            assert code == "VANISHED"
+            return code, [b"(EARLIER) 40,44:45"]
+
+        def logout(self):
+            return "BYE", [b"Logged out"]
+
+    monkeypatch.setattr("executive_cli.connectors.imap.imaplib.IMAP4_SSL", _ImapStub)
+
+    batch = connector.fetch_headers(
+        mailbox="INBOX",
+        cursor_uidvalidity=555,
+        cursor_uidnext=101,
+        cursor_modseq=800,
+    )
+
+    assert ("ENABLE", "QRESYNC") in calls
+    assert ("STATUS", "(UIDVALIDITY UIDNEXT HIGHESTMODSEQ)") in calls
+    fetch_calls = [call for call in calls if call[0] == "FETCH"]
+    assert len(fetch_calls) == 1
+    fetch_call = fetch_calls[0]
+    assert fetch_call[1:] == ("1:100", "(UID FLAGS)", "(CHANGEDSINCE 800 VANISHED)")
+    assert batch.highestmodseq == 900
+    assert batch.messages == []
+    assert batch.flag_updates == ((42, ("\\Flagged", "\\Seen")), (43, ()))
+    assert batch.vanished_uids == (40, 44, 45)
+
+
+def test_sync_mailbox_tracks_modseq_cursor_and_marks_vanished_rows(tmp_path) -> None:
+    engine = _create_engine(tmp_path)
+
+    class _ModseqConnector:
+        def __init__(self) -> None:
+            self.cursor_modseqs: list[int | None] = []
+            self.batches = [
+                MailSyncBatch(
+                    messages=[
+                        RemoteEmailHeader(external_id="<a@example.com>", mailbox_uid=10),
+                        RemoteEmailHeader(external_id="<b@example.com>", mailbox_uid=11),
+                    ],
+                    uidvalidity=9,
+                    uidnext=12,
+                    highestmodseq=500,
+                ),
+                MailSyncBatch(
+                    messages=[],
+                    uidvalidity=9,
+                    uidnext=12,
+                    highestmodseq=510,
+                    vanished_uids=(11,),
+                    flag_updates=((10, ("\\Seen",)),),
+                ),
+            ]
+
+        def fetch_headers(self, *, mailbox, cursor_uidvalidity, cursor_uidnext, received_since=None, cursor_modseq=None):
+            self.cursor_modseqs.append(cursor_modseq)
+            return self.batches.pop(0)
+
+    connector = _ModseqConnector()
+    with Session(engine) as session:
+        first = sync_mailbox(session, connector=connector, mailbox="INBOX")
+        second = sync_mailbox(session, connector=connector, mailbox="INBOX")
+        rows = {row.external_id: row for row in session.exec(select(Email)).all()}
+
+    assert connector.cursor_modseqs == [None, 500]
+    assert (first.cursor, first.cursor_kind) == ("9:12:500", "uidvalidity_uidnext_modseq")
+    assert (second.updated, second.expunged, second.cursor) == (1, 1, "9:12:510")
+    assert rows["<a@example.com>"].flags_json == '["\\\\Seen"]'
+    assert rows["<a@example.com>"].mailbox == "INBOX"
+    assert rows["<a@example.com>"].expunged_at is None
+    assert rows["<b@example.com>"].expunged_at is not None
+
+
+def test_sync_mailbox_expunges_only_when_no_mailbox_still_holds_message(tmp_path) -> None:
+    engine = _create_engine(tmp_path)
+
+    def _sync(session, mailbox: str, *, uid: int | None = None, vanished: tuple[int, ...] = ()):
+        messages = [] if uid is None else [RemoteEmailHeader(external_id="<shared@example.com>", mailbox_uid=uid)]
+        batch = MailSyncBatch(messages=messages, uidvalidity=1, uidnext=100, vanished_uids=vanished)
+        return sync_mailbox(session, connector=FakeConnector(batch), mailbox=mailbox)
+
+    with Session(engine) as session:
+        _sync(session, "INBOX", uid=5)
+        _sync(session, "Archive", uid=9)
+
+        result = _sync(session, "Archive", vanished=(9,))
+        row = session.exec(select(Email)).one()
+        assert result.expunged == 0
+        assert (row.mailbox, row.mailbox_uid, row.expunged_at) == ("INBOX", 5, None)
+
+        result = _sync(session, "INBOX", vanished=(5,))
+        session.refresh(row)
+        assert result.expunged == 1
+        assert row.expunged_at is not None
+        assert session.exec(select(EmailLocation)).all() == []
+
+
+def test_sync_mailboxes_shares_sessions_and_tracks_scope_per_mailbox(tmp_path) -> None:
+    engine = _create_engine(tmp_path)
+    batches = {
+        "INBOX": MailSyncBatch(
+            messages=[RemoteEmailHeader(external_id="<in@example.com>", mailbox_uid=5)],
+            uidvalidity=1,
+            uidnext=6,
+        ),
+        "Archive": MailSyncBatch(
+            messages=[RemoteEmailHeader(external_id="<ar@example.com>", mailbox_uid=8)],
+            uidvalidity=2,
+            uidnext=9,
+        ),
+        "Sent": MailSyncBatch(messages=[], uidvalidity=3, uidnext=1),
+    }
+
+    class _PooledSession:
+        def __init__(self, owner) -> None:
+            self.owner = owner
+
+        def fetch_headers(self, *, mailbox, cursor_uidvalidity, cursor_uidnext, received_since=None):
+            self.owner.fetched.append(mailbox)
+            if mailbox == "Sent":
+                raise MailConnectorError("IMAP fetch request failed.")
+            return batches[mailbox]
+
+    class _PoolConnector:
+        max_sessions = 2
+
+        def __init__(self) -> None:
+            self.logins = 0
+            self.logouts = 0
+            self.fetched: list[str] = []
+
+        @contextmanager
+        def open_session(self, mailbox: str):
+            self.logins += 1
+            try:
+                yield _PooledSession(self)
+            finally:
+                self.logouts += 1
+
+    connector = _PoolConnector()
+    with Session(engine) as session:
+        with pytest.raises(MailConnectorError):
+            sync_mailboxes(session, connector=connector, mailboxes=["INBOX", "Archive", "Sent", "INBOX"])
+        stored = {row.external_id: row.mailbox for row in session.exec(select(Email)).all()}
+        cursors = {state.scope: state.cursor for state in session.exec(select(SyncState)).all()}
+
+    assert sorted(connector.fetched) == ["Archive", "INBOX", "Sent"]
+    assert 1 <= connector.logins <= 3
+    assert connector.logouts == connector.logins
+    assert stored == {"<in@example.com>": "INBOX", "<ar@example.com>": "Archive"}
+    assert cursors == {"INBOX": "1:6", "Archive": "2:9"}
+
+
+def test_mail_sync_command_accepts_repeated_mailbox_option(tmp_path, monkeypatch) -> None:
+    db_path = tmp_path / "mail_cli_multi.sqlite"
+    monkeypatch.setenv("EXECAS_DB_PATH", str(db_path))
+    runner = CliRunner()
+    assert runner.invoke(app, ["init"]).exit_code == 0
+
+    monkeypatch.setattr("executive_cli.connectors.imap.ImapConnector.from_env", classmethod(lambda cls: object()))
+    captured: dict[str, list[str]] = {}
+
+    def _sync_mailboxes_stub(session, *, connector, mailboxes, received_since=None):
+        captured["mailboxes"] = list(mailboxes)
+        result = type(
+            "Result",
+            (),
+            {"inserted": 1, "updated": 0, "expunged": 0, "cursor_kind": "uidvalidity_uidnext", "cursor": "1:2"},
+        )()
+        return {mailbox: result for mailbox in mailboxes}
+
+    monkeypatch.setattr("executive_cli.commands.mail.sync_mailboxes", _sync_mailboxes_stub)
+
+    result = runner.invoke(app, ["mail", "sync", "--mailbox", "INBOX", "--mailbox", "Archive"])
+    assert result.exit_code == 0
+    assert captured["mailboxes"] == ["INBOX", "Archive"]
+    assert "mailbox=Archive inserted=1" in result.output
@@ -1,10 +1,22 @@
-from datetime import date, datetime
+import itertools
+import random
+from datetime import date, datetime, timedelta, timezone
 
 from sqlmodel import Session, SQLModel, create_engine, select
 
+from executive_cli.config import upsert_setting
 from executive_cli.db import DEFAULT_SETTINGS, PRIMARY_CALENDAR_NAME, PRIMARY_CALENDAR_SLUG
+from executive_cli.focus_packing import PackingItem, pack_items
 from executive_cli.models import BusyBlock, Calendar, DayPlan, Settings, Task, TaskPriority, TaskStatus, TimeBlock
-from executive_cli.planner import build_and_persist_day_plan
+from executive_cli.planner import (
+    ScheduledBlock,
+    TimeBlockChanges,
+    _apply_buffer_to_gap,
+    _GapIndex,
+    _OccupancyMap,
+    build_and_persist_day_plan,
+    build_and_persist_week_plan,
+)
 from executive_cli.timeutil import MOSCOW_TZ, dt_to_db
 
 
@@ -104,6 +116,182 @@ def test_day_plan_is_deterministic_and_replaces_existing(tmp_path) -> None:
     assert len(blocks) == len(second_result.blocks)
 
 
+def test_replan_rewrites_only_changed_time_blocks(tmp_path) -> None:
+    engine = _create_engine(tmp_path)
+    plan_date = date(2026, 2, 20)
+
+    with Session(engine) as session:
+        _seed_defaults(session)
+        calendar = session.exec(select(Calendar).where(Calendar.slug == PRIMARY_CALENDAR_SLUG)).first()
+        assert calendar is not None
+        session.add(
+            BusyBlock(
+                calendar_id=calendar.id,
+                start_dt=dt_to_db(datetime(2026, 2, 20, 16, 0, tzinfo=MOSCOW_TZ)),
+                end_dt=dt_to_db(datetime(2026, 2, 20, 17, 0, tzinfo=MOSCOW_TZ)),
+                title="Late sync",
+            )
+        )
+        session.add(Task(title="Task A", status=TaskStatus.NOW, priority=TaskPriority.P1, estimate_min=60))
+        session.commit()
+
+    with Session(engine) as session:
+        first = build_and_persist_day_plan(session, plan_date=plan_date, variant="realistic")
+        plan_id = session.exec(select(DayPlan.id)).one()
+        ids_before = {
+            (row.start_dt, row.type): row.id for row in session.exec(select(TimeBlock)).all()
+        }
+    assert first.changes == TimeBlockChanges(inserted=len(first.blocks))
+
+    with Session(engine) as session:
+        unchanged = build_and_persist_day_plan(session, plan_date=plan_date, variant="realistic")
+    assert unchanged.changes == TimeBlockChanges(unchanged=len(unchanged.blocks))
+
+    with Session(engine) as session:
+        busy = session.exec(select(BusyBlock)).one()
+        busy.start_dt = dt_to_db(datetime(2026, 2, 20, 17, 0, tzinfo=MOSCOW_TZ))
+        busy.end_dt = dt_to_db(datetime(2026, 2, 20, 18, 0, tzinfo=MOSCOW_TZ))
+        session.add(busy)
+        session.commit()
+        moved = build_and_persist_day_plan(session, plan_date=plan_date, variant="realistic")
+        rows = session.exec(select(TimeBlock)).all()
+        assert session.exec(select(DayPlan.id)).all() == [plan_id]
+
+    assert moved.changes.inserted + moved.changes.updated > 0
+    assert 0 < moved.changes.unchanged < len(moved.blocks)
+    assert len(rows) == len(moved.blocks)
+    focus_before = {key: row_id for key, row_id in ids_before.items() if key[1] == "focus"}
+    assert focus_before
+    kept = [row for row in rows if (row.start_dt, row.type) in focus_before]
+    assert kept
+    assert all(row.id == focus_before[(row.start_dt, row.type)] for row in kept)
+
+
+def test_week_plan_carries_unscheduled_tasks_forward(tmp_path) -> None:
+    engine = _create_engine(tmp_path)
+    start_date = date(2026, 2, 16)
+
+    with Session(engine) as session:
+        _seed_defaults(session)
+        calendar = session.exec(select(Calendar).where(Calendar.slug == PRIMARY_CALENDAR_SLUG)).first()
+        assert calendar is not None
+        # Monday is busy until the evening, so only the first task fits that day.
+        session.add(
+            BusyBlock(
+                calendar_id=calendar.id,
+                start_dt=dt_to_db(datetime(2026, 2, 16, 10, 0, tzinfo=MOSCOW_TZ)),
+                end_dt=dt_to_db(datetime(2026, 2, 16, 17, 0, tzinfo=MOSCOW_TZ)),
+                title="Offsite",
+            )
+        )
+        session.add(
+            BusyBlock(
+                calendar_id=calendar.id,
+                start_dt=dt_to_db(datetime(2026, 2, 17, 23, 0, tzinfo=MOSCOW_TZ)),
+                end_dt=dt_to_db(datetime(2026, 2, 18, 11, 0, tzinfo=MOSCOW_TZ)),
+                title="Overnight travel",
+            )
+        )
+        session.add(Task(title="Task A", status=TaskStatus.NOW, priority=TaskPriority.P1, estimate_min=60))
+        session.add(Task(title="Task B", status=TaskStatus.NOW, priority=TaskPriority.P2, estimate_min=240))
+        session.commit()
+
+    with Session(engine) as session:
+        week = build_and_persist_week_plan(session, start_date=start_date, variant="realistic", days=3)
+        plans = session.exec(select(DayPlan).order_by(DayPlan.date)).all()
+        block_count = len(session.exec(select(TimeBlock)).all())
+
+    assert [result.plan_date for result in week] == [date(2026, 2, 16), date(2026, 2, 17), date(2026, 2, 18)]
+    assert [plan.date for plan in plans] == [result.plan_date for result in week]
+    assert block_count == sum(len(result.blocks) for result in week)
+    assert [[task.title for task in result.selected_tasks] for result in week] == [["Task A"], ["Task B"], []]
+    assert [task.title for task in week[0].didnt_fit_tasks] == ["Task B"]
+    assert all(result.no_now_hint_text is None for result in week)
+
+    # Once every task is placed, a later day is laid out exactly as plan day lays out a
+    # day without tasks, overnight busy block included.
+    with Session(engine) as session:
+        for task in session.exec(select(Task)).all():
+            task.status = TaskStatus.DONE
+            session.add(task)
+        session.commit()
+        single = build_and_persist_day_plan(session, plan_date=date(2026, 2, 18), variant="realistic")
+    assert _signature(single) == _signature(week[2])
+    assert single.changes == TimeBlockChanges(unchanged=len(single.blocks))
+
+
+def test_optimal_engine_packs_tasks_greedy_first_fit_fragments(tmp_path) -> None:
+    engine = _create_engine(tmp_path)
+    plan_date = date(2026, 2, 20)
+
+    with Session(engine) as session:
+        _seed_defaults(session)
+        upsert_setting(session, key="lunch_duration_min", value="0")
+        upsert_setting(session, key="buffer_min", value="0")
+        calendar = session.exec(select(Calendar).where(Calendar.slug == PRIMARY_CALENDAR_SLUG)).first()
+        assert calendar is not None
+        # Free: 07:00-08:30 (90m) then 09:30-10:30 (60m).
+        session.add(
+            BusyBlock(
+                calendar_id=calendar.id,
+                start_dt=dt_to_db(datetime(2026, 2, 20, 8, 30, tzinfo=MOSCOW_TZ)),
+                end_dt=dt_to_db(datetime(2026, 2, 20, 9, 30, tzinfo=MOSCOW_TZ)),
+                title="Standup",
+            )
+        )
+        session.add(
+            BusyBlock(
+                calendar_id=calendar.id,
+                start_dt=dt_to_db(datetime(2026, 2, 20, 10, 30, tzinfo=MOSCOW_TZ)),
+                end_dt=dt_to_db(datetime(2026, 2, 20, 19, 0, tzinfo=MOSCOW_TZ)),
+                title="Offsite",
+            )
+        )
+        session.add(Task(title="Short P1", status=TaskStatus.NOW, priority=TaskPriority.P1, estimate_min=60))
+        session.add(Task(title="Long P2", status=TaskStatus.NOW, priority=TaskPriority.P2, estimate_min=80))
+        session.commit()
+
+    with Session(engine) as session:
+        greedy = build_and_persist_day_plan(session, plan_date=plan_date, variant="aggressive")
+        upsert_setting(session, key="planner_engine", value="optimal")
+        optimal = build_and_persist_day_plan(session, plan_date=plan_date, variant="aggressive")
+
+    assert [task.title for task in greedy.selected_tasks] == ["Short P1"]
+    assert [task.reason for task in greedy.didnt_fit_tasks] == ["no slot >= 80m"]
+    focus = [(block.start_dt.strftime("%H:%M"), block.label) for block in optimal.blocks if block.type == "focus"]
+    assert focus == [("07:00", "Long P2"), ("09:30", "Short P1")]
+    assert [task.title for task in optimal.selected_tasks] == ["Long P2", "Short P1"]
+    assert optimal.didnt_fit_tasks == []
+
+
+def test_pack_items_matches_exhaustive_search() -> None:
+    rng = random.Random(3)
+    for _ in range(200):
+        spacing = rng.choice((0, 5, 10))
+        items = [
+            PackingItem(key=index, minutes=rng.choice((30, 45, 60, 90)), value=rng.randint(1, 50))
+            for index in range(rng.randrange(0, 6))
+        ]
+        bins = [rng.randrange(0, 200) for _ in range(rng.randrange(0, 4))]
+        total_limit = rng.randrange(0, 300)
+
+        best = 0
+        for assignment in itertools.product(range(-1, len(bins)), repeat=len(items)):
+            free = [minutes + spacing for minutes in bins]
+            packed = [item for item, position in zip(items, assignment) if position >= 0]
+            for item, position in zip(items, assignment):
+                if position >= 0:
+                    free[position] -= item.minutes + spacing
+            if min(free, default=0) >= 0 and sum(item.minutes for item in packed) <= total_limit:
+                best = max(best, sum(item.value for item in packed))
+
+        result = pack_items(
+            items, bins, spacing=spacing, total_limit=total_limit, lower_bound=0, time_budget_s=5.0
+        )
+        assert (result.value if result is not None else 0) == best
+        assert result is None or result.proven_optimal
+
+
 def test_lunch_picks_earlier_slot_on_equal_distance(tmp_path) -> None:
     engine = _create_engine(tmp_path)
     plan_date = date(2026, 2, 20)
@@ -236,3 +424,96 @@ def test_plan_ignores_soft_deleted_busy_blocks(tmp_path) -> None:
     busy_labels = [block.label for block in result.blocks if block.type == "busy"]
     assert "Active meeting" in busy_labels
     assert not any("Deleted remote meeting" in label for label in busy_labels)
+
+
+def test_busy_blocks_are_widened_to_whole_minutes(tmp_path) -> None:
+    engine = _create_engine(tmp_path)
+    plan_date = date(2026, 2, 20)
+
+    with Session(engine) as session:
+        _seed_defaults(session)
+        calendar = session.exec(select(Calendar).where(Calendar.slug == PRIMARY_CALENDAR_SLUG)).first()
+        assert calendar is not None
+        # Sub-minute edges; widened, the two meetings touch and become one busy block.
+        for title, start, end in (
+            ("Call", (9, 0, 30), (9, 59, 10)),
+            ("Review", (9, 59, 40), (10, 30, 0)),
+        ):
+            session.add(
+                BusyBlock(
+                    calendar_id=calendar.id,
+                    start_dt=dt_to_db(datetime(2026, 2, 20, *start, tzinfo=MOSCOW_TZ)),
+                    end_dt=dt_to_db(datetime(2026, 2, 20, *end, tzinfo=MOSCOW_TZ)),
+                    title=title,
+                )
+            )
+        session.commit()
+
+    with Session(engine) as session:
+        result = build_and_persist_day_plan(session, plan_date=plan_date, variant="minimal")
+
+    busy = [(block.start_dt, block.end_dt, block.label) for block in result.blocks if block.type == "busy"]
+    assert busy == [
+        (
+            datetime(2026, 2, 20, 9, 0, tzinfo=MOSCOW_TZ),
+            datetime(2026, 2, 20, 10, 30, tzinfo=MOSCOW_TZ),
+            "Call | Review",
+        )
+    ]
+    assert all(block.start_dt.second == 0 and block.end_dt.second == 0 for block in result.blocks)
+
+
+def test_gap_index_matches_rescanning_occupancy_after_every_placement() -> None:
+    rng = random.Random(7)
+    window_start = datetime(2026, 2, 20, 8, 0, tzinfo=timezone.utc)
+    window_end = window_start + timedelta(hours=12)
+
+    def occupancy_of(blocks: list[ScheduledBlock]) -> _OccupancyMap:
+        occupancy = _OccupancyMap(window_start, window_end)
+        for block in blocks:
+            occupancy.mark(block)
+        return occupancy
+
+    for _ in range(50):
+        buffer_min = rng.choice((0, 5, 10))
+        occupied: list[ScheduledBlock] = []
+        for _ in range(rng.randrange(0, 12)):
+            start = window_start + timedelta(minutes=rng.randrange(-60, 12 * 60))
+            end = start + timedelta(minutes=rng.choice((15, 30, 60, 90)))
+            occupied.append(ScheduledBlock(start_dt=start, end_dt=end, type="busy", label="Busy", task_id=None))
+
+        occupancy = occupancy_of(occupied)
+        free = [
+            minute
+            for minute in range(12 * 60)
+            if not any(
+                block.start_dt <= window_start + timedelta(minutes=minute) < block.end_dt for block in occupied
+            )
+        ]
+        assert occupancy.free_minutes() == len(free)
+        assert [minute for gap in occupancy.gaps() for minute in range(gap.start, gap.end)] == free
+
+        gap_index = _GapIndex(occupancy.gaps(), buffer_min=buffer_min)
+        for _ in range(20):
+            duration_min = rng.choice((15, 30, 45, 60, 120))
+            expected = None
+            for gap in occupancy_of(occupied).gaps():
+                usable_start, usable_end = _apply_buffer_to_gap(gap, buffer_min)
+                if usable_end - usable_start >= duration_min:
+                    expected = (usable_start, usable_start + duration_min)
+                    break
+
+            slot = gap_index.find_first_fit(duration_min)
+            assert (slot[1:] if slot is not None else None) == expected
+            if slot is None:
+                continue
+            gap_index.reserve(slot[0], slot[2])
+            occupied.append(
+                ScheduledBlock(
+                    start_dt=occupancy.to_datetime(slot[1]),
+                    end_dt=occupancy.to_datetime(slot[2]),
+                    type="focus",
+                    label="Focus",
+                    task_id=None,
+                )
+            )
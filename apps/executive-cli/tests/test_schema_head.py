@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import sqlite3
+
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+
+from executive_cli import db
+from executive_cli.db import (
+    PROJECT_ROOT,
+    SCHEMA_HEAD_REVISION,
+    initialize_database,
+    read_schema_revision,
+    schema_is_at_head,
+)
+
+
+def _fail_upgrade(*args, **kwargs):
+    raise AssertionError("alembic upgrade should be skipped for a database at head")
+
+
+def test_baked_schema_head_matches_alembic_scripts() -> None:
+    config = Config(str(PROJECT_ROOT / "alembic.ini"))
+    config.set_main_option("script_location", str(PROJECT_ROOT / "alembic"))
+
+    assert ScriptDirectory.from_config(config).get_current_head() == SCHEMA_HEAD_REVISION
+
+
+def test_initialize_database_skips_alembic_when_schema_is_at_head(tmp_path, monkeypatch) -> None:
+    db_path = tmp_path / "execas.sqlite"
+    monkeypatch.setenv("EXECAS_DB_PATH", str(db_path))
+    assert read_schema_revision(db_path) is None
+    assert not db_path.exists()
+
+    initialize_database()
+    assert read_schema_revision(db_path) == SCHEMA_HEAD_REVISION
+
+    monkeypatch.setattr("alembic.command.upgrade", _fail_upgrade)
+    db._schema_at_head.clear()
+    initialize_database()
+    initialize_database()
+
+
+def test_stale_schema_stamp_triggers_upgrade(tmp_path, monkeypatch) -> None:
+    db_path = tmp_path / "execas.sqlite"
+    monkeypatch.setenv("EXECAS_DB_PATH", str(db_path))
+    initialize_database()
+    assert schema_is_at_head(db_path)
+
+    with sqlite3.connect(db_path) as connection:
+        connection.execute("DROP INDEX ix_tasks_status_due_date")
+        connection.execute("DROP INDEX ix_tasks_due_date")
+        connection.execute("DROP INDEX ix_tasks_area_id")
+        connection.execute("DROP INDEX ix_tasks_project_id")
+        connection.execute("DROP INDEX ix_tasks_commitment_created_at")
+        connection.execute("DROP TABLE email_locations")
+        connection.execute("UPDATE alembic_version SET version_num = 'f6d9e2a4b5c7'")
+    assert not schema_is_at_head(db_path)
+
+    initialize_database()
+    assert read_schema_revision(db_path) == SCHEMA_HEAD_REVISION
+    with sqlite3.connect(db_path) as connection:
+        names = {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert "ix_tasks_status_due_date" in names
+    assert "ix_email_locations_mailbox_uid" in names
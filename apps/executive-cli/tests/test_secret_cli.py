@@ -9,14 +9,14 @@ def test_secret_set_caldav_stores_password(monkeypatch) -> None:
     runner = CliRunner()
     captured: dict[str, str] = {}
 
-    monkeypatch.setattr("executive_cli.cli.getpass.getpass", lambda prompt: "secret")
+    monkeypatch.setattr("executive_cli.commands.secret.getpass.getpass", lambda prompt: "secret")
 
     def _store(*, service: str, account: str, password: str) -> None:
         captured["service"] = service
         captured["account"] = account
         captured["password"] = password
 
-    monkeypatch.setattr("executive_cli.cli.store_keychain_password", _store)
+    monkeypatch.setattr("executive_cli.commands.secret.store_keychain_password", _store)
 
     result = runner.invoke(app, ["secret", "set-caldav", "--username", "alice@example.com"])
     assert result.exit_code == 0
@@ -34,7 +34,7 @@ def test_secret_status_reports_presence(monkeypatch) -> None:
         del account
         return service == "execas.caldav.password"
 
-    monkeypatch.setattr("executive_cli.cli.keychain_password_exists", _exists)
+    monkeypatch.setattr("executive_cli.commands.secret.keychain_password_exists", _exists)
 
     result = runner.invoke(app, ["secret", "status"])
     assert result.exit_code == 0
@@ -49,7 +49,7 @@ def test_calendar_sync_cli_does_not_echo_secret_on_connector_error(tmp_path, mon
     def _raise_from_env(cls):
         raise CalendarConnectorError(f"CalDAV authentication failed. password={secret}")
 
-    monkeypatch.setattr("executive_cli.cli.CalDavConnector.from_env", classmethod(_raise_from_env))
+    monkeypatch.setattr("executive_cli.connectors.caldav.CalDavConnector.from_env", classmethod(_raise_from_env))
 
     result = runner.invoke(app, ["calendar", "sync"])
     assert result.exit_code == 1
@@ -67,7 +67,7 @@ def test_mail_sync_cli_does_not_echo_secret_on_connector_error(tmp_path, monkeyp
     def _raise_from_env(cls):
         raise MailConnectorError(f"IMAP authentication failed. password={secret}")
 
-    monkeypatch.setattr("executive_cli.cli.ImapConnector.from_env", classmethod(_raise_from_env))
+    monkeypatch.setattr("executive_cli.connectors.imap.ImapConnector.from_env", classmethod(_raise_from_env))
 
     result = runner.invoke(app, ["mail", "sync"])
     assert result.exit_code == 1
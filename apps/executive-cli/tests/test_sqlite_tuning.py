@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from typer.testing import CliRunner
+
+from executive_cli.cli import app
+from executive_cli.db import SqliteTuning, dispose_engines, get_engine, read_sqlite_pragmas
+
+
+def test_get_engine_applies_tuning_pragmas_on_connect(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("EXECAS_DB_PATH", str(tmp_path / "tuned.sqlite"))
+    monkeypatch.setenv("EXECAS_SQLITE_CACHE_SIZE", "-2048")
+    monkeypatch.setenv("EXECAS_SQLITE_BUSY_TIMEOUT_MS", "1234")
+
+    with get_engine(ensure_directory=True).connect() as connection:
+        pragmas = read_sqlite_pragmas(connection)
+
+    assert pragmas == {
+        "busy_timeout": 1234,
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": 256 * 1024 * 1024,
+        "cache_size": -2048,
+        "temp_store": "MEMORY",
+    }
+
+
+def test_sqlite_tuning_from_env_falls_back_on_invalid_values(monkeypatch) -> None:
+    monkeypatch.setenv("EXECAS_SQLITE_JOURNAL_MODE", "fast")
+    monkeypatch.setenv("EXECAS_SQLITE_SYNCHRONOUS", "full")
+    monkeypatch.setenv("EXECAS_SQLITE_MMAP_SIZE", "-1")
+
+    tuning = SqliteTuning.from_env()
+
+    assert tuning.journal_mode == "WAL"
+    assert tuning.synchronous == "FULL"
+    assert tuning.mmap_size == SqliteTuning().mmap_size
+
+
+def test_db_info_command_reports_effective_pragmas(tmp_path, monkeypatch) -> None:
+    db_path = tmp_path / "info.sqlite"
+    monkeypatch.setenv("EXECAS_DB_PATH", str(db_path))
+    monkeypatch.setenv("EXECAS_SQLITE_JOURNAL_MODE", "delete")
+    runner = CliRunner()
+    assert runner.invoke(app, ["init"]).exit_code == 0
+
+    result = runner.invoke(app, ["db", "info"])
+
+    assert result.exit_code == 0
+    lines = result.output.splitlines()
+    assert f"db_path={db_path}" in lines
+    assert "journal_mode=DELETE" in lines
+    assert "temp_store=MEMORY" in lines
+
+
+def test_get_engine_is_memoized_per_database_url(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("EXECAS_DB_PATH", str(tmp_path / "first.sqlite"))
+    first = get_engine(ensure_directory=True)
+    assert get_engine() is first
+
+    monkeypatch.setenv("EXECAS_DB_PATH", str(tmp_path / "second.sqlite"))
+    second = get_engine()
+    assert second is not first
+
+    dispose_engines()
+    assert get_engine() is not second
@@ -21,7 +21,7 @@ def test_sync_hourly_command_success_exit_zero(tmp_path, monkeypatch) -> None:
             mail=SourceSyncOutcome(source="mail", success=True, attempts=1),
         )
 
-    monkeypatch.setattr("executive_cli.cli.run_hourly_sync", _stub_run_hourly_sync)
+    monkeypatch.setattr("executive_cli.commands.sync.run_hourly_sync", _stub_run_hourly_sync)
 
     result = runner.invoke(app, ["sync", "hourly"])
     assert result.exit_code == 0
@@ -134,8 +134,8 @@ def test_sync_hourly_cli_does_not_echo_secret_on_degraded_failure(tmp_path, monk
     secret = "calendar-secret-ops-01"
     mail_calls = {"count": 0}
 
-    monkeypatch.setattr("executive_cli.cli.CalDavConnector.from_env", classmethod(lambda cls: object()))
-    monkeypatch.setattr("executive_cli.cli.ImapConnector.from_env", classmethod(lambda cls: object()))
+    monkeypatch.setattr("executive_cli.connectors.caldav.CalDavConnector.from_env", classmethod(lambda cls: object()))
+    monkeypatch.setattr("executive_cli.connectors.imap.ImapConnector.from_env", classmethod(lambda cls: object()))
 
     def _calendar_fail(session, *, connector):
         del session, connector
@@ -146,8 +146,8 @@ def test_sync_hourly_cli_does_not_echo_secret_on_degraded_failure(tmp_path, monk
         mail_calls["count"] += 1
         return SimpleNamespace(inserted=0, updated=0, cursor_kind="uidvalidity_uidnext", cursor="1:2")
 
-    monkeypatch.setattr("executive_cli.cli.sync_calendar_primary", _calendar_fail)
-    monkeypatch.setattr("executive_cli.cli.sync_mailbox", _mail_ok)
+    monkeypatch.setattr("executive_cli.commands.sync.sync_calendar_primary", _calendar_fail)
+    monkeypatch.setattr("executive_cli.commands.sync.sync_mailbox", _mail_ok)
 
     result = runner.invoke(app, ["sync", "hourly", "--retries", "0"])
     assert result.exit_code == 2
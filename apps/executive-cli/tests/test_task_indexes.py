@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from datetime import date, datetime, timezone
+
+from sqlalchemy import event
+from sqlmodel import Session
+from typer.testing import CliRunner
+
+from executive_cli.cli import app
+from executive_cli.db import get_engine, initialize_database
+from executive_cli.ingest.dedup import detect_dedup
+from executive_cli.models import Area, Commitment, Project, Task, TaskPriority, TaskStatus
+from executive_cli.planner import _load_candidate_tasks
+from executive_cli.review import generate_weekly_review
+
+
+@contextmanager
+def _capture_task_queries(engine):
+    statements: list[tuple[str, tuple]] = []
+
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if "FROM tasks" in statement and not executemany:
+            statements.append((statement, tuple(parameters or ())))
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _before_cursor_execute)
+
+
+def _plan_details(engine, statement: str, parameters: tuple) -> str:
+    with engine.connect() as connection:
+        rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+    return " | ".join(row[-1] for row in rows)
+
+
+def _seed(engine) -> None:
+    with Session(engine) as session:
+        area = Area(name="Work")
+        session.add(area)
+        session.commit()
+        session.add(Project(name="Launch", area_id=area.id))
+        session.add(
+            Commitment(id="YC-1", title="Ship", metric="m", due_date=date(2026, 3, 31), difficulty="D3")
+        )
+        session.add(
+            Task(
+                title="Prepare deck",
+                status=TaskStatus.NOW,
+                priority=TaskPriority.P1,
+                estimate_min=30,
+                created_at="2026-02-20T09:00:00+00:00",
+                updated_at="2026-02-20T09:00:00+00:00",
+            )
+        )
+        session.commit()
+
+
+def test_task_hot_paths_use_secondary_indexes(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("EXECAS_DB_PATH", str(tmp_path / "tasks.sqlite"))
+    initialize_database()
+    engine = get_engine()
+    _seed(engine)
+
+    expected = {
+        "planner": "ix_tasks_status_due_date",
+        "dedup": "ix_tasks_status_due_date",
+        "review_open": "ix_tasks_status_due_date",
+        "review_commitments": "ix_tasks_commitment_created_at",
+        "list_status": "ix_tasks_status_due_date",
+        "list_area": "ix_tasks_area_id",
+        "list_project": "ix_tasks_project_id",
+        "list_commitment": "ix_tasks_commitment_created_at",
+        "list_due": "ix_tasks_due_date",
+    }
+    captured: dict[str, list[tuple[str, tuple]]] = {}
+
+    with _capture_task_queries(engine) as statements, Session(engine) as session:
+        _load_candidate_tasks(session)
+        captured["planner"] = list(statements)
+        statements.clear()
+
+        detect_dedup(session, candidate_title="new", source_document_id=None, source_email_id=None)
+        captured["dedup"] = statements[:1]
+        statements.clear()
+
+        generate_weekly_review(session, week="2026-W09", now=datetime(2026, 2, 25, tzinfo=timezone.utc))
+        captured["review_open"] = statements[:1]
+        captured["review_commitments"] = [item for item in statements if "commitment_id IN" in item[0]]
+        statements.clear()
+
+    runner = CliRunner()
+    cli_filters = {
+        "list_status": ["--status", "NOW"],
+        "list_area": ["--area", "Work"],
+        "list_project": ["--project", "Launch"],
+        "list_commitment": ["--commitment", "YC-1"],
+        "list_due": ["--due", "2026-03-01"],
+    }
+    for label, options in cli_filters.items():
+        with _capture_task_queries(engine) as statements:
+            result = runner.invoke(app, ["task", "list", *options])
+        assert result.exit_code == 0, result.output
+        captured[label] = list(statements)
+
+    for label, index_name in expected.items():
+        assert len(captured[label]) == 1, label
+        details = _plan_details(engine, *captured[label][0])
+        assert index_name in details, f"{label}: {details}"
+        assert "SCAN tasks" not in details, f"{label}: {details}"